@@ -20,6 +20,9 @@ class Account(object):
             )
         self.address = address.pubKeyToAddr(self.publicKey)
         self.signType = signType
+        # 签名和验签用的密钥对象，第一次使用时创建，之后复用
+        self.signingKey = None
+        self.verifyingKey = None
 
     def Address(self) -> str:
         return self.address
@@ -33,6 +36,63 @@ class Account(object):
     def PublicKey(self) -> str:
         return self.publicKey
 
+    def SigningKey(self):
+        """
+        SigningKey 签名用的密钥对象
+        :return: secp256k1为ecdsa.SigningKey，ed25519为ed25519.SigningKey，sm2为sm2.SM2Util
+        """
+        if self.signingKey is None:
+            if self.signType == signer.SECP256K1:
+                self.signingKey = signer.signingKey(self.privateKey)
+            elif self.signType == signer.SM2:
+                self.signingKey = sm2.SM2Util()
+            else:
+                self.signingKey = ed25519Signer.signingKey(self.privateKey)
+        return self.signingKey
+
+    def VerifyingKey(self):
+        """
+        VerifyingKey 验签用的密钥对象，secp256k1的公钥启用了预计算，适合反复验证本账户的签名
+        :return: secp256k1为ecdsa.VerifyingKey，ed25519为ed25519.VerifyingKey，sm2为sm2.SM2Util
+        """
+        if self.verifyingKey is None:
+            if self.signType == signer.SECP256K1:
+                key = self.SigningKey().get_verifying_key()
+                key.precompute()
+                self.verifyingKey = key
+            elif self.signType == signer.SM2:
+                self.verifyingKey = self.SigningKey()
+            else:
+                self.verifyingKey = self.SigningKey().get_verifying_key()
+        return self.verifyingKey
+
+    def Sign(self, data: bytes) -> bytes:
+        """
+        Sign 签名
+        :param data: 待签名数据
+        :return: 签名
+        """
+        key = self.SigningKey()
+        if self.signType == signer.SECP256K1:
+            return signer.signWithKey(data, key)
+        elif self.signType == signer.SM2:
+            return bytes.fromhex(key.sign(data, self.privateKey, '0', self.publicKey))
+        return key.sign(data)
+
+    def Verify(self, data: bytes, signature: bytes) -> bool:
+        """
+        Verify 验证本账户的签名
+        :param data: 签名数据
+        :param signature: 签名
+        :return: bool
+        """
+        key = self.VerifyingKey()
+        if self.signType == signer.SECP256K1:
+            return signer.verifyWithKey(data, signature, key)
+        elif self.signType == signer.SM2:
+            return key.verify(data, self.publicKey, signature.hex(), '0')
+        return ed25519Signer.verifyWithKey(data, signature, key)
+
 
 # 生成随机账户
 def newAccount(signType=signer.SECP256K1):
@@ -1,3 +1,5 @@
+import functools
+
 from ed25519 import (create_keypair, SigningKey, VerifyingKey)
 
 
@@ -11,15 +13,27 @@ def publicKeyFromPrivate(priv: str) -> str:
     return SigningKey(skByte).get_verifying_key().to_bytes().hex()
 
 
+# 验签公钥缓存的大小，ed25519的公钥对象只保存32字节，不需要也不支持预计算
+DefaultKeyCacheSize = 1024
+
+
+def signingKey(priv: str) -> SigningKey:
+    return SigningKey(bytes.fromhex(priv))
+
+
 def sign(msg: bytes, priv: str) -> bytes:
-    skByte = bytes.fromhex(priv)
-    skSigning = SigningKey(skByte)
+    return signingKey(priv).sign(msg)
 
-    return skSigning.sign(msg)
 
+@functools.lru_cache(maxsize=DefaultKeyCacheSize)
+def verifyingKey(pub: bytes) -> VerifyingKey:
+    return VerifyingKey(pub)
 
-def verify(msg: bytes, sig: bytes, pub: str) -> bool:
-    vkByte = bytes.fromhex(pub)
 
-    VerifyingKey(vkByte).verify(sig=sig, msg=msg)
+def verifyWithKey(msg: bytes, sig: bytes, key: VerifyingKey) -> bool:
+    key.verify(sig=sig, msg=msg)
     return True
+
+
+def verify(msg: bytes, sig: bytes, pub: str) -> bool:
+    return verifyWithKey(msg, sig, verifyingKey(bytes.fromhex(pub)))
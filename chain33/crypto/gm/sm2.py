@@ -181,8 +181,11 @@ class SM2Util(object):
         return self.verify_with_e(sign, pub, bytes.fromhex(e))
 
     # 消息签名
-    def sign(self, data, priv, uid):
-        e = self.get_e(data.hex(), self.pubKeyFromPrivate(priv), uid)
+    # pub为私钥对应的公钥，已知时传入以省去一次点乘
+    def sign(self, data, priv, uid, pub=None):
+        if pub is None:
+            pub = self.pubKeyFromPrivate(priv)
+        e = self.get_e(data.hex(), pub, uid)
         k = random_hex(self.para_len)
         return self.sign_with_e(bytes.fromhex(e), priv, k)
 
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+
+import collections
+import hashlib
+import struct
+import threading
+
+# 默认内存中缓存的验签结果数
+DefaultMaxSize = 100000
+
+
+def Key(data: bytes, ty: int, pubkey: bytes, signature: bytes) -> bytes:
+    """
+    Key 验签结果的缓存key，由签名数据的哈希、签名类型、公钥和签名确定，验签结果只取决于这四项
+    :param data: 清空签名后的交易序列化数据
+    :param ty: signature.ty
+    :param pubkey: 公钥
+    :param signature: 签名
+    :return: 32字节的key
+    """
+    sha256 = hashlib.sha256()
+    sha256.update(hashlib.sha256(data).digest())
+    sha256.update(struct.pack("<iH", ty, len(pubkey)))
+    sha256.update(pubkey)
+    sha256.update(signature)
+    return sha256.digest()
+
+
+# SigCache 验签结果缓存，区块重新获取或者推送重复时不再重复验签
+# 内存中为有大小限制的LRU，指定disk时同时写入持久化存储，重启后仍然有效
+class SigCache(object):
+    def __init__(self, maxSize: int = DefaultMaxSize, disk=None):
+        """
+        :param maxSize: 内存中的最大条目数，超过时淘汰最久未使用的条目
+        :param disk: 持久化存储，需要提供GetSig(key)和PutSig(key, valid)，比如chain33.rpc.diskcache.DiskCache，
+                     None表示不持久化，持久化的条目数和淘汰由存储自己控制
+        """
+        self.maxSize = maxSize
+        self.disk = disk
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.diskHits = 0
+        self.misses = 0
+
+    def remember(self, key: bytes, valid: bool):
+        self.entries[key] = valid
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+    def Get(self, key: bytes):
+        """
+        Get 查询验签结果
+        :param key: Key返回的key
+        :return: True或False，未缓存时返回None
+        """
+        with self.lock:
+            valid = self.entries.get(key)
+            if valid is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return valid
+        valid = self.disk.GetSig(key) if self.disk is not None else None
+        with self.lock:
+            if valid is None:
+                self.misses += 1
+                return None
+            self.diskHits += 1
+            self.remember(key, valid)
+        return valid
+
+    def Put(self, key: bytes, valid: bool):
+        """
+        Put 缓存验签结果
+        :param key: Key返回的key
+        :param valid: 验签结果
+        """
+        with self.lock:
+            self.remember(key, valid)
+        if self.disk is not None:
+            self.disk.PutSig(key, valid)
+
+    def Clear(self):
+        """
+        Clear 清空内存中的条目，持久化的条目由存储自己淘汰
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def Stats(self) -> dict:
+        """
+        Stats 当前进程的命中统计
+        :return: size: 内存中的条目数, hits: 内存命中数, diskHits: 持久化缓存命中数, misses: 未命中数,
+                 hitRate: 命中率(包括持久化缓存命中)
+        """
+        with self.lock:
+            total = self.hits + self.diskHits + self.misses
+            hitRate = (self.hits + self.diskHits) / total if total else 0.0
+            return {"size": len(self.entries), "hits": self.hits, "diskHits": self.diskHits,
+                    "misses": self.misses, "hitRate": hitRate}
@@ -1,4 +1,6 @@
+import collections
 import hashlib
+import threading
 
 import ecdsa
 
@@ -6,6 +8,15 @@ SECP256K1 = "secp256k1"
 SM2 = "sm2"
 ED25519 = "ed25519"
 
+# 验签公钥缓存的大小，启用预计算的公钥每个约占用50KB内存
+DefaultKeyCacheSize = 256
+# 同一公钥验签多少次之后启用预计算，预计算的耗时约为10次验签，之后每次验签的耗时减半
+PrecomputeAfter = 16
+
+# 公钥 -> [ecdsa.VerifyingKey, 验签次数]
+keyCache = collections.OrderedDict()
+keyCacheLock = threading.Lock()
+
 
 def generatePrivateKey() -> str:
     private_key = ecdsa.util.randrange(ecdsa.SECP256k1.order)
@@ -19,16 +30,55 @@ def publicKeyFromPrivate(priv) -> str:
     return pub.hex()
 
 
-def sign(msg: bytes, priv: str) -> bytes:
+def signingKey(priv: str) -> ecdsa.SigningKey:
     priv_int = int(priv, 16)
-    return ecdsa.SigningKey.from_secret_exponent(priv_int, curve=ecdsa.SECP256k1). \
-        sign_deterministic(msg, hashfunc=hashlib.sha256, sigencode=ecdsa.util.sigencode_der)
+    return ecdsa.SigningKey.from_secret_exponent(priv_int, curve=ecdsa.SECP256k1)
+
+
+def signWithKey(msg: bytes, key: ecdsa.SigningKey) -> bytes:
+    return key.sign_deterministic(msg, hashfunc=hashlib.sha256, sigencode=ecdsa.util.sigencode_der)
+
+
+def sign(msg: bytes, priv: str) -> bytes:
+    return signWithKey(msg, signingKey(priv))
+
+
+# 解析压缩公钥需要解压缩点，按公钥缓存解析结果，同一发送方的交易重复验签时不再解析，
+# 验签次数达到PrecomputeAfter的公钥换成启用了预计算的对象
+def verifyingKey(pub: bytes) -> ecdsa.VerifyingKey:
+    # 条目为(key, 使用次数)，只在锁内整体替换
+    uses = 1
+    with keyCacheLock:
+        entry = keyCache.get(pub)
+        if entry is not None:
+            keyCache.move_to_end(pub)
+            uses = entry[1] + 1
+            keyCache[pub] = (entry[0], uses)
+            if uses != PrecomputeAfter:
+                return entry[0]
+    key = ecdsa.VerifyingKey.from_string(pub, curve=ecdsa.SECP256k1)
+    if entry is not None:
+        # 在锁外的新对象上预计算，其他线程可以继续使用原来的对象
+        key.precompute()
+    with keyCacheLock:
+        current = keyCache.get(pub)
+        if entry is None and current is not None:
+            # 其他线程已经加入了同一公钥
+            return current[0]
+        # 预计算期间条目可能被淘汰或者使用次数增加，按当前条目替换
+        keyCache[pub] = (key, current[1] if current is not None else uses)
+        keyCache.move_to_end(pub)
+        while len(keyCache) > DefaultKeyCacheSize:
+            keyCache.popitem(last=False)
+    return key
+
+
+def verifyWithKey(msg: bytes, sig: bytes, key: ecdsa.VerifyingKey) -> bool:
+    return key.verify(sig, msg, hashfunc=hashlib.sha256, sigdecode=ecdsa.util.sigdecode_der)
 
 
 def verify(msg: bytes, sig: bytes, pub: str) -> bool:
-    pubhex = bytes.fromhex(pub)
-    return ecdsa.VerifyingKey.from_string(pubhex, curve=ecdsa.SECP256k1). \
-        verify(sig, msg, hashfunc=hashlib.sha256, sigdecode=ecdsa.util.sigdecode_der)
+    return verifyWithKey(msg, sig, verifyingKey(bytes.fromhex(pub)))
 
 
 def ecdh(pub: str, priv: str) -> bytes:
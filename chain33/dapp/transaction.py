@@ -2,51 +2,189 @@
 
 import copy
 import hashlib
+import os
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 
-from chain33.crypto import signer, account
+from chain33.crypto import signer, account, sigcache
 from chain33.crypto.ed25519 import ed25519Signer
 from chain33.crypto.gm import sm2
 from chain33.protobuf import tx_pb2
 
 MaxTxSize = 100000
 MinFee = 100000
+# 签名类型到signature.ty的映射
+SignTypes = {signer.SECP256K1: 1, signer.ED25519: 2, signer.SM2: 3}
+# SignMany默认的进程数
+DefaultSignWorkers = os.cpu_count() or 1
 
 
-# Transaction类，实现对交易得封装，提供签名，验签的方法
-class Transaction(object):
-    def __init__(self, tx):
+# TxView 交易视图，缓存清空签名后的序列化数据、哈希和大小，签名、验签、计算哈希和手续费时共用
+# 通过Set和SetSignature修改字段时只清空受影响的缓存，直接修改tx的字段后需要调用Reset
+class TxView(object):
+    def __init__(self, tx: tx_pb2.Transaction):
         self.tx = tx
+        self.data = None
+        self.hash = None
+        self.size = None
 
-    def CheckSign(self) -> bool:
+    def Reset(self):
         """
-        验签
+        Reset 清空缓存，直接修改tx的字段后调用
+        """
+        self.data = None
+        self.hash = None
+        self.size = None
+
+    def Set(self, **fields):
+        """
+        Set 修改交易字段，比如Set(fee=0, header=b"")
+        """
+        for name, value in fields.items():
+            setattr(self.tx, name, value)
+        # 哈希不包括header
+        if any(name != "header" for name in fields):
+            self.hash = None
+        self.data = None
+        self.size = None
+
+    def SetSignature(self, ty: int, pubkey: bytes, signature: bytes):
+        """
+        SetSignature 设置签名，签名数据和哈希都不包括签名，只清空大小
+        """
+        self.tx.signature.pubkey = pubkey
+        self.tx.signature.ty = ty
+        self.tx.signature.signature = signature
+        self.size = None
+
+    def Attach(self, tx: tx_pb2.Transaction) -> 'TxView':
+        """
+        Attach 为与当前交易内容相同的tx(比如加入交易组时复制的交易)创建视图，复用已缓存的结果
+        :param tx: tx_pb2.Transaction
+        :return: TxView
+        """
+        view = TxView(tx)
+        view.data, view.hash, view.size = self.data, self.hash, self.size
+        return view
+
+    def Copy(self) -> 'TxView':
+        """
+        Copy 清空签名后的副本，签名数据和哈希不变
+        :return: TxView
+        """
+        view = TxView(CopyTx(self.tx))
+        view.data, view.hash = self.data, self.hash
+        return view
+
+    def SigningData(self) -> bytes:
+        """
+        SigningData 清空签名后的交易序列化数据，与CopyTx(tx).SerializeToString()相同
+        :return: 签名数据
+        """
+        if self.data is None:
+            # 未签名的交易直接序列化，不需要先复制
+            if not self.tx.HasField("signature"):
+                self.data = self.tx.SerializeToString()
+            else:
+                self.data = CopyTx(self.tx).SerializeToString()
+        return self.data
+
+    def Hash(self) -> bytes:
+        """
+        Hash 交易哈希，不包括header和signature
+        :return: 哈希
+        """
+        if self.hash is None:
+            # header为空时签名数据就是计算哈希的数据
+            if not self.tx.header:
+                data = self.SigningData()
+            else:
+                copytx = tx_pb2.Transaction()
+                copytx.execer = self.tx.execer
+                copytx.payload = self.tx.payload
+                copytx.expire = self.tx.expire
+                copytx.to = self.tx.to
+                copytx.fee = self.tx.fee
+                copytx.nonce = self.tx.nonce
+                copytx.groupCount = self.tx.groupCount
+                copytx.next = self.tx.next
+                data = copytx.SerializeToString()
+            self.hash = hashlib.sha256(data).digest()
+        return self.hash
+
+    def Size(self) -> int:
+        """
+        Size 交易序列化后的大小
+        :return: 字节数
+        """
+        if self.size is None:
+            if self.data is not None and not self.tx.HasField("signature"):
+                self.size = len(self.data)
+            else:
+                self.size = self.tx.ByteSize()
+        return self.size
+
+    def Sign(self, acc: account.Account) -> tx_pb2.Transaction:
+        """
+        Sign 签名，签名直接设置到tx中
+        :param acc: account.Account
+        :return: tx_pb2.Transaction
+        """
+        signature = acc.Sign(self.SigningData())
+        self.SetSignature(SignTypes[acc.signType], bytes.fromhex(acc.publicKey), signature)
+        return self.tx
+
+    def CheckSign(self, cache: sigcache.SigCache = None) -> bool:
+        """
+        CheckSign 验签，签名错误时返回False，签名类型未知时抛出ValueError
+        :param cache: 验签结果缓存，None表示不缓存
         :return: bool
         """
-        if self.tx.signature.ty == 1:
-            copyTx = CopyTx(self.tx)
-            data = copyTx.SerializeToString()
-            result = signer.verify(data, self.tx.signature.signature, bytes.hex(self.tx.signature.pubkey))
-            return result
-        elif self.tx.signature.ty == 3:
-            copyTx = CopyTx(self.tx)
-            data = copyTx.SerializeToString()
-            sm2util = sm2.SM2Util()
-            result = sm2util.verify(data, bytes.hex(self.tx.signature.pubkey), bytes.hex(self.tx.signature.signature),
-                                    "0")
-            return result
-        elif self.tx.signature.ty == 2:
-            copyTx = CopyTx(self.tx)
-            data = copyTx.SerializeToString()
-            result = ed25519Signer.verify(data, self.tx.signature.signature, self.tx.signature.pubkey.hex())
-            return result
-        else:
+        ty = self.tx.signature.ty
+        if ty not in (1, 2, 3):
             raise ValueError(
                 "Error: signType is not correct."
             )
+        data = self.SigningData()
+        signature = self.tx.signature.signature
+        pubkey = self.tx.signature.pubkey
+        if cache is None:
+            return verifyData(ty, data, signature, pubkey)
+        # 先查询验签结果缓存，未命中时验签并缓存结果
+        key = sigcache.Key(data, ty, pubkey, signature)
+        result = cache.Get(key)
+        if result is None:
+            result = verifyData(ty, data, signature, pubkey)
+            cache.Put(key, result)
+        return result
 
-        return False
+
+# asView 函数同时接受tx_pb2.Transaction和TxView，传入TxView时复用其中的缓存
+def asView(tx) -> TxView:
+    return tx if isinstance(tx, TxView) else TxView(tx)
+
+
+# Transaction类，实现对交易得封装，提供签名，验签的方法
+class Transaction(object):
+    def __init__(self, tx):
+        self.view = TxView(tx)
+
+    @property
+    def tx(self) -> tx_pb2.Transaction:
+        return self.view.tx
+
+    @tx.setter
+    def tx(self, tx: tx_pb2.Transaction):
+        self.view = TxView(tx)
+
+    def CheckSign(self, cache: sigcache.SigCache = None) -> bool:
+        """
+        验签
+        :param cache: 验签结果缓存，None表示不缓存
+        :return: bool
+        """
+        return self.view.CheckSign(cache)
 
     def Sign(self, acc: account.Account) -> tx_pb2.Transaction:
         """
@@ -54,64 +192,61 @@ class Transaction(object):
         :param acc: account账户
         :return:
         """
-        copyTx = CopyTx(self.tx)
-        self.tx = copyTx
-        data = self.tx.SerializeToString()
-        self.tx.signature.pubkey = bytes.fromhex(acc.publicKey)
-        if acc.signType == signer.SECP256K1:
-            self.tx.signature.ty = 1
-            self.tx.signature.signature = signer.sign(data, acc.privateKey)
-            return self.tx
-        elif acc.signType == signer.SM2:
-            self.tx.signature.ty = 3
-            sm2util = sm2.SM2Util()
-            self.tx.signature.signature = bytes.fromhex(sm2util.sign(data, acc.privateKey, "0"))
-            return self.tx
-        elif acc.signType == signer.ED25519:
-            self.tx.signature.ty = 2
-            self.tx.signature.signature = ed25519Signer.sign(data, acc.privateKey)
-            return self.tx
-        else:
-            raise ValueError(
-                "Error: signType is not correct."
-            )
+        # 在副本上签名，不影响原来的tx
+        self.view = self.view.Copy()
+        return self.view.Sign(acc)
 
     def Hash(self) -> bytes:
         """
         获取tx的hash值
         :return:
         """
-        return Hash(self.tx)
+        return self.view.Hash()
 
     def Tx(self) -> tx_pb2.Transaction:
         """
         获取tx_pb2.Transaction
         :return:
         """
-        return self.tx
+        return self.view.tx
 
 
 # TxGroup 实现对交易组得封装，提供签名，验签的方法
 class TxGroup(object):
     def __init__(self, txlist: list, feerate: int):
-        self.txgroup = CreateTxGroup(txlist, feerate)
+        self.views = createGroupViews(txlist, feerate)
+        self.txgroup = tx_pb2.Transactions()
+        self.attach()
+
+    # attach 把交易放进txgroup，并为复制后的交易创建视图，复用已缓存的结果
+    def attach(self):
+        self.txgroup.txs.extend(view.tx for view in self.views)
+        self.views = [view.Attach(tx) for view, tx in zip(self.views, self.txgroup.txs)]
 
-    def Sign(self, acc: account.Account) -> tx_pb2.Transactions:
+    def Sign(self, acc: account.Account, workers: int = 1) -> tx_pb2.Transactions:
         """
         签名
         :param acc:
+        :param workers: 大于1时通过SignMany在多个进程中签名
         :return:
         """
-        self.txgroup = SignTxGroup(self.txgroup, acc)
+        signTxViews(self.views, acc, workers)
+        self.txgroup = tx_pb2.Transactions()
+        self.attach()
         return self.txgroup
 
-    def CheckSign(self) -> bool:
+    def CheckSign(self, workers: int = 1, cache: sigcache.SigCache = None) -> bool:
         """
         验证签名
+        :param workers: 大于1时通过CheckSignMany在多个进程中验签，遇到第一笔失败的交易即返回
+        :param cache: 验签结果缓存，None表示不缓存
         :return:
         """
-        for tx in (self.txgroup.txs):
-            if CheckSign(tx) != True:
+        if workers > 1:
+            return all(result is True for result in CheckSignMany(self.views, workers, earlyExit=True,
+                                                                  cache=cache))
+        for view in self.views:
+            if view.CheckSign(cache) != True:
                 return False
         return True
 
@@ -158,82 +293,181 @@ def CreateTransaction(execer: bytes, payload: bytes, expire: int, to: str) -> Tr
 '''
 
 
+def signingData(tx) -> bytes:
+    """
+    signingData 清空签名后的交易序列化数据，与CopyTx(tx).SerializeToString()相同
+    :param tx: tx_pb2.Transaction或者TxView
+    :return: 签名数据
+    """
+    return asView(tx).SigningData()
+
+
 # tx hash 返回字节切片
-def Hash(tx: tx_pb2.Transaction) -> bytes:
-    copytx = tx_pb2.Transaction()
-    copytx.execer = tx.execer
-    copytx.payload = tx.payload
-    copytx.expire = tx.expire
-    copytx.to = tx.to
-    copytx.fee = tx.fee
-    copytx.nonce = tx.nonce
-    copytx.groupCount = tx.groupCount
-    copytx.next = tx.next
-    data = copytx.SerializeToString()
-    sha256 = hashlib.sha256()
-    sha256.update(data)
-    return sha256.digest()
+def Hash(tx) -> bytes:
+    return asView(tx).Hash()
 
 
-def Sign(tx: tx_pb2.Transaction, acc: account.Account) -> tx_pb2.Transaction:
+def Sign(tx, acc: account.Account) -> tx_pb2.Transaction:
     """
     签名函数
-    :param tx: tx_pb2.Transaction
+    :param tx: tx_pb2.Transaction或者TxView
     :param acc: account.Account
     :return:
     """
-    copyTx = CopyTx(tx)
-    data = copyTx.SerializePartialToString()
-    tx.signature.pubkey = bytes.fromhex(acc.publicKey)
-    if acc.signType == signer.SECP256K1:
-        tx.signature.ty = 1
-        tx.signature.signature = signer.sign(data, acc.privateKey)
-        return tx
-    elif acc.signType == signer.SM2:
-        tx.signature.ty = 3
-        sm2util = sm2.SM2Util()
-        tx.signature.signature = bytes.fromhex(sm2util.sign(data, acc.privateKey, '0'))
-        return tx
-    elif acc.signType == signer.ED25519:
-        tx.signature.ty = 2
-        tx.signature.signature = ed25519Signer.sign(data, acc.privateKey)
-        return tx
-    else:
+    return asView(tx).Sign(acc)
+
+
+# signChunk 在子进程中执行，只接收待签名数据和私钥，只返回签名，每块只创建一次密钥对象
+def signChunk(args: tuple) -> list:
+    privateKey, signType, datas = args
+    acc = account.Account(privateKey, signType)
+    return [acc.Sign(data) for data in datas]
+
+
+def SignMany(txs: list, acc: account.Account, workers: int = DefaultSignWorkers,
+             executor: ProcessPoolExecutor = None) -> list:
+    """
+    SignMany 批量签名，签名分散到多个进程中计算，结果与逐笔调用Sign相同
+    :param txs: tx_pb2.Transaction或者TxView列表，签名直接设置到各笔交易中
+    :param acc: account.Account
+    :param workers: 进程数，1表示在当前线程中签名
+    :param executor: 复用的ProcessPoolExecutor，None表示临时创建
+    :return: txs，顺序不变
+    """
+    if acc.signType not in SignTypes:
         raise ValueError(
             "Error: signType is not correct."
         )
+    views = [asView(tx) for tx in txs]
+    datas = [view.SigningData() for view in views]
+    if (workers <= 1 and executor is None) or len(datas) < 2:
+        signatures = [acc.Sign(data) for data in datas]
+    else:
+        # 每个进程分到若干块，减少进程间通信的次数
+        size = max(1, -(-len(datas) // (max(workers, 1) * 4)))
+        chunks = [(acc.privateKey, acc.signType, datas[i:i + size]) for i in range(0, len(datas), size)]
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(signChunk, chunks))
+        else:
+            results = list(executor.map(signChunk, chunks))
+        signatures = [signature for result in results for signature in result]
+    pubkey = bytes.fromhex(acc.publicKey)
+    ty = SignTypes[acc.signType]
+    for view, signature in zip(views, signatures):
+        view.SetSignature(ty, pubkey, signature)
+    return txs
 
 
-def CheckSign(tx: tx_pb2.Transaction) -> bool:
+def CheckSign(tx, cache: sigcache.SigCache = None) -> bool:
     """
-    CheckSign
-    :param tx: tx_pb2.Transaction
+    CheckSign 验签，签名错误时返回False，签名类型未知时抛出ValueError
+    :param tx: tx_pb2.Transaction或者TxView
+    :param cache: 验签结果缓存，None表示不缓存
     :return: bool
     """
-    if tx.signature.ty == 1:
-        copyTx = CopyTx(tx)
-        data = copyTx.SerializeToString()
-        result = signer.verify(data, tx.signature.signature, bytes.hex(tx.signature.pubkey))
-        return result
-    elif tx.signature.ty == 3:
-        copyTx = CopyTx(tx)
-        data = copyTx.SerializeToString()
-        sm2util = sm2.SM2Util()
-        result = sm2util.verify(data, bytes.hex(tx.signature.pubkey), bytes.hex(tx.signature.signature), "0")
-        return result
-    elif tx.signature.ty == 2:
-        copyTx = CopyTx(tx)
-        data = copyTx.SerializeToString()
-        result = ed25519Signer.verify(data, tx.signature.signature, tx.signature.pubkey.hex())
-        return result
-    else:
-        raise ValueError(
-            "Error: signType is not correct."
-        )
+    return asView(tx).CheckSign(cache)
+
 
+def verifyData(ty: int, data: bytes, signature: bytes, pubkey: bytes, sm2util: sm2.SM2Util = None) -> bool:
+    """
+    verifyData 验证交易签名数据的签名，签名错误或者签名类型未知时返回False
+    :param ty: signature.ty
+    :param data: 清空签名后的交易序列化数据
+    :param signature: 签名
+    :param pubkey: 公钥
+    :param sm2util: 复用的sm2.SM2Util
+    :return: bool
+    """
+    try:
+        if ty == 1:
+            return signer.verifyWithKey(data, signature, signer.verifyingKey(pubkey))
+        elif ty == 3:
+            sm2util = sm2util if sm2util is not None else sm2.SM2Util()
+            return sm2util.verify(data, pubkey.hex(), signature.hex(), "0")
+        elif ty == 2:
+            return ed25519Signer.verifyWithKey(data, signature, ed25519Signer.verifyingKey(pubkey))
+    except Exception:
+        return False
     return False
 
 
+# verifyChunk 在子进程中执行，同一块中的交易签名类型相同
+def verifyChunk(args: tuple) -> list:
+    ty, items = args
+    sm2util = sm2.SM2Util() if ty == 3 else None
+    return [verifyData(ty, data, signature, pubkey, sm2util) for data, signature, pubkey in items]
+
+
+def CheckSignMany(txs, workers: int = DefaultSignWorkers, executor: ProcessPoolExecutor = None,
+                  earlyExit: bool = False, cache: sigcache.SigCache = None) -> list:
+    """
+    CheckSignMany 批量验签，按签名类型分组后分散到多个进程中验证
+    :param txs: tx_pb2.Transaction或者TxView列表，或者tx_pb2.Transactions
+    :param workers: 进程数，1表示在当前线程中验签
+    :param executor: 复用的ProcessPoolExecutor，None表示临时创建
+    :param earlyExit: 遇到第一笔验签失败的交易时停止，用于交易组等要求全部成功的场景
+    :param cache: 验签结果缓存，None表示不缓存，命中的交易不再验签
+    :return: 与txs顺序一致的结果列表，True表示验签成功，False表示失败，earlyExit时未验证的交易为None
+    """
+    if isinstance(txs, tx_pb2.Transactions):
+        txs = txs.txs
+    results = [None] * len(txs)
+    groups = {}
+    keys = {}
+    for i, view in enumerate(txs):
+        tx = view.tx if isinstance(view, TxView) else view
+        item = (signingData(view), tx.signature.signature, tx.signature.pubkey)
+        if cache is not None:
+            keys[i] = sigcache.Key(item[0], tx.signature.ty, item[2], item[1])
+            results[i] = cache.Get(keys[i])
+            if results[i] is not None:
+                if earlyExit and not results[i]:
+                    return results
+                continue
+        groups.setdefault(tx.signature.ty, []).append((i, item))
+    count = sum(len(group) for group in groups.values())
+    if (workers <= 1 and executor is None) or count < 2:
+        for ty, group in groups.items():
+            sm2util = sm2.SM2Util() if ty == 3 else None
+            for i, item in group:
+                results[i] = verifyData(ty, *item, sm2util)
+                if cache is not None:
+                    cache.Put(keys[i], results[i])
+                if earlyExit and not results[i]:
+                    return results
+        return results
+    # 每个进程分到若干块，减少进程间通信的次数
+    size = max(1, -(-count // (max(workers, 1) * 4)))
+    chunks = []
+    for ty, group in groups.items():
+        for start in range(0, len(group), size):
+            chunk = group[start:start + size]
+            chunks.append(([i for i, _ in chunk], (ty, [item for _, item in chunk])))
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+    pending = {}
+    try:
+        pending = {pool.submit(verifyChunk, args): indexes for indexes, args in chunks}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            failed = False
+            for future in done:
+                for i, result in zip(pending.pop(future), future.result()):
+                    results[i] = result
+                    if cache is not None:
+                        cache.Put(keys[i], result)
+                    failed = failed or not result
+            if earlyExit and failed:
+                return results
+        return results
+    finally:
+        # 提前返回时取消还没有开始的块
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown()
+
+
 # 构建交易
 def createTx(execer: bytes, payload: bytes, expire: int, to: str) -> tx_pb2.Transaction:
     tx1 = tx_pb2.Transaction()
@@ -264,16 +498,17 @@ def CopyTx(tx: tx_pb2.Transaction) -> tx_pb2.Transaction:
 
 
 # 获取真实手续费
-def GetRealFee(tx: tx_pb2.Transaction, minFee: int) -> int:
+def GetRealFee(tx, minFee: int) -> int:
     """
     GetRealFee
-    :param tx: tx_pb2.Transaction
+    :param tx: tx_pb2.Transaction或者TxView
     :param minFee: int
     :return:
     """
-    txSize = tx.ByteSize()
+    view = asView(tx)
+    txSize = view.Size()
     # 如果签名为空，那么加上签名的空间
-    if tx.signature == None:
+    if view.tx.signature == None:
         txSize += 300
     if txSize > MaxTxSize:
         raise Exception('ErrTxMsgSizeTooBig')
@@ -301,56 +536,66 @@ def GetTxGroups(tx: tx_pb2.Transaction) -> TxGroup:
 def CreateTxGroup(txs: list, feeRate: int) -> tx_pb2.Transactions:
     """
     CreateTxGroup 构造交易组
-    :param txs: 交易列表
+    :param txs: 交易列表，tx_pb2.Transaction或者TxView
     :param feeRate: 交易费率
     :return:
     """
+    txgroup = tx_pb2.Transactions()
+    txgroup.txs.extend(view.tx for view in createGroupViews(txs, feeRate))
+    return txgroup
+
+
+# createGroupViews 构造交易组中各笔交易的字段，返回各笔交易的视图，计算哈希和大小时复用视图中的缓存
+def createGroupViews(txs: list, feeRate: int) -> list:
     if len(txs) < 2:
         raise Exception('ErrTxGroupCountLessThanTwo')
-    txgroup = tx_pb2.Transactions()
-    # txgroup.Txs=txs
+    views = [asView(tx) for tx in txs]
     totalfee = 0
     minfee = 0
-    header = Hash(txs[0])
-    for i in range(len(txs) - 1, -1, -1):
-        txs[i].groupCount = len(txs)
-        totalfee += txs[i].fee
+    header = views[0].Hash()
+    for i in range(len(views) - 1, -1, -1):
+        totalfee += views[i].tx.fee
         # Header和Fee设置是为了GetRealFee里面Size的计算，Fee是否为0和不同大小，size也是有差别的，header是否为空差别是common.Sha256Len + 2
         # 这里直接设置Header兼容性更好， Next不需要，已经设置过了，唯一不同的是，txs[0].fee会跟实际计算有差别，这里设置一个超大值只做计算
-        txs[i].header = header
-        realfee = GetRealFee(txs[i], feeRate)
-        txs[i].fee = 0
+        views[i].Set(groupCount=len(views), header=header)
+        realfee = GetRealFee(views[i], feeRate)
         minfee += realfee
         if i == 0:
             if totalfee < minfee:
                 totalfee = minfee
-            txs[0].fee = totalfee
-            header = Hash(txs[0])
+            views[0].Set(fee=totalfee)
+            header = views[0].Hash()
         else:
-            txs[i].fee = 0
-            txs[i - 1].next = Hash(txs[i])
-    for i in range(0, len(txs), 1):
-        txs[i].header = header
-
-    for i in range(0, len(txs), 1):
-        txgroup.txs.append(txs[i])
-    return txgroup
+            views[i].Set(fee=0)
+            views[i - 1].Set(next=views[i].Hash())
+    for view in views:
+        view.Set(header=header)
+    return views
 
 
 # 交易组签名
-def SignTxGroup(group: tx_pb2.Transactions, acc: account.Account) -> tx_pb2.Transactions:
+def SignTxGroup(group: tx_pb2.Transactions, acc: account.Account, workers: int = 1) -> tx_pb2.Transactions:
     """
     交易组签名
     :param group: tx_pb2.Transactions
     :param acc:  account.Account
+    :param workers: 大于1时通过SignMany在多个进程中签名
     :return:
     """
     txgroup = tx_pb2.Transactions()
-    for i in range(0, len(group.txs), 1):
-        txgroup.txs.append(Sign(group.txs[i], acc))
+    txgroup.txs.extend(view.tx for view in signTxViews([TxView(tx) for tx in group.txs], acc, workers))
     return txgroup
 
 
+# signTxViews 依次或者通过SignMany给交易组中的各笔交易签名
+def signTxViews(views: list, acc: account.Account, workers: int) -> list:
+    if workers > 1:
+        return SignMany(views, acc, workers)
+    for view in views:
+        view.Sign(acc)
+    return views
+
+
 def GetTx(txgroup: tx_pb2.Transactions) -> tx_pb2.Transaction:
     """
     GetTx
@@ -427,3 +672,107 @@ if __name__ == '__main__':
     tx = Transaction(tx)
     tx.Sign(acc1)
     assert tx.CheckSign()
+
+    # 批量签名，结果与逐笔签名一致
+    for acc in (account.newAccount(signer.SECP256K1), account.newAccount(signer.SM2),
+                account.newAccount(signer.ED25519)):
+        txs = [createTx(execer=b"coins", payload=bytes("batch %d" % i, encoding='utf-8'), expire=0, to="xxxxx")
+               for i in range(9)]
+        serial = [Sign(copy.deepcopy(t), acc) for t in txs]
+        SignMany(txs, acc, workers=2)
+        assert all(CheckSign(t) for t in txs)
+        assert [t.nonce for t in txs] == [t.nonce for t in serial]
+        if acc.signType != signer.SM2:
+            # SM2签名使用随机数，只有secp256k1和ed25519的签名是确定的
+            assert [t.signature.signature for t in txs] == [t.signature.signature for t in serial]
+    group = TxGroup([createTx(b"coins", bytes("group %d" % i, encoding='utf-8'), 0, "xxxxx") for i in range(3)],
+                    MinFee)
+    group.Sign(acc, workers=2)
+    assert group.CheckSign()
+    assert group.CheckSign(workers=2)
+
+    # 批量验签，混合多种签名类型
+    txs = []
+    for i, signType in enumerate([signer.SECP256K1, signer.SM2, signer.ED25519] * 3):
+        txs.append(Sign(createTx(b"coins", bytes("verify %d" % i, encoding='utf-8'), 0, "xxxxx"),
+                        account.newAccount(signType)))
+    txs[4].signature.signature = txs[1].signature.signature
+    txs[6].fee += 1
+    for workers in (1, 3):
+        assert CheckSignMany(txs, workers) == [i not in (4, 6) for i in range(9)]
+        results = CheckSignMany(txs, workers, earlyExit=True)
+        assert False in results and all(results[i] for i in range(9) if i not in (4, 6) and results[i] is not None)
+    group = tx_pb2.Transactions()
+    group.txs.extend(txs[:3])
+    assert CheckSignMany(group, 1) == [True] * 3
+
+    # 验签结果缓存，重复验签只查询缓存，持久化后重新打开仍然命中
+    import tempfile
+    from chain33.rpc import diskcache
+
+    path = os.path.join(tempfile.mkdtemp(), "sigs.db")
+    disk = diskcache.DiskCache(path)
+    sigs = sigcache.SigCache(maxSize=4, disk=disk)
+    assert CheckSignMany(txs, 1, cache=sigs) == [i not in (4, 6) for i in range(9)]
+    assert [CheckSign(t, sigs) for t in txs] == [i not in (4, 6) for i in range(9)]
+    stats = sigs.Stats()
+    assert stats["misses"] == 9 and stats["hits"] + stats["diskHits"] == 9 and stats["size"] == 4
+    disk.Close()
+    disk = diskcache.DiskCache(path)
+    sigs = sigcache.SigCache(disk=disk)
+    assert CheckSignMany(group, 1, cache=sigs) == [True] * 3
+    assert Transaction(txs[0]).CheckSign(sigs) and sigs.Stats()["diskHits"] == 3
+    txgroup = TxGroup([createTx(b"coins", bytes("cached %d" % i, encoding='utf-8'), 0, "xxxxx") for i in range(3)],
+                      MinFee)
+    txgroup.Sign(acc)
+    assert txgroup.CheckSign(cache=sigs) and txgroup.CheckSign(cache=sigs)
+    assert sigs.Stats()["hits"] == 4
+    txs[0].fee += 1
+    assert not CheckSign(txs[0], sigs) and sigs.Stats()["misses"] == 4
+    assert disk.Stats()["sigs"]["hits"] == 3
+    disk.Close()
+
+    # 签名数据和哈希与复制后序列化的结果一致
+    def legacyHash(tx):
+        copytx = CopyTx(tx)
+        copytx.header = b""
+        return hashlib.sha256(copytx.SerializeToString()).digest()
+
+    tx = createTx(b"coins", b"fast path", 0, "xxxxx")
+    legacy = legacyHash(tx)
+    assert signingData(tx) == CopyTx(tx).SerializeToString() and Hash(tx) == legacy
+    tx.header = b"header"
+    assert signingData(tx) == CopyTx(tx).SerializeToString() and Hash(tx) == legacy
+    Sign(tx, acc)
+    assert signingData(tx) == CopyTx(tx).SerializeToString() and Hash(tx) == legacy and CheckSign(tx)
+    tx.fee += 1
+    assert Hash(tx) != legacy and not CheckSign(tx)
+
+    # 所有验签路径的结果一致，签名错误时返回False而不是抛出异常
+    bad = Sign(createTx(b"coins", b"bad", 0, "xxxxx"), account.newAccount(signer.SECP256K1))
+    bad.fee += 1
+    assert CheckSign(bad) is False and Transaction(bad).CheckSign() is False
+    assert CheckSign(bad, sigcache.SigCache()) is False and CheckSignMany([bad], 1) == [False]
+
+    # 交易视图只序列化一次，修改字段后重新计算，结果与不缓存时一致
+    view = TxView(createTx(b"coins", b"view", 0, "xxxxx"))
+    data, txHash = view.SigningData(), view.Hash()
+    assert data == CopyTx(view.tx).SerializeToString() and txHash == legacyHash(view.tx)
+    view.Sign(acc)
+    assert view.SigningData() is data and view.Hash() is txHash and view.Size() == view.tx.ByteSize()
+    assert view.CheckSign() and CheckSign(view) and CheckSignMany([view], 1) == [True]
+    view.Set(header=b"header")
+    assert view.Hash() is txHash and view.SigningData() == CopyTx(view.tx).SerializeToString()
+    view.Set(fee=MinFee * 2)
+    assert view.Hash() == legacyHash(view.tx) != txHash and not view.CheckSign()
+    assert GetRealFee(view, MinFee) == GetRealFee(view.tx, MinFee)
+    view.tx.fee = MinFee
+    view.Reset()
+    assert view.Hash() == txHash
+    # 交易组的字段和签名与逐笔修改交易字段的结果一致
+    plain = [createTx(b"coins", bytes("group %d" % i, encoding='utf-8'), 0, "xxxxx") for i in range(3)]
+    viewed = TxGroup([TxView(copy.deepcopy(t)) for t in plain], MinFee)
+    group = CreateTxGroup(copy.deepcopy(plain), MinFee)
+    assert viewed.Txs() == group and [v.Hash() for v in viewed.views] == [legacyHash(t) for t in group.txs]
+    assert group.txs[0].next == legacyHash(group.txs[1]) and group.txs[0].header == legacyHash(group.txs[0])
+    assert SignTxGroup(group, acc) == viewed.Sign(acc) and viewed.CheckSign()
@@ -1,3 +1,5 @@
 #!/bin/bash
 
 protoc --python_out=../protobuf/   ./*.proto --proto_path=.
+# 生成的代码使用顶层导入引用其他proto文件，改成包内导入
+sed -i 's/^import tx_pb2 as tx__pb2$/from chain33.protobuf import tx_pb2 as tx__pb2/' ../protobuf/*_pb2.py
@@ -0,0 +1,827 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: blockchain.proto
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from chain33.protobuf import tx_pb2 as tx__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='blockchain.proto',
+  package='protobuf',
+  syntax='proto3',
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x10\x62lockchain.proto\x12\x08protobuf\x1a\x08tx.proto\"\xf8\x01\n\x05\x42lock\x12\x0f\n\x07version\x18\x01 \x01(\x03\x12\x12\n\nparentHash\x18\x02 \x01(\x0c\x12\x0e\n\x06txHash\x18\x03 \x01(\x0c\x12\x11\n\tstateHash\x18\x04 \x01(\x0c\x12\x0e\n\x06height\x18\x05 \x01(\x03\x12\x11\n\tblockTime\x18\x06 \x01(\x03\x12\x12\n\ndifficulty\x18\x0b \x01(\r\x12\x10\n\x08mainHash\x18\x0c \x01(\x0c\x12\x12\n\nmainHeight\x18\r \x01(\x03\x12&\n\tsignature\x18\x08 \x01(\x0b\x32\x13.protobuf.Signature\x12\"\n\x03txs\x18\x07 \x03(\x0b\x32\x15.protobuf.Transaction\"\xce\x01\n\x06Header\x12\x0f\n\x07version\x18\x01 \x01(\x03\x12\x12\n\nparentHash\x18\x02 \x01(\x0c\x12\x0e\n\x06txHash\x18\x03 \x01(\x0c\x12\x11\n\tstateHash\x18\x04 \x01(\x0c\x12\x0e\n\x06height\x18\x05 \x01(\x03\x12\x11\n\tblockTime\x18\x06 \x01(\x03\x12\x0f\n\x07txCount\x18\t \x01(\x03\x12\x0c\n\x04hash\x18\n \x01(\x0c\x12\x12\n\ndifficulty\x18\x0b \x01(\r\x12&\n\tsignature\x18\x08 \x01(\x0b\x32\x13.protobuf.Signature\"%\n\nReceiptLog\x12\n\n\x02ty\x18\x01 \x01(\x05\x12\x0b\n\x03log\x18\x02 \x01(\x0c\"=\n\x0bReceiptData\x12\n\n\x02ty\x18\x01 \x01(\x05\x12\"\n\x04logs\x18\x03 \x03(\x0b\x32\x14.protobuf.ReceiptLog\"&\n\x08KeyValue\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\r\n\x05value\x18\x02 \x01(\x0c\"\x8e\x01\n\x0b\x42lockDetail\x12\x1e\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0f.protobuf.Block\x12\'\n\x08receipts\x18\x02 \x03(\x0b\x32\x15.protobuf.ReceiptData\x12\x1e\n\x02KV\x18\x03 \x03(\x0b\x32\x12.protobuf.KeyValue\x12\x16\n\x0eprevStatusHash\x18\x04 \x01(\x0c\"+\n\rBlockSequence\x12\x0c\n\x04Hash\x18\x01 \x01(\x0c\x12\x0c\n\x04Type\x18\x02 \x01(\x03\"d\n\x08\x42lockSeq\x12\x0b\n\x03num\x18\x01 \x01(\x03\x12$\n\x03seq\x18\x02 \x01(\x0b\x32\x17.protobuf.BlockSequence\x12%\n\x06\x64\x65tail\x18\x03 \x01(\x0b\x32\x15.protobuf.BlockDetail\"-\n\tBlockSeqs\x12 \n\x04seqs\x18\x01 \x03(\x0b\x32\x12.protobuf.BlockSeq\"`\n\tHeaderSeq\x12\x0b\n\x03num\x18\x01 \x01(\x03\x12$\n\x03seq\x18\x02 \x01(\x0b\x32\x17.protobuf.BlockSequence\x12 \n\x06header\x18\x03 \x01(\x0b\x32\x10.protobuf.Header\"/\n\nHeaderSeqs\x12!\n\x04seqs\x18\x01 \x03(\x0b\x32\x13.protobuf.HeaderSeq\"\xdc\x01\n\x1aTxReceipts4SubscribePerBlk\x12!\n\x02tx\x18\x01 \x03(\x0b\x32\x15.protobuf.Transaction\x12*\n\x0breceiptData\x18\x02 \x03(\x0b\x32\x15.protobuf.ReceiptData\x12\x0e\n\x06height\x18\x04 \x01(\x03\x12\x11\n\tblockHash\x18\x05 \x01(\x0c\x12\x12\n\nparentHash\x18\x06 \x01(\x0c\x12\x14\n\x0cpreviousHash\x18\x07 \x01(\x0c\x12\x12\n\naddDelType\x18\x08 \x01(\x05\x12\x0e\n\x06seqNum\x18\t \x01(\x03\"P\n\x14TxReceipts4Subscribe\x12\x38\n\ntxReceipts\x18\x01 \x03(\x0b\x32$.protobuf.TxReceipts4SubscribePerBlkb\x06proto3'
+  ,
+  dependencies=[tx__pb2.DESCRIPTOR,])
+
+
+
+
+_BLOCK = _descriptor.Descriptor(
+  name='Block',
+  full_name='protobuf.Block',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='version', full_name='protobuf.Block.version', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='parentHash', full_name='protobuf.Block.parentHash', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='txHash', full_name='protobuf.Block.txHash', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stateHash', full_name='protobuf.Block.stateHash', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='height', full_name='protobuf.Block.height', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='blockTime', full_name='protobuf.Block.blockTime', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='difficulty', full_name='protobuf.Block.difficulty', index=6,
+      number=11, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mainHash', full_name='protobuf.Block.mainHash', index=7,
+      number=12, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mainHeight', full_name='protobuf.Block.mainHeight', index=8,
+      number=13, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='protobuf.Block.signature', index=9,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='txs', full_name='protobuf.Block.txs', index=10,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=41,
+  serialized_end=289,
+)
+
+
+_HEADER = _descriptor.Descriptor(
+  name='Header',
+  full_name='protobuf.Header',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='version', full_name='protobuf.Header.version', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='parentHash', full_name='protobuf.Header.parentHash', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='txHash', full_name='protobuf.Header.txHash', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stateHash', full_name='protobuf.Header.stateHash', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='height', full_name='protobuf.Header.height', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='blockTime', full_name='protobuf.Header.blockTime', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='txCount', full_name='protobuf.Header.txCount', index=6,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='protobuf.Header.hash', index=7,
+      number=10, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='difficulty', full_name='protobuf.Header.difficulty', index=8,
+      number=11, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='signature', full_name='protobuf.Header.signature', index=9,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=292,
+  serialized_end=498,
+)
+
+
+_RECEIPTLOG = _descriptor.Descriptor(
+  name='ReceiptLog',
+  full_name='protobuf.ReceiptLog',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ty', full_name='protobuf.ReceiptLog.ty', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='log', full_name='protobuf.ReceiptLog.log', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=500,
+  serialized_end=537,
+)
+
+
+_RECEIPTDATA = _descriptor.Descriptor(
+  name='ReceiptData',
+  full_name='protobuf.ReceiptData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ty', full_name='protobuf.ReceiptData.ty', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='logs', full_name='protobuf.ReceiptData.logs', index=1,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=539,
+  serialized_end=600,
+)
+
+
+_KEYVALUE = _descriptor.Descriptor(
+  name='KeyValue',
+  full_name='protobuf.KeyValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='protobuf.KeyValue.key', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='protobuf.KeyValue.value', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=602,
+  serialized_end=640,
+)
+
+
+_BLOCKDETAIL = _descriptor.Descriptor(
+  name='BlockDetail',
+  full_name='protobuf.BlockDetail',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='block', full_name='protobuf.BlockDetail.block', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='receipts', full_name='protobuf.BlockDetail.receipts', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='KV', full_name='protobuf.BlockDetail.KV', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='prevStatusHash', full_name='protobuf.BlockDetail.prevStatusHash', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=643,
+  serialized_end=785,
+)
+
+
+_BLOCKSEQUENCE = _descriptor.Descriptor(
+  name='BlockSequence',
+  full_name='protobuf.BlockSequence',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Hash', full_name='protobuf.BlockSequence.Hash', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='Type', full_name='protobuf.BlockSequence.Type', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=787,
+  serialized_end=830,
+)
+
+
+_BLOCKSEQ = _descriptor.Descriptor(
+  name='BlockSeq',
+  full_name='protobuf.BlockSeq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='num', full_name='protobuf.BlockSeq.num', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='seq', full_name='protobuf.BlockSeq.seq', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='detail', full_name='protobuf.BlockSeq.detail', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=832,
+  serialized_end=932,
+)
+
+
+_BLOCKSEQS = _descriptor.Descriptor(
+  name='BlockSeqs',
+  full_name='protobuf.BlockSeqs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='seqs', full_name='protobuf.BlockSeqs.seqs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=934,
+  serialized_end=979,
+)
+
+
+_HEADERSEQ = _descriptor.Descriptor(
+  name='HeaderSeq',
+  full_name='protobuf.HeaderSeq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='num', full_name='protobuf.HeaderSeq.num', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='seq', full_name='protobuf.HeaderSeq.seq', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='header', full_name='protobuf.HeaderSeq.header', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=981,
+  serialized_end=1077,
+)
+
+
+_HEADERSEQS = _descriptor.Descriptor(
+  name='HeaderSeqs',
+  full_name='protobuf.HeaderSeqs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='seqs', full_name='protobuf.HeaderSeqs.seqs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1079,
+  serialized_end=1126,
+)
+
+
+_TXRECEIPTS4SUBSCRIBEPERBLK = _descriptor.Descriptor(
+  name='TxReceipts4SubscribePerBlk',
+  full_name='protobuf.TxReceipts4SubscribePerBlk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tx', full_name='protobuf.TxReceipts4SubscribePerBlk.tx', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='receiptData', full_name='protobuf.TxReceipts4SubscribePerBlk.receiptData', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='height', full_name='protobuf.TxReceipts4SubscribePerBlk.height', index=2,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='blockHash', full_name='protobuf.TxReceipts4SubscribePerBlk.blockHash', index=3,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='parentHash', full_name='protobuf.TxReceipts4SubscribePerBlk.parentHash', index=4,
+      number=6, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='previousHash', full_name='protobuf.TxReceipts4SubscribePerBlk.previousHash', index=5,
+      number=7, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='addDelType', full_name='protobuf.TxReceipts4SubscribePerBlk.addDelType', index=6,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='seqNum', full_name='protobuf.TxReceipts4SubscribePerBlk.seqNum', index=7,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1129,
+  serialized_end=1349,
+)
+
+
+_TXRECEIPTS4SUBSCRIBE = _descriptor.Descriptor(
+  name='TxReceipts4Subscribe',
+  full_name='protobuf.TxReceipts4Subscribe',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='txReceipts', full_name='protobuf.TxReceipts4Subscribe.txReceipts', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1351,
+  serialized_end=1431,
+)
+
+_BLOCK.fields_by_name['signature'].message_type = tx__pb2._SIGNATURE
+_BLOCK.fields_by_name['txs'].message_type = tx__pb2._TRANSACTION
+_HEADER.fields_by_name['signature'].message_type = tx__pb2._SIGNATURE
+_RECEIPTDATA.fields_by_name['logs'].message_type = _RECEIPTLOG
+_BLOCKDETAIL.fields_by_name['block'].message_type = _BLOCK
+_BLOCKDETAIL.fields_by_name['receipts'].message_type = _RECEIPTDATA
+_BLOCKDETAIL.fields_by_name['KV'].message_type = _KEYVALUE
+_BLOCKSEQ.fields_by_name['seq'].message_type = _BLOCKSEQUENCE
+_BLOCKSEQ.fields_by_name['detail'].message_type = _BLOCKDETAIL
+_BLOCKSEQS.fields_by_name['seqs'].message_type = _BLOCKSEQ
+_HEADERSEQ.fields_by_name['seq'].message_type = _BLOCKSEQUENCE
+_HEADERSEQ.fields_by_name['header'].message_type = _HEADER
+_HEADERSEQS.fields_by_name['seqs'].message_type = _HEADERSEQ
+_TXRECEIPTS4SUBSCRIBEPERBLK.fields_by_name['tx'].message_type = tx__pb2._TRANSACTION
+_TXRECEIPTS4SUBSCRIBEPERBLK.fields_by_name['receiptData'].message_type = _RECEIPTDATA
+_TXRECEIPTS4SUBSCRIBE.fields_by_name['txReceipts'].message_type = _TXRECEIPTS4SUBSCRIBEPERBLK
+DESCRIPTOR.message_types_by_name['Block'] = _BLOCK
+DESCRIPTOR.message_types_by_name['Header'] = _HEADER
+DESCRIPTOR.message_types_by_name['ReceiptLog'] = _RECEIPTLOG
+DESCRIPTOR.message_types_by_name['ReceiptData'] = _RECEIPTDATA
+DESCRIPTOR.message_types_by_name['KeyValue'] = _KEYVALUE
+DESCRIPTOR.message_types_by_name['BlockDetail'] = _BLOCKDETAIL
+DESCRIPTOR.message_types_by_name['BlockSequence'] = _BLOCKSEQUENCE
+DESCRIPTOR.message_types_by_name['BlockSeq'] = _BLOCKSEQ
+DESCRIPTOR.message_types_by_name['BlockSeqs'] = _BLOCKSEQS
+DESCRIPTOR.message_types_by_name['HeaderSeq'] = _HEADERSEQ
+DESCRIPTOR.message_types_by_name['HeaderSeqs'] = _HEADERSEQS
+DESCRIPTOR.message_types_by_name['TxReceipts4SubscribePerBlk'] = _TXRECEIPTS4SUBSCRIBEPERBLK
+DESCRIPTOR.message_types_by_name['TxReceipts4Subscribe'] = _TXRECEIPTS4SUBSCRIBE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+Block = _reflection.GeneratedProtocolMessageType('Block', (_message.Message,), {
+  'DESCRIPTOR' : _BLOCK,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.Block)
+  })
+_sym_db.RegisterMessage(Block)
+
+Header = _reflection.GeneratedProtocolMessageType('Header', (_message.Message,), {
+  'DESCRIPTOR' : _HEADER,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.Header)
+  })
+_sym_db.RegisterMessage(Header)
+
+ReceiptLog = _reflection.GeneratedProtocolMessageType('ReceiptLog', (_message.Message,), {
+  'DESCRIPTOR' : _RECEIPTLOG,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.ReceiptLog)
+  })
+_sym_db.RegisterMessage(ReceiptLog)
+
+ReceiptData = _reflection.GeneratedProtocolMessageType('ReceiptData', (_message.Message,), {
+  'DESCRIPTOR' : _RECEIPTDATA,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.ReceiptData)
+  })
+_sym_db.RegisterMessage(ReceiptData)
+
+KeyValue = _reflection.GeneratedProtocolMessageType('KeyValue', (_message.Message,), {
+  'DESCRIPTOR' : _KEYVALUE,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.KeyValue)
+  })
+_sym_db.RegisterMessage(KeyValue)
+
+BlockDetail = _reflection.GeneratedProtocolMessageType('BlockDetail', (_message.Message,), {
+  'DESCRIPTOR' : _BLOCKDETAIL,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.BlockDetail)
+  })
+_sym_db.RegisterMessage(BlockDetail)
+
+BlockSequence = _reflection.GeneratedProtocolMessageType('BlockSequence', (_message.Message,), {
+  'DESCRIPTOR' : _BLOCKSEQUENCE,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.BlockSequence)
+  })
+_sym_db.RegisterMessage(BlockSequence)
+
+BlockSeq = _reflection.GeneratedProtocolMessageType('BlockSeq', (_message.Message,), {
+  'DESCRIPTOR' : _BLOCKSEQ,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.BlockSeq)
+  })
+_sym_db.RegisterMessage(BlockSeq)
+
+BlockSeqs = _reflection.GeneratedProtocolMessageType('BlockSeqs', (_message.Message,), {
+  'DESCRIPTOR' : _BLOCKSEQS,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.BlockSeqs)
+  })
+_sym_db.RegisterMessage(BlockSeqs)
+
+HeaderSeq = _reflection.GeneratedProtocolMessageType('HeaderSeq', (_message.Message,), {
+  'DESCRIPTOR' : _HEADERSEQ,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.HeaderSeq)
+  })
+_sym_db.RegisterMessage(HeaderSeq)
+
+HeaderSeqs = _reflection.GeneratedProtocolMessageType('HeaderSeqs', (_message.Message,), {
+  'DESCRIPTOR' : _HEADERSEQS,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.HeaderSeqs)
+  })
+_sym_db.RegisterMessage(HeaderSeqs)
+
+TxReceipts4SubscribePerBlk = _reflection.GeneratedProtocolMessageType('TxReceipts4SubscribePerBlk', (_message.Message,), {
+  'DESCRIPTOR' : _TXRECEIPTS4SUBSCRIBEPERBLK,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.TxReceipts4SubscribePerBlk)
+  })
+_sym_db.RegisterMessage(TxReceipts4SubscribePerBlk)
+
+TxReceipts4Subscribe = _reflection.GeneratedProtocolMessageType('TxReceipts4Subscribe', (_message.Message,), {
+  'DESCRIPTOR' : _TXRECEIPTS4SUBSCRIBE,
+  '__module__' : 'blockchain_pb2'
+  # @@protoc_insertion_point(class_scope:protobuf.TxReceipts4Subscribe)
+  })
+_sym_db.RegisterMessage(TxReceipts4Subscribe)
+
+
+# @@protoc_insertion_point(module_scope)
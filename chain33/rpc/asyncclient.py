@@ -0,0 +1,463 @@
+#!/usr/bin/python3
+
+import asyncio
+import itertools
+import json
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from chain33.crypto import pre
+from chain33.dapp import storage
+from chain33.protobuf import tx_pb2, storage_pb2
+from chain33.rpc import types, transport, codec
+from chain33.rpc.jsonclient import DefaultMaxBatchSize, batchPayload, matchBatch
+
+# 默认同时进行中的最大请求数
+DefaultConcurrency = 64
+
+
+# AsyncClient 基于asyncio的jsonclient，方法与client一一对应，需要安装aiohttp
+class AsyncClient(object):
+
+    def __init__(self, url, poolSize: int = transport.DefaultPoolSize, concurrency: int = DefaultConcurrency,
+                 connectTimeout: float = transport.DefaultConnectTimeout,
+                 readTimeout: float = transport.DefaultReadTimeout, maxBatchSize: int = DefaultMaxBatchSize,
+                 jsonCodec: codec.JsonCodec = None):
+        """
+        :param url: 节点rpc地址
+        :param poolSize: 保持的最大长连接数
+        :param concurrency: 同时进行中的最大请求数，超过时排队等待
+        :param connectTimeout: 建立连接超时时间(秒)
+        :param readTimeout: 读超时时间(秒)
+        :param maxBatchSize: CallMany单个批量请求包含的最大调用数
+        :param jsonCodec: 请求和响应的json编解码，默认安装了orjson时使用codec.OrjsonCodec，否则使用codec.JsonCodec
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp, please install it with: pip install aiohttp")
+        self.url = url
+        self.poolSize = poolSize
+        self.concurrency = concurrency
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connectTimeout, sock_read=readTimeout)
+        self.maxBatchSize = maxBatchSize
+        self.codec = jsonCodec if jsonCodec is not None else codec.Default()
+        self.ids = itertools.count(1)
+        # session和semaphore需要在事件循环中创建
+        self.session = None
+        self.semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.Close()
+
+    async def Close(self):
+        """
+        Close 关闭连接池
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def post(self, payload) -> json:
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.poolSize)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout,
+                                                 headers={'content-type': 'application/json'})
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        async with self.semaphore:
+            async with self.session.post(self.url, data=self.codec.Dumps(payload)) as response:
+                response.raise_for_status()
+                return self.codec.Loads(await response.read())
+
+    async def Call(self, method, params) -> json:
+        """
+        rpc调用通用接口
+        :param method:方法名称
+        :param params: 参数
+        :return: json对象
+        """
+        payload = {
+            "method": method,
+            "params": [params],
+            "jsonrpc": "2.0",
+            "id": next(self.ids)
+        }
+        return await self.post(payload)
+
+    async def CallMany(self, calls: list) -> list:
+        """
+        CallMany 以JSON-RPC 2.0批量请求的方式发送多个调用，各批次并发发送
+        :param calls: (方法名称, 参数)列表
+        :return: 与calls顺序一致的(result, error)列表
+        """
+        payloads = []
+        for i in range(0, len(calls), self.maxBatchSize):
+            payloads.append(batchPayload(self.ids, calls[i:i + self.maxBatchSize]))
+        resps = await asyncio.gather(*[self.post(payload) for payload in payloads])
+        results = []
+        for payload, resp in zip(payloads, resps):
+            results.extend(matchBatch(payload, resp))
+        return results
+
+    async def SendTransaction(self, tx: tx_pb2.Transaction) -> (str, str):
+        """
+        发送交易
+        """
+        hexTx = bytes.hex(tx.SerializeToString())
+        resp = await self.Call("Chain33.SendTransaction", {"data": hexTx})
+        return resp['result'], resp["error"]
+
+    async def QueryTransaction(self, txhash) -> (json, str):
+        """
+        QueryTransaction 查询交易信息
+        """
+        resp = await self.Call("Chain33.QueryTransaction", {"hash": txhash})
+        return resp['result'], resp["error"]
+
+    async def GetHexTxByHash(self, hash: str) -> (str, str):
+        """
+        GetHexTxByHash 根据哈希获取交易的字符串
+        """
+        resp = await self.Call("Chain33.GetHexTxByHash", {"hash": hash})
+        return resp['result'], resp["error"]
+
+    async def GetTxByAddr(self, addr: str, flag: int, count: int, direction: int, height: int,
+                          index: int) -> (list, str):
+        """
+        GetTxByAddr 根据地址获取交易信息
+        """
+        resp = await self.Call("Chain33.GetTxByAddr",
+                               {"addr": addr, "flag": flag, "count": count, "direction": direction, "height": height,
+                                "index": index})
+        if resp["error"] != None:
+            return [], resp["error"]
+        txInfos = []
+        for info in resp['result']['txInfos']:
+            txInfos.append(types.jsonToTxInfo(info))
+        return txInfos, resp["error"]
+
+    async def CreateNoBalanceTxs(self, txHexs: list, payAddr: str, privkey: str, expire: str) -> (str, str):
+        """
+        CreateNoBalanceTxs 构造多笔不收手续费的交易组
+        """
+        resp = await self.Call("Chain33.CreateNoBalanceTxs",
+                               {"txHexs": txHexs, "payAddr": payAddr, "privkey": privkey, "expire": expire, })
+        return resp['result'], resp['error']
+
+    async def GetLastHeader(self) -> (types.BlockHeader, str):
+        """
+        GetLastHeader 获取最新的区块头信息
+        """
+        resp = await self.Call("Chain33.GetLastHeader", None)
+        return types.jsonToBlockHeader(resp['result']), resp["error"]
+
+    async def GetVersion(self) -> (types.Version, str):
+        """
+        GetVersion 获取版本信息
+        """
+        resp = await self.Call("Chain33.Version", None)
+        if resp["error"] != None:
+            return None, resp["error"]
+        result = resp['result']
+        return types.Version(result['title'], result['app'], result['chain33'], result['localDb']), resp["error"]
+
+    async def GetBlocks(self, start: int, end: int, isDetail: bool) -> (json, str):
+        """
+        GetBlocks 获取区间区块
+        """
+        resp = await self.Call("Chain33.GetBlocks", {"start": start, "end": end, "isDetail": isDetail})
+        return resp['result'], resp["error"]
+
+    async def GetHeaders(self, start: int, end: int, isDetail: bool, pid: list) -> (json, str):
+        """
+        GetHeaders 获取区间区块头
+        """
+        resp = await self.Call("Chain33.GetHeaders", {"start": start, "end": end, "isDetail": isDetail, "pid": pid})
+        return resp['result'], resp["error"]
+
+    async def GetBlockHash(self, height: int) -> (str, str):
+        """
+        GetBlockHash 获取区块哈希
+        """
+        resp = await self.Call("Chain33.GetBlockHash", {"height": height})
+        return resp['result']['hash'], resp["error"]
+
+    async def GetLastBlockSequence(self) -> (int, str):
+        """
+        GetLastBlockSequence 获取最新区块得序列号
+        """
+        resp = await self.Call("Chain33.GetLastBlockSequence", None)
+        return resp['result'], resp["error"]
+
+    async def GetBlockSequences(self, start: int, end: int) -> (list, str):
+        """
+        GetBlockSequences 获取区间序列号对应的区块哈希和类型
+        """
+        resp = await self.Call("Chain33.GetBlockSequences", {"start": start, "end": end, "isDetail": False})
+        if resp["error"] != None:
+            return [], resp["error"]
+        return resp['result']['blkseqInfos'], resp["error"]
+
+    async def GetBlockByHashes(self, hashes: list, disableDetail: bool = False) -> (list, str):
+        """
+        GetBlockByHashes 根据区块哈希批量获取区块
+        """
+        resp = await self.Call("Chain33.GetBlockByHashes", {"hashes": hashes, "disableDetail": disableDetail})
+        if resp["error"] != None:
+            return [], resp["error"]
+        return resp['result']['items'], resp["error"]
+
+    async def AddPushSubscribe(self, name: str, url: str, encode: str, lastSequence: int, lastHeight: int,
+                               lastBlockHash: str, type: int, contract: dict) -> (bool, str):
+        """
+        AddPushSubscribe 注册区块（区块头）推送服务或者合约回执推送服务
+        """
+        resp = await self.Call("Chain33.AddPushSubscribe",
+                               {"name": name, "URL": url, "encode": encode, "lastSequence": lastSequence,
+                                "lastHeight": lastHeight, "lastBlockHash": lastBlockHash, "type": type,
+                                "contract": contract})
+        if resp["error"] != None:
+            return False, resp["error"]
+        return resp['result']['isOk'], resp['result']['msg']
+
+    async def ListPushes(self) -> (list, str):
+        """
+        ListPushes 列举推送服务
+        """
+        resp = await self.Call("Chain33.ListPushes", None)
+        return resp['result']['items'], resp["error"]
+
+    async def GetPushSeqLastNum(self, name: str) -> (int, str):
+        """
+        GetPushSeqLastNum 获取某推送服务最新序列号的值
+        """
+        resp = await self.Call("Chain33.GetPushSeqLastNum", {"data": name})
+        return resp['result']['data'], resp["error"]
+
+    async def IsSync(self) -> (bool, str):
+        """
+        IsSync 查询同步状态
+        """
+        resp = await self.Call("Chain33.IsSync", None)
+        return resp['result'], resp["error"]
+
+    async def GetCoinSymbol(self) -> (str, str):
+        """
+        GetCoinSymbol 获取主代币信息
+        """
+        resp = await self.Call("Chain33.GetCoinSymbol", None)
+        return resp['result']['data'], resp["error"]
+
+    # 钱包接口
+    async def Lock(self) -> (bool, str):
+        """
+        Lock 钱包加锁
+        """
+        resp = await self.Call("Chain33.Lock", None)
+        if resp["error"] != None:
+            return False, resp["error"]
+        return resp['result']['isOk'], resp['result']['msg']
+
+    async def UnLock(self, passwd: str, walletOrTicket: bool, timeout: int) -> (bool, str):
+        """
+        UnLock 解锁钱包
+        """
+        resp = await self.Call("Chain33.UnLock",
+                               {"passwd": passwd, "walletOrTicket": walletOrTicket, "timeout": timeout})
+        if resp["error"] != None:
+            return False, resp["error"]
+        return resp['result']['isOk'], resp['result']['msg']
+
+    async def SetPasswd(self, oldPass: str, newPass: str) -> (bool, str):
+        """
+        SetPasswd 设置/修改钱包密码
+        """
+        resp = await self.Call("Chain33.SetPasswd", {"oldPass": oldPass, "newPass": newPass})
+        if resp["error"] != None:
+            return False, resp["error"]
+        return resp['result']['isOk'], resp['result']['msg']
+
+    async def SetLabl(self, addr: str, label: str) -> (types.LabelAcc, str):
+        """
+        SetLabl 设置账户标签
+        """
+        resp = await self.Call("Chain33.SetLabl", {"addr": addr, "label": label})
+        return types.jsonToLabelAcc(resp['result']), resp['error']
+
+    async def NewAccount(self, label: str) -> (types.LabelAcc, str):
+        """
+        NewAccount 创建账户
+        """
+        resp = await self.Call("Chain33.NewAccount", {"label": label})
+        return types.jsonToLabelAcc(resp['result']), resp['error']
+
+    async def GetAccounts(self, withoutBalance: bool) -> (list, str):
+        """
+        GetAccounts 获取账户列表
+        """
+        resp = await self.Call("Chain33.GetAccounts", {"withoutBalance": withoutBalance})
+        wallets = resp['result']['wallets']
+        list = []
+        for wallet in wallets:
+            list.append(types.jsonToLabelAcc(wallet))
+        return list, resp['error']
+
+    async def MergeBalance(self, to: str) -> (list, str):
+        """
+        MergeBalance 合并账户余额
+        """
+        resp = await self.Call("Chain33.MergeBalance", {"to": to})
+        return resp['result']['hashes'], resp['error']
+
+    async def ImportPrivKey(self, privkey: str, label: str) -> (types.LabelAcc, str):
+        """
+        ImportPrivKey 导入私钥
+        """
+        resp = await self.Call("Chain33.ImportPrivKey", {"privkey": privkey, "label": label})
+        return types.jsonToLabelAcc(resp['result']), resp['error']
+
+    async def DumpPrivkey(self, addr: str) -> (str, str):
+        """
+        DumpPrivkey 导出私钥
+        """
+        resp = await self.Call("Chain33.DumpPrivkey", {"data": addr})
+        return resp['result']['data'], resp['error']
+
+    async def SetTxFee(self, amount: int) -> (bool, str):
+        """
+        SetTxFee 设置交易费用
+        """
+        resp = await self.Call("Chain33.SetTxFee", {"amount": amount})
+        if resp["error"] != None:
+            return False, resp["error"]
+        return resp['result']['isOk'], resp['result']['msg']
+
+    async def SendToAddress(self, fromAddr: str, toAddr: str, amount: int, note: str, isToken: bool,
+                            tokenSymbol: str) -> (str, str):
+        """
+        SendToAddress 在线发送转账交易
+        """
+        resp = await self.Call("Chain33.SendToAddress", {"from": fromAddr, "to": toAddr, "amount": amount,
+                                                         "note": note, "isToken": isToken, "tokenSymbol": tokenSymbol})
+        return resp['result']['hash'], resp['error']
+
+    async def SignRawTx(self, addr: str, privkey: str, txHex: str, expire: str, index: int):
+        """
+        SignRawTx 在线签名交易
+        """
+        resp = await self.Call("Chain33.SignRawTx", {"addr": addr, "privkey": privkey, "txHex": txHex,
+                                                     "expire": expire, "index": index})
+        return resp['result']['txHex'], resp['error']
+
+    async def GenSeed(self, lang: int) -> (str, str):
+        """
+        GenSeed 生成随机的seed
+        """
+        resp = await self.Call("Chain33.GenSeed", {"lang": lang})
+        return resp['result']['seed'], resp['error']
+
+    async def SaveSeed(self, seed: str, paaswd: str) -> (bool, str):
+        """
+        SaveSeed 保存seed
+        """
+        resp = await self.Call("Chain33.SaveSeed", {"seed": seed, "passwd": paaswd})
+        if resp["error"] != None:
+            return False, resp["error"]
+        return resp['result']['isOk'], resp['result']['msg']
+
+    async def GetSeed(self, passwd: str) -> (str, str):
+        """
+        GetSeed 获取钱包的seed
+        """
+        resp = await self.Call("Chain33.GetSeed", {"passwd": passwd})
+        return resp['result']['seed'], resp["error"]
+
+    async def GetWalletStatus(self) -> (json, str):
+        """
+        GetWalletStatus 获取钱包状态
+        """
+        resp = await self.Call("Chain33.GetWalletStatus", None)
+        return resp['result'], resp["error"]
+
+    # Dapp 通用的在线构造Transaction的接口
+    async def CreateTransaction(self, execer: str, actionName: str, payload: json) -> (str, str):
+        """
+        CreateTransaction 通用的在线构造Transaction的接口
+        """
+        resp = await self.Call("Chain33.CreateTransaction",
+                               {"execer": execer, "actionName": actionName, "payload": payload})
+        return resp['result'], resp["error"]
+
+    # 通用的查询接口
+    async def Query(self, execer: str, funcName: str, payload: json) -> (json, str):
+        """
+        Query 通用的查询接口
+        """
+        resp = await self.Call("Chain33.Query", {"execer": execer, "funcName": funcName, "payload": payload})
+        return resp['result'], resp["error"]
+
+    async def SendKeyFragment(self, pubOwner: str, pubRecipient: str, pubProofR: str, pubProofU: str,
+                              random: str, value: str, expire: int, dhProof: str, precurPub: str) -> bool:
+        """
+        SendKeyFragment 发送重加密密钥分片给重加密节点
+        """
+        requestParam = {}
+        requestParam["pubOwner"] = pubOwner
+        requestParam["pubRecipient"] = pubRecipient
+        requestParam["pubProofR"] = pubProofR
+        requestParam["pubProofU"] = pubProofU
+        requestParam["random"] = random
+        requestParam["value"] = value
+        requestParam["expire"] = expire
+        requestParam["dhProof"] = dhProof
+        requestParam["precurPub"] = precurPub
+
+        resp = await self.Call("Pre.CollectFragment", requestParam)
+        return resp["result"]["result"]
+
+    async def Reencrypt(self, pubOwner: str, pubRecipient: str) -> pre.ReKeyFrag:
+        """
+        Reencrypt 申请重加密
+        """
+        requestParam = {}
+        requestParam["pubOwner"] = pubOwner
+        requestParam["pubRecipient"] = pubRecipient
+        resp = await self.Call("Pre.Reencrypt", requestParam)
+        result = resp["result"]
+        return pre.ReKeyFrag(result["reKeyR"], result["reKeyU"], result["random"], result["precurPub"])
+
+    async def QueryBalance(self, addr: str, execer: str, asset_exec: str, asset_symbol: str) -> (types.Account, str):
+        """
+        QueryBalance 查询余额
+        """
+        params = {
+            "addresses": [
+                addr
+            ],
+            "execer": execer,
+            "asset_exec": asset_exec,
+            "asset_symbol": asset_symbol
+        }
+        resp = await self.Call("Chain33.GetBalance", params)
+        return types.jsonToClass(resp["result"][0]), resp["error"]
+
+    async def QueryStorage(self, title: str, txHash: str) -> (storage_pb2.Storage, str):
+        """
+        QueryStorage 查询存证信息
+        """
+        params = {
+            "execer": title + "storage",
+            "funcName": "QueryStorage",
+            "payload": {
+                "txHash": txHash
+            }
+        }
+        resp = await self.Call("Chain33.Query", params)
+        # 添加解析函数
+        result = resp["result"]
+        return storage.parseJsonToStorage(result), resp["error"]
+
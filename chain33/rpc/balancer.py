@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+
+import itertools
+import json
+import random
+import threading
+import time
+
+from chain33.rpc import transport
+
+# 节点选择策略
+RoundRobin = "round-robin"
+LeastOutstanding = "least-outstanding"
+LatencyWeighted = "latency-weighted"
+
+# 默认连续失败多少次后摘除节点
+DefaultMaxFailures = 3
+# 默认后台探测节点状态的间隔(秒)
+DefaultProbeInterval = 5.0
+
+# 只读方法，可以分发到任意健康节点，其他方法(发送交易，钱包操作，推送订阅等)只发给首选节点
+ReadMethods = frozenset([
+    "Chain33.QueryTransaction",
+    "Chain33.GetHexTxByHash",
+    "Chain33.GetTxByAddr",
+    "Chain33.GetTxByHashes",
+    "Chain33.GetLastHeader",
+    "Chain33.Version",
+    "Chain33.GetBlocks",
+    "Chain33.GetHeaders",
+    "Chain33.GetBlockHash",
+    "Chain33.GetBlockOverview",
+    "Chain33.GetLastBlockSequence",
+    "Chain33.IsSync",
+    "Chain33.GetCoinSymbol",
+    "Chain33.GetBalance",
+    "Chain33.Query",
+    "Chain33.GetPeerInfo",
+    "Chain33.GetNetInfo",
+])
+
+
+# Endpoint 一个节点及其统计信息
+class Endpoint(object):
+    def __init__(self, url: str, trans: transport.HttpTransport):
+        self.url = url
+        self.transport = trans
+        # 进行中的请求数
+        self.outstanding = 0
+        # 延迟的指数加权平均值(秒)，None表示还没有样本
+        self.latency = None
+        # 连续失败次数
+        self.failures = 0
+        self.healthy = True
+
+
+# Balancer 在多个节点间分发请求，摘除不同步或者连续失败的节点，并在后台探测恢复
+class Balancer(object):
+    def __init__(self, urls: list, strategy: str = RoundRobin, poolSize: int = transport.DefaultPoolSize,
+                 connectTimeout: float = transport.DefaultConnectTimeout,
+                 readTimeout: float = transport.DefaultReadTimeout, maxFailures: int = DefaultMaxFailures,
+                 probeInterval: float = DefaultProbeInterval):
+        """
+        :param urls: 节点rpc地址列表，排在前面的节点优先处理写请求
+        :param strategy: 读请求的节点选择策略: RoundRobin, LeastOutstanding, LatencyWeighted
+        :param poolSize: 每个节点保持的最大长连接数
+        :param connectTimeout: 建立连接超时时间(秒)
+        :param readTimeout: 读超时时间(秒)
+        :param maxFailures: 连续失败多少次后摘除节点
+        :param probeInterval: 后台探测节点状态的间隔(秒)，0表示不探测
+        """
+        if len(urls) == 0:
+            raise ValueError("Error: at least one endpoint is required.")
+        if strategy not in (RoundRobin, LeastOutstanding, LatencyWeighted):
+            raise ValueError("Error: strategy is not correct.")
+        self.endpoints = [Endpoint(url, transport.HttpTransport(url, poolSize=poolSize, connectTimeout=connectTimeout,
+                                                                readTimeout=readTimeout)) for url in urls]
+        self.strategy = strategy
+        self.maxFailures = maxFailures
+        self.probeInterval = probeInterval
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.stopped = threading.Event()
+        self.prober = None
+        if len(self.endpoints) > 1 and probeInterval > 0:
+            self.prober = threading.Thread(target=self.probeLoop, daemon=True)
+            self.prober.start()
+
+    def Healthy(self) -> list:
+        """
+        Healthy 当前健康的节点，全部被摘除时返回所有节点，尽量保证请求还能发出去
+        """
+        healthy = [ep for ep in self.endpoints if ep.healthy]
+        if len(healthy) == 0:
+            return self.endpoints
+        return healthy
+
+    def Pick(self, exclude=()) -> Endpoint:
+        """
+        Pick 按策略为读请求选择一个节点
+        :param exclude: 本次请求已经尝试失败的节点
+        :return: Endpoint
+        """
+        candidates = [ep for ep in self.Healthy() if ep not in exclude]
+        if len(candidates) == 0:
+            candidates = [ep for ep in self.endpoints if ep not in exclude] or self.endpoints
+        if len(candidates) == 1:
+            return candidates[0]
+        if self.strategy == LeastOutstanding:
+            start = next(self.counter) % len(candidates)
+            rotated = candidates[start:] + candidates[:start]
+            return min(rotated, key=lambda ep: ep.outstanding)
+        if self.strategy == LatencyWeighted:
+            measured = [ep.latency for ep in candidates if ep.latency is not None]
+            default = sum(measured) / len(measured) if measured else 1.0
+            weights = [1.0 / max(ep.latency if ep.latency is not None else default, 1e-4) for ep in candidates]
+            return random.choices(candidates, weights=weights)[0]
+        return candidates[next(self.counter) % len(candidates)]
+
+    def Primary(self) -> Endpoint:
+        """
+        Primary 写请求使用的首选节点，即列表中第一个健康的节点
+        """
+        return self.Healthy()[0]
+
+    def Begin(self, ep: Endpoint):
+        with self.lock:
+            ep.outstanding += 1
+
+    def Done(self, ep: Endpoint, latency: float, ok: bool):
+        """
+        Done 记录一次请求的结果，连续失败达到maxFailures次后摘除节点
+        """
+        with self.lock:
+            ep.outstanding -= 1
+            if ok:
+                ep.failures = 0
+                if ep.latency is None:
+                    ep.latency = latency
+                else:
+                    ep.latency = 0.8 * ep.latency + 0.2 * latency
+            else:
+                ep.failures += 1
+                if ep.failures >= self.maxFailures:
+                    ep.healthy = False
+
+    def Post(self, ep: Endpoint, data: bytes, stream: bool = False):
+        """
+        Post 通过指定节点发送请求并记录统计信息，stream为True时只统计到收到响应头
+        """
+        self.Begin(ep)
+        start = time.perf_counter()
+        try:
+            response = ep.transport.Post(data, stream)
+        except Exception:
+            self.Done(ep, time.perf_counter() - start, False)
+            raise
+        self.Done(ep, time.perf_counter() - start, True)
+        return response
+
+    def Probe(self, ep: Endpoint) -> bool:
+        """
+        Probe 通过IsSync探测节点，未同步或者请求失败时摘除节点，恢复后重新加入
+        :return: 节点是否健康
+        """
+        payload = {"method": "Chain33.IsSync", "params": [None], "jsonrpc": "2.0", "id": 0}
+        try:
+            synced = ep.transport.Post(json.dumps(payload)).json().get("result") == True
+        except Exception:
+            synced = False
+        with self.lock:
+            ep.healthy = synced
+            if synced:
+                ep.failures = 0
+        return synced
+
+    def probeLoop(self):
+        while not self.stopped.wait(self.probeInterval):
+            for ep in self.endpoints:
+                if self.stopped.is_set():
+                    return
+                self.Probe(ep)
+
+    def Warmup(self, connections: int = 0) -> int:
+        return sum(ep.transport.Warmup(connections) for ep in self.endpoints)
+
+    def Close(self):
+        self.stopped.set()
+        for ep in self.endpoints:
+            ep.transport.Close()
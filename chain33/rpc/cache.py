@@ -0,0 +1,126 @@
+#!/usr/bin/python3
+
+import collections
+import threading
+import time
+
+# 默认缓存条目数
+DefaultMaxSize = 10000
+# 默认最终确认深度，低于 最新高度-FinalityDepth 的区块数据视为不可变
+DefaultFinalityDepth = 12
+
+
+# Policy 单个方法的缓存策略
+class Policy(object):
+    def __init__(self, ttl: float = None, unconfirmedTtl: float = 0):
+        """
+        :param ttl: 条目过期时间(秒)，None表示永不过期，0表示不缓存该方法
+        :param unconfirmedTtl: 高度还在最终确认深度以内(或者最新高度未知)的条目的过期时间(秒)，0表示不缓存
+        """
+        self.ttl = ttl
+        self.unconfirmedTtl = unconfirmedTtl
+
+
+# 默认的缓存策略，只缓存不会改变或者很少改变的数据
+DefaultPolicies = {
+    "Chain33.GetBlockHash": Policy(ttl=None, unconfirmedTtl=1),
+    "Chain33.GetHexTxByHash": Policy(ttl=None),
+    "Chain33.QueryTransaction": Policy(ttl=None, unconfirmedTtl=1),
+    "Chain33.GetCoinSymbol": Policy(ttl=3600),
+    "Chain33.Version": Policy(ttl=300),
+}
+
+
+# LRUCache 有大小限制的内存LRU缓存，client的封装方法在调用Call之前先查询缓存
+class LRUCache(object):
+    def __init__(self, maxSize: int = DefaultMaxSize, policies: dict = None,
+                 finalityDepth: int = DefaultFinalityDepth):
+        """
+        :param maxSize: 最大条目数，超过时淘汰最久未使用的条目
+        :param policies: 方法名称到Policy的映射，会覆盖DefaultPolicies中的同名方法
+        :param finalityDepth: 最终确认深度
+        """
+        self.maxSize = maxSize
+        self.policies = dict(DefaultPolicies)
+        if policies is not None:
+            self.policies.update(policies)
+        self.finalityDepth = finalityDepth
+        self.tip = None
+        self.lock = threading.Lock()
+        # (method, key) -> (value, 过期时间, 高度)
+        self.entries = collections.OrderedDict()
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+
+    def ObserveHeight(self, height: int):
+        """
+        ObserveHeight 更新已知的最新高度，用于判断数据是否已经最终确认
+        """
+        with self.lock:
+            if self.tip is None or height > self.tip:
+                self.tip = height
+
+    def Get(self, method: str, key) -> (bool, object):
+        """
+        Get 查询缓存
+        :return: 是否命中，缓存的值
+        """
+        with self.lock:
+            entry = self.entries.get((method, key))
+            if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+                self.entries.move_to_end((method, key))
+                self.hits[method] += 1
+                return True, entry[0]
+            if entry is not None:
+                del self.entries[(method, key)]
+            self.misses[method] += 1
+            return False, None
+
+    def Put(self, method: str, key, value, height: int = None):
+        """
+        Put 按方法的缓存策略写入缓存
+        :param height: 数据所在的区块高度，用于最终确认判断和回滚时失效
+        """
+        policy = self.policies.get(method)
+        if policy is None:
+            return
+        ttl = policy.ttl
+        with self.lock:
+            if height is not None and (self.tip is None or height > self.tip - self.finalityDepth):
+                ttl = policy.unconfirmedTtl
+            if ttl == 0:
+                return
+            expire = None if ttl is None else time.monotonic() + ttl
+            self.entries[(method, key)] = (value, expire, height)
+            self.entries.move_to_end((method, key))
+            while len(self.entries) > self.maxSize:
+                self.entries.popitem(last=False)
+
+    def InvalidateAbove(self, height: int) -> int:
+        """
+        InvalidateAbove 区块回滚时删除高度大于height的条目
+        :return: 删除的条目数
+        """
+        with self.lock:
+            stale = [k for k, entry in self.entries.items() if entry[2] is not None and entry[2] > height]
+            for k in stale:
+                del self.entries[k]
+            if self.tip is not None and self.tip > height:
+                self.tip = height
+            return len(stale)
+
+    def Clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def Stats(self) -> dict:
+        """
+        Stats 缓存统计信息
+        :return: size: 条目数, hits: 命中数, misses: 未命中数, methods: 各方法的命中和未命中数
+        """
+        with self.lock:
+            methods = {}
+            for method in set(self.hits) | set(self.misses):
+                methods[method] = {"hits": self.hits[method], "misses": self.misses[method]}
+            return {"size": len(self.entries), "hits": sum(self.hits.values()),
+                    "misses": sum(self.misses.values()), "methods": methods}
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# JsonCodec 标准库json编解码，输出紧凑格式且不转义非ASCII字符，与OrjsonCodec的输出逐字节一致
+class JsonCodec(object):
+    name = "json"
+
+    def Dumps(self, obj) -> bytes:
+        """
+        Dumps 编码请求
+        :param obj: json对象
+        :return: utf-8编码的请求体
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def Loads(self, data: bytes):
+        """
+        Loads 解码响应
+        :param data: 响应体
+        :return: json对象
+        """
+        return json.loads(data)
+
+
+# OrjsonCodec 基于orjson的编解码，需要安装orjson: pip install chain33[fast]
+# orjson不支持的输入(超过64位的整数，非字符串的key等)退回到标准库，保证结果与JsonCodec一致
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson, install it with: pip install chain33[fast]")
+
+    def Dumps(self, obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return super().Dumps(obj)
+
+    def Loads(self, data: bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().Loads(data)
+
+
+def Default() -> JsonCodec:
+    """
+    Default 安装了orjson时使用OrjsonCodec，否则使用JsonCodec
+    """
+    return OrjsonCodec() if orjson is not None else JsonCodec()
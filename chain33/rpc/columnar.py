@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+
+import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# 整数列和字符串列
+IntColumns = ("height", "index", "fee", "amount")
+StrColumns = ("hash", "execer", "symbol")
+Columns = ("height", "index", "hash", "execer", "fee", "amount", "symbol")
+
+
+# payloadSymbol 从解码后的payload中取资产符号，比如token转账的cointoken，coins转账为空表示主链币
+def payloadSymbol(payload) -> str:
+    if not isinstance(payload, dict):
+        return ""
+    for action in payload.values():
+        if isinstance(action, dict) and "cointoken" in action:
+            return action["cointoken"]
+    return ""
+
+
+# TxTable 按列保存交易，整数列使用array.array，字符串列使用list，不为每笔交易创建对象
+# 由jsonstream边接收响应边逐个解析区块或者交易详情，解析出的json元素直接追加到列中，不创建types.TxInfo对象，
+# 也不需要等待整个响应解析完成
+class TxTable(object):
+    def __init__(self):
+        for name in IntColumns:
+            setattr(self, name, array.array('q'))
+        for name in StrColumns:
+            setattr(self, name, [])
+
+    def __len__(self):
+        return len(self.height)
+
+    def Append(self, height: int, index: int, hash_str: str, execer: str, fee: int, amount: int, symbol: str):
+        self.height.append(height)
+        self.index.append(index)
+        self.hash.append(hash_str)
+        self.execer.append(execer)
+        self.fee.append(fee)
+        self.amount.append(amount)
+        self.symbol.append(symbol)
+
+    def AppendBlock(self, item: dict):
+        """
+        AppendBlock 追加区块中的全部交易，资产符号从payload中取
+        :param item: GetBlocks结果items中的一项
+        """
+        block = item["block"]
+        height = block["height"]
+        for i, tx in enumerate(block.get("txs") or []):
+            self.Append(height, i, tx.get("hash", ""), tx["execer"], tx.get("fee", 0), tx.get("amount", 0),
+                        payloadSymbol(tx.get("payload")))
+
+    def AppendTxDetail(self, detail: dict):
+        """
+        AppendTxDetail 追加GetTxByHashes返回的一笔交易详情，每个资产一行，没有资产的交易一行
+        execer和fee取自交易本身，amount和symbol取自资产
+        :param detail: GetTxByHashes结果txs中的一项
+        """
+        tx = detail.get("tx")
+        # 节点对不存在的交易返回空的tx
+        if not tx:
+            return
+        assets = detail.get("assets") or [{"symbol": "", "amount": detail.get("amount", 0)}]
+        for asset in assets:
+            self.Append(detail["height"], detail["index"], tx.get("hash", ""), tx["execer"], tx.get("fee", 0),
+                        asset["amount"], asset["symbol"])
+
+    def Columns(self) -> dict:
+        """
+        Columns 列名到列数据的映射，安装了numpy时为numpy数组，否则为array.array和list，都是复制的数据，修改不会影响表
+        """
+        if numpy is None:
+            return {name: getattr(self, name)[:] for name in Columns}
+        columns = {}
+        for name in Columns:
+            if name in IntColumns:
+                columns[name] = numpy.frombuffer(getattr(self, name), dtype=numpy.int64).copy()
+            else:
+                columns[name] = numpy.array(getattr(self, name), dtype=str)
+        return columns
+
+    def arrow(self):
+        if pyarrow is None:
+            raise ImportError("TxTable requires pyarrow to write parquet/arrow, install it with: "
+                              "pip install chain33[columnar]")
+        # pyarrow依赖numpy，整数列直接从numpy数组构建
+        columns = self.Columns()
+        return pyarrow.table({name: pyarrow.array(columns[name]) if name in IntColumns
+                              else pyarrow.array(getattr(self, name), type=pyarrow.string()) for name in Columns})
+
+    def WriteParquet(self, path: str):
+        """
+        WriteParquet 写入parquet文件，需要安装pyarrow
+        """
+        pyarrow.parquet.write_table(self.arrow(), path)
+
+    def WriteArrow(self, path: str):
+        """
+        WriteArrow 写入arrow(feather v2)文件，需要安装pyarrow
+        """
+        pyarrow.feather.write_feather(self.arrow(), path)
+
+    def WriteNpz(self, path: str):
+        """
+        WriteNpz 写入numpy的npz文件，需要安装numpy
+        """
+        if numpy is None:
+            raise ImportError("TxTable requires numpy to write npz, install it with: pip install chain33[columnar]")
+        numpy.savez_compressed(path, **self.Columns())
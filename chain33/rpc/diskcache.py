@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+
+import collections
+import os
+import sqlite3
+import threading
+import time
+
+from chain33.protobuf import storage_pb2
+
+# 默认每张表的最大条目数
+DefaultMaxEntries = 1000000
+# 每写入多少条检查一次是否需要淘汰
+evictEvery = 1000
+# 命中时访问时间的更新间隔(秒)，避免每次读都写库
+touchInterval = 60
+
+tables = ("txs", "storage", "sigs")
+
+
+# DiskCache 基于SQLite的持久化缓存，保存已打包交易的原始字节、存证记录和验签结果，多个进程可以共享同一个文件
+class DiskCache(object):
+    def __init__(self, path: str, maxEntries: int = DefaultMaxEntries, timeout: float = 30.0):
+        """
+        :param path: 数据库文件路径
+        :param maxEntries: 每张表的最大条目数，超过时淘汰最久未访问的条目
+        :param timeout: 其他进程持有写锁时的等待时间(秒)
+        """
+        self.path = path
+        self.maxEntries = maxEntries
+        self.timeout = timeout
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.puts = 0
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+        conn = self.conn()
+        with conn:
+            for table in tables:
+                conn.execute("CREATE TABLE IF NOT EXISTS %s (key TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                             "atime REAL NOT NULL)" % table)
+                conn.execute("CREATE INDEX IF NOT EXISTS %s_atime ON %s (atime)" % (table, table))
+
+    def conn(self) -> sqlite3.Connection:
+        # sqlite连接不能跨线程和fork后的进程使用，每个线程每个进程单独打开
+        conn = getattr(self.local, "conn", None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def get(self, table: str, key: str):
+        conn = self.conn()
+        row = conn.execute("SELECT data, atime FROM %s WHERE key = ?" % table, (key,)).fetchone()
+        if row is None:
+            with self.lock:
+                self.misses[table] += 1
+            return None
+        with self.lock:
+            self.hits[table] += 1
+        now = time.time()
+        if now - row[1] > touchInterval:
+            conn.execute("UPDATE %s SET atime = ? WHERE key = ?" % table, (now, key))
+        return row[0]
+
+    def put(self, table: str, key: str, data: bytes):
+        conn = self.conn()
+        conn.execute("INSERT OR REPLACE INTO %s (key, data, atime) VALUES (?, ?, ?)" % table,
+                     (key, sqlite3.Binary(data), time.time()))
+        with self.lock:
+            self.puts += 1
+            evict = self.puts % evictEvery == 0
+        if evict:
+            self.Evict()
+
+    def Evict(self) -> int:
+        """
+        Evict 淘汰超过maxEntries的最久未访问条目
+        :return: 淘汰的条目数
+        """
+        conn = self.conn()
+        evicted = 0
+        for table in tables:
+            count = conn.execute("SELECT COUNT(*) FROM %s" % table).fetchone()[0]
+            if count > self.maxEntries:
+                cursor = conn.execute("DELETE FROM %s WHERE key IN (SELECT key FROM %s ORDER BY atime LIMIT ?)"
+                                      % (table, table), (count - self.maxEntries,))
+                evicted += cursor.rowcount
+        return evicted
+
+    def GetTx(self, txHash: str) -> bytes:
+        """
+        GetTx 查询交易原始字节
+        :param txHash: 交易哈希
+        :return: 交易原始字节，未缓存时返回None
+        """
+        return self.get("txs", txHash.lower())
+
+    def PutTx(self, txHash: str, data: bytes):
+        """
+        PutTx 缓存交易原始字节
+        :param txHash: 交易哈希
+        :param data: 交易原始字节
+        """
+        self.put("txs", txHash.lower(), data)
+
+    def GetStorage(self, key: str) -> storage_pb2.Storage:
+        """
+        GetStorage 查询存证记录
+        :param key: 存证的交易哈希或者唯一标识key
+        :return: storage_pb2.Storage，未缓存时返回None
+        """
+        data = self.get("storage", key)
+        if data is None:
+            return None
+        storage = storage_pb2.Storage()
+        storage.ParseFromString(data)
+        return storage
+
+    def PutStorage(self, key: str, storage: storage_pb2.Storage):
+        """
+        PutStorage 缓存存证记录
+        :param key: 存证的交易哈希或者唯一标识key
+        :param storage: storage_pb2.Storage
+        """
+        self.put("storage", key, storage.SerializeToString())
+
+    def GetSig(self, key: bytes):
+        """
+        GetSig 查询验签结果
+        :param key: sigcache.Key返回的key
+        :return: True或False，未缓存时返回None
+        """
+        data = self.get("sigs", key.hex())
+        if data is None:
+            return None
+        return data == b"\x01"
+
+    def PutSig(self, key: bytes, valid: bool):
+        """
+        PutSig 缓存验签结果
+        :param key: sigcache.Key返回的key
+        :param valid: 验签结果
+        """
+        self.put("sigs", key.hex(), b"\x01" if valid else b"\x00")
+
+    def Stats(self) -> dict:
+        """
+        Stats 当前进程的命中统计
+        :return: 每张表的hits和misses
+        """
+        with self.lock:
+            return {table: {"hits": self.hits[table], "misses": self.misses[table]} for table in tables}
+
+    def Close(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
@@ -0,0 +1,224 @@
+#!/usr/bin/python3
+
+import json
+import os
+import threading
+import time
+
+from chain33.rpc import pager
+
+# 序列号类型，与GetBlockSequences返回的type一致
+AddBlock = 1
+DelBlock = 2
+
+# 默认每批获取的序列号数
+DefaultBatchSize = 100
+# 默认连续失败多少次后停止重试，把最后一次的异常抛给调用方
+DefaultMaxErrors = 10
+
+
+# BlockEvent 一个序列号对应的区块新增或者回滚事件
+class BlockEvent(object):
+    def __init__(self, seq: int, ty: int, hash_str: str, block):
+        self.seq = seq
+        self.type = ty
+        self.hash = hash_str
+        # GetBlockByHashes返回的一项，包含block和receipts，节点没有该区块时为None
+        self.block = block
+        self.height = block["block"]["height"] if block is not None else None
+
+    @property
+    def rollback(self) -> bool:
+        return self.type == DelBlock
+
+    def __repr__(self):
+        return "BlockEvent(seq=%d, %s, height=%s, hash=%s)" % (self.seq, "del" if self.rollback else "add",
+                                                              self.height, self.hash)
+
+
+# Checkpoint 保存已处理的最大序列号，先写临时文件再原子替换，进程崩溃时不会留下不完整的文件
+class Checkpoint(object):
+    def __init__(self, path: str):
+        self.path = path
+
+    def Load(self) -> (int, str):
+        """
+        Load 读取保存的位置
+        :return: 序列号和对应的区块哈希，没有保存过时返回-1和None
+        """
+        try:
+            with open(self.path) as f:
+                obj = json.load(f)
+        except FileNotFoundError:
+            return -1, None
+        return obj["seq"], obj.get("hash")
+
+    def Save(self, seq: int, hash_str: str):
+        """
+        Save 保存位置
+        :param seq: 已处理的最大序列号
+        :param hash_str: 该序列号对应的区块哈希
+        """
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"seq": seq, "hash": hash_str}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+# Follower 按序列号跟随链，依次返回区块新增和回滚事件
+# 落后时按批获取，追上后根据估计的出块间隔轮询，配置了推送接收器时收到推送立即获取
+class Follower(object):
+    def __init__(self, jclient, checkpoint: str = None, start: int = 0, batchSize: int = DefaultBatchSize,
+                 isDetail: bool = True, minInterval: float = 0.2, maxInterval: float = 5.0, receiver=None,
+                 prefetch: int = 1, maxErrors: int = DefaultMaxErrors):
+        """
+        :param jclient: jsonclient.client
+        :param checkpoint: 位置文件路径，存在时从保存的位置之后继续，None表示不保存
+        :param start: 没有保存的位置时从哪个序列号开始
+        :param batchSize: 每批获取的序列号数
+        :param isDetail: 是否获取交易回执
+        :param minInterval: 最小轮询间隔(秒)
+        :param maxInterval: 最大轮询间隔(秒)
+        :param receiver: push.PushReceiver，只用作新区块的通知，区块数据仍然通过rpc获取
+        :param prefetch: 落后时最多提前获取的批数
+        :param maxErrors: 获取连续失败的最大次数，超过时Events抛出最后一次的异常，0表示一直重试
+        """
+        self.client = jclient
+        self.checkpoint = Checkpoint(checkpoint) if checkpoint is not None else None
+        self.batchSize = batchSize
+        self.isDetail = isDetail
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.receiver = receiver
+        self.prefetch = prefetch
+        self.maxErrors = maxErrors
+        self.seq, self.hash = start - 1, None
+        if self.checkpoint is not None:
+            seq, hash_str = self.checkpoint.Load()
+            if seq >= 0:
+                self.seq, self.hash = seq, hash_str
+                self.verify()
+        self.errors = 0
+        self.consecutiveErrors = 0
+        self.lastError = None
+        self.blockInterval = None
+        self.lastBlockAt = None
+        self.stopped = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Close()
+
+    def verify(self):
+        # 节点重新同步后序列号对应的区块会变化，保存的位置不再可用
+        if self.hash is None:
+            return
+        seqs, err = self.client.GetBlockSequences(self.seq, self.seq)
+        if err != None:
+            raise Exception(err)
+        if len(seqs) != 1 or seqs[0]["hash"] != self.hash:
+            raise Exception("ErrCheckpointMismatch")
+
+    def fetch(self, start: int) -> list:
+        last, err = self.client.GetLastBlockSequence()
+        if err != None:
+            raise Exception(err)
+        if last < start:
+            return []
+        end = min(last, start + self.batchSize - 1)
+        seqs, err = self.client.GetBlockSequences(start, end)
+        if err != None:
+            raise Exception(err)
+        blocks, err = self.client.GetBlockByHashes([s["hash"] for s in seqs], not self.isDetail)
+        if err != None:
+            raise Exception(err)
+        return [BlockEvent(start + i, s["type"], s["hash"], blocks[i] if i < len(blocks) else None)
+                for i, s in enumerate(seqs)]
+
+    def nextInterval(self) -> float:
+        # 估计下一个区块的出块时间，出块前少轮询，临近出块时按最小间隔轮询
+        if self.blockInterval is None or self.lastBlockAt is None:
+            return self.minInterval
+        remain = self.lastBlockAt + self.blockInterval - time.monotonic()
+        return max(self.minInterval, min(self.maxInterval, remain))
+
+    def observe(self):
+        now = time.monotonic()
+        if self.lastBlockAt is not None:
+            interval = now - self.lastBlockAt
+            self.blockInterval = interval if self.blockInterval is None else \
+                0.7 * self.blockInterval + 0.3 * interval
+        self.lastBlockAt = now
+
+    def wait(self, interval: float):
+        if self.receiver is None:
+            self.stopped.wait(interval)
+            return
+        # 收到推送说明有新区块，取出所有积压的推送后立即获取
+        if self.receiver.Get(timeout=interval) is not None:
+            while self.receiver.Get(timeout=0) is not None:
+                pass
+
+    def batches(self, done: threading.Event):
+        start = self.seq + 1
+        while not self.stopped.is_set() and not done.is_set():
+            try:
+                events = self.fetch(start)
+            except Exception as e:
+                self.errors += 1
+                self.consecutiveErrors += 1
+                self.lastError = e
+                if self.maxErrors > 0 and self.consecutiveErrors >= self.maxErrors:
+                    raise
+                self.wait(self.maxInterval)
+                continue
+            self.consecutiveErrors = 0
+            if len(events) == 0:
+                self.wait(self.nextInterval())
+                continue
+            if len(events) < self.batchSize:
+                self.observe()
+            start = events[-1].seq + 1
+            yield events
+
+    def Events(self):
+        """
+        Events 按序列号顺序返回区块事件，直到调用Close
+        回滚事件(rollback为True)按回滚顺序从高到低返回，处理方应撤销该区块的影响
+        每批事件都被消费后保存一次位置，重启后从未确认的批次重新开始，同一事件可能被返回多次
+        :return: 生成器，每一项是BlockEvent
+        """
+        # 消费者提前退出时通知后台的获取线程停止
+        done = threading.Event()
+        try:
+            for events in pager.Prefetch(self.batches(done), self.prefetch):
+                for event in events:
+                    yield event
+                    self.seq, self.hash = event.seq, event.hash
+                self.save()
+        finally:
+            done.set()
+            self.save()
+
+    def Stats(self) -> dict:
+        """
+        Stats 跟随状态，consecutiveErrors持续增长说明跟随已经停滞
+        :return: seq: 已处理的最大序列号, errors: 获取失败的总次数, consecutiveErrors: 连续失败次数,
+                 lastError: 最后一次失败的异常
+        """
+        return {"seq": self.seq, "errors": self.errors, "consecutiveErrors": self.consecutiveErrors,
+                "lastError": self.lastError}
+
+    def save(self):
+        if self.checkpoint is not None and self.hash is not None:
+            self.checkpoint.Save(self.seq, self.hash)
+
+    def Close(self):
+        """
+        Close 停止跟随，Events在当前批次结束后返回
+        """
+        self.stopped.set()
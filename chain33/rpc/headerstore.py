@@ -0,0 +1,224 @@
+#!/usr/bin/python3
+
+import array
+import bisect
+import os
+import struct
+import threading
+
+from chain33.rpc import types
+
+# 每个区块头定长记录：version, parentHash, txHash, stateHash, blockTime, txCount, hash, difficulty，高度由位置决定
+recordFormat = struct.Struct("<q32s32s32sqq32sI4x")
+# 文件头：magic, 第一个区块头的高度
+fileHeader = struct.Struct("<8sq")
+magic = b"C33HDR01"
+
+# 默认每次GetHeaders获取的区块头数
+DefaultPageSize = 500
+
+
+def hexToBytes(hash_str: str) -> bytes:
+    return bytes.fromhex(hash_str[2:] if hash_str.startswith("0x") else hash_str)
+
+
+def bytesToHex(data: bytes) -> str:
+    return "0x" + data.hex()
+
+
+# HeaderStore 本地区块头存储，定长记录保存在连续的内存中，可选追加写入文件
+# 按高度直接定位记录，另外维护哈希到高度的索引和区块时间数组，查询不需要访问节点
+class HeaderStore(object):
+    def __init__(self, path: str = None, base: int = 0):
+        """
+        :param path: 文件路径，存在时加载已保存的区块头，None表示只保存在内存中
+        :param base: 新建存储时第一个区块头的高度
+        """
+        self.path = path
+        self.base = base
+        self.records = bytearray()
+        self.times = array.array('q')
+        self.index = {}
+        self.lock = threading.Lock()
+        self.file = None
+        if path is None:
+            return
+        if os.path.exists(path) and os.path.getsize(path) >= fileHeader.size:
+            with open(path, "rb") as f:
+                head, self.base = fileHeader.unpack(f.read(fileHeader.size))
+                if head != magic:
+                    raise Exception("ErrHeaderStoreFormat")
+                data = f.read()
+            # 丢弃写了一半的记录
+            data = data[:len(data) - len(data) % recordFormat.size]
+            for offset in range(0, len(data), recordFormat.size):
+                self.add(data[offset:offset + recordFormat.size])
+            self.file = open(path, "r+b")
+            self.file.truncate(fileHeader.size + len(self.records))
+            self.file.seek(0, os.SEEK_END)
+        else:
+            self.file = open(path, "w+b")
+            self.file.write(fileHeader.pack(magic, self.base))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Close()
+
+    def __len__(self):
+        return len(self.times)
+
+    def add(self, record: bytes):
+        fields = recordFormat.unpack(record)
+        self.index[fields[6]] = self.base + len(self.times)
+        self.times.append(fields[4])
+        self.records += record
+
+    def record(self, height: int) -> tuple:
+        i = height - self.base
+        if i < 0 or i >= len(self.times):
+            raise IndexError("ErrHeightNotExist")
+        return recordFormat.unpack_from(self.records, i * recordFormat.size)
+
+    def Height(self) -> int:
+        """
+        Height 已保存的最高区块高度，为空时返回base - 1
+        """
+        return self.base + len(self.times) - 1
+
+    def Append(self, header: types.BlockHeader):
+        """
+        Append 追加下一个高度的区块头，检查高度和parentHash是否与当前最高区块衔接
+        :param header: types.BlockHeader
+        """
+        if header.height != self.Height() + 1:
+            raise Exception("ErrHeightMismatch")
+        if len(self.times) > 0 and hexToBytes(header.parentHash) != self.record(self.Height())[6]:
+            raise Exception("ErrParentHashMismatch")
+        record = recordFormat.pack(header.version, hexToBytes(header.parentHash), hexToBytes(header.txHash),
+                                   hexToBytes(header.stateHash), header.blockTime, header.txCount,
+                                   hexToBytes(header.hash), header.difficulty)
+        with self.lock:
+            self.add(record)
+            if self.file is not None:
+                self.file.write(record)
+
+    def Truncate(self, height: int):
+        """
+        Truncate 删除高于height的区块头，用于回滚
+        :param height: 保留的最高区块高度
+        """
+        with self.lock:
+            keep = max(0, min(height - self.base + 1, len(self.times)))
+            for i in range(keep, len(self.times)):
+                del self.index[recordFormat.unpack_from(self.records, i * recordFormat.size)[6]]
+            del self.times[keep:]
+            del self.records[keep * recordFormat.size:]
+            if self.file is not None:
+                self.file.flush()
+                self.file.truncate(fileHeader.size + len(self.records))
+                self.file.seek(0, os.SEEK_END)
+
+    def Sync(self, jclient, pageSize: int = DefaultPageSize) -> int:
+        """
+        Sync 从节点增量同步到最新高度，发现分叉时回退到共同的祖先区块后继续
+        节点回滚到相同或者更低的高度时，比较两边都有的最高区块的哈希来发现分叉
+        :param jclient: jsonclient.client
+        :param pageSize: 每次GetHeaders获取的区块头数
+        :return: 新追加的区块头数
+        """
+        last, err = jclient.GetLastHeader()
+        if err != None:
+            raise Exception(err)
+        height = min(self.Height(), last.height)
+        if len(self.times) > 0 and height >= self.base:
+            if height == last.height:
+                hash_str = last.hash
+            else:
+                hash_str, err = jclient.GetBlockHash(height)
+                if err != None:
+                    raise Exception(err)
+            if hexToBytes(hash_str) != self.record(height)[6]:
+                self.rollback(jclient, height - 1)
+        added = 0
+        while self.Height() < last.height:
+            start = self.Height() + 1
+            result, err = jclient.GetHeaders(start, min(start + pageSize - 1, last.height), False, [])
+            if err != None:
+                raise Exception(err)
+            headers = [types.jsonToBlockHeader(item) for item in result['items']]
+            if len(headers) == 0:
+                break
+            if len(self.times) > 0 and hexToBytes(headers[0].parentHash) != self.record(self.Height())[6]:
+                self.rollback(jclient, self.Height())
+                continue
+            for header in headers:
+                self.Append(header)
+                added += 1
+        if self.file is not None:
+            self.file.flush()
+        return added
+
+    # rollback 从height开始向下找到与节点哈希相同的区块，删除之后的区块头
+    def rollback(self, jclient, height: int):
+        while height >= self.base:
+            hash_str, err = jclient.GetBlockHash(height)
+            if err != None:
+                raise Exception(err)
+            if hexToBytes(hash_str) == self.record(height)[6]:
+                break
+            height -= 1
+        if height < self.base:
+            raise Exception("ErrHeaderStoreFork")
+        self.Truncate(height)
+
+    def Hash(self, height: int) -> str:
+        """
+        Hash 查询区块哈希
+        :param height: 区块高度
+        :return: 区块哈希，高度不在存储中时抛出IndexError
+        """
+        return bytesToHex(self.record(height)[6])
+
+    def Time(self, height: int) -> int:
+        """
+        Time 查询区块时间
+        :param height: 区块高度
+        :return: 区块时间(秒)
+        """
+        i = height - self.base
+        if i < 0 or i >= len(self.times):
+            raise IndexError("ErrHeightNotExist")
+        return self.times[i]
+
+    def HeightOf(self, hash_str: str) -> int:
+        """
+        HeightOf 查询区块哈希对应的高度
+        :param hash_str: 区块哈希
+        :return: 区块高度，不在存储中时返回None
+        """
+        return self.index.get(hexToBytes(hash_str))
+
+    def Header(self, height: int) -> types.BlockHeader:
+        """
+        Header 查询完整的区块头
+        :param height: 区块高度
+        :return: types.BlockHeader
+        """
+        version, parentHash, txHash, stateHash, blockTime, txCount, hash_bytes, difficulty = self.record(height)
+        return types.BlockHeader(version, bytesToHex(parentHash), bytesToHex(txHash), bytesToHex(stateHash),
+                                 height, blockTime, txCount, bytesToHex(hash_bytes), difficulty)
+
+    def AtOrBefore(self, timestamp: int) -> int:
+        """
+        AtOrBefore 二分查找区块时间不晚于timestamp的最高区块，区块时间按高度递增
+        :param timestamp: 时间(秒)
+        :return: 区块高度，所有区块都晚于timestamp时返回base - 1
+        """
+        return self.base + bisect.bisect_right(self.times, timestamp) - 1
+
+    def Close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
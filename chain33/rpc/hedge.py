@@ -0,0 +1,126 @@
+#!/usr/bin/python3
+
+import collections
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from chain33.rpc import balancer
+
+# 可以对冲的幂等只读方法，发送交易和钱包操作永远不会被对冲
+HedgeMethods = frozenset([
+    "Chain33.QueryTransaction",
+    "Chain33.GetHexTxByHash",
+    "Chain33.GetTxByHashes",
+    "Chain33.GetBlockHash",
+    "Chain33.GetBlocks",
+    "Chain33.GetHeaders",
+    "Chain33.GetBalance",
+    "Chain33.Query",
+])
+assert HedgeMethods <= balancer.ReadMethods
+
+# 默认在第几百分位的延迟之后发出对冲请求
+DefaultPercentile = 95
+# 对冲延迟的下限(秒)
+DefaultMinDelay = 0.005
+# 样本不足时使用的对冲延迟(秒)
+DefaultInitialDelay = 0.1
+# 每个方法保留的延迟样本数
+sampleSize = 1000
+# 计算百分位需要的最少样本数
+minSamples = 20
+# 每记录多少个样本重新计算一次百分位
+refreshEvery = 50
+
+
+# Hedger 对冲请求：第一个节点在百分位延迟内没有返回时，向第二个节点发送相同请求，取先返回的结果
+class Hedger(object):
+    def __init__(self, percentile: float = DefaultPercentile, minDelay: float = DefaultMinDelay,
+                 initialDelay: float = DefaultInitialDelay, workers: int = 32):
+        """
+        :param percentile: 第一个请求超过该百分位的延迟仍未返回时发出对冲请求
+        :param minDelay: 对冲延迟的下限(秒)
+        :param initialDelay: 样本不足时使用的对冲延迟(秒)
+        :param workers: 发送请求的线程数
+        """
+        self.percentile = percentile
+        self.minDelay = minDelay
+        self.initialDelay = initialDelay
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.lock = threading.Lock()
+        self.samples = collections.defaultdict(lambda: collections.deque(maxlen=sampleSize))
+        self.counts = collections.Counter()
+        self.delays = {}
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+
+    def Delay(self, method: str) -> float:
+        """
+        Delay 方法当前的对冲延迟(秒)
+        """
+        return self.delays.get(method, self.initialDelay)
+
+    def record(self, method: str, latency: float):
+        with self.lock:
+            samples = self.samples[method]
+            samples.append(latency)
+            self.counts[method] += 1
+            count = self.counts[method]
+            if count == minSamples or (count > minSamples and count % refreshEvery == 0):
+                ordered = sorted(samples)
+                index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+                self.delays[method] = max(ordered[index], self.minDelay)
+
+    def Post(self, bal: balancer.Balancer, method: str, data: str):
+        """
+        Post 发送可对冲的请求
+        :param bal: 节点选择器
+        :param method: 方法名称
+        :param data: 请求体
+        :return: requests.Response
+        """
+        start = time.perf_counter()
+        first = bal.Pick()
+        primary = self.executor.submit(bal.Post, first, data)
+
+        # 对冲延迟按第一个请求的延迟计算，即使对冲请求先返回，第一个请求完成时也要记录，否则慢请求永远不会进入样本
+        def observe(future):
+            if future.exception() is None:
+                self.record(method, time.perf_counter() - start)
+
+        primary.add_done_callback(observe)
+        futures = {primary: False}
+        done, _ = wait(futures, timeout=self.Delay(method))
+        with self.lock:
+            self.requests += 1
+        if not done:
+            second = bal.Pick(exclude=[first])
+            if second is not first:
+                with self.lock:
+                    self.fired += 1
+                futures[self.executor.submit(bal.Post, second, data)] = True
+        pending = set(futures)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if futures[future]:
+                        with self.lock:
+                            self.won += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def Stats(self) -> dict:
+        """
+        Stats 对冲统计信息
+        :return: requests: 可对冲的请求数, fired: 发出的对冲请求数, won: 对冲请求先返回的次数, delays: 各方法当前的对冲延迟
+        """
+        with self.lock:
+            return {"requests": self.requests, "fired": self.fired, "won": self.won, "delays": dict(self.delays)}
+
+    def Close(self):
+        self.executor.shutdown(wait=False)
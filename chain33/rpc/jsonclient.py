@@ -1,22 +1,175 @@
 #!/usr/bin/python3
 
 import copy
-import json
+import inspect
+import itertools
 import time
+from concurrent.futures import ThreadPoolExecutor
+import json
 
 import requests
 
 from chain33.crypto import signer, account, pre
 from chain33.dapp import transaction, storage, coins
 from chain33.protobuf import tx_pb2, storage_pb2
-from chain33.rpc import types
+from chain33.rpc import types, transport, balancer, hedge, cache, codec, columnar, diskcache, jsonstream, metrics, \
+    pager
+
+# 默认单个批量请求包含的最大调用数
+DefaultMaxBatchSize = 100
+# 默认分页查询区块时每页的区块数
+DefaultPageSize = 100
+# 默认批量查询余额时单次GetBalance包含的地址数
+DefaultBalanceBatchSize = 200
+# 启用统计时不包装的方法，rpc请求在Call和CallMany中统计
+uninstrumented = frozenset(["Call", "CallMany", "CallStream", "Close", "Warmup", "HedgeStats", "Instrument",
+                            "Uninstrument"])
 
 
 class client:
 
-    def __init__(self, url):
+    def __init__(self, url, poolSize: int = transport.DefaultPoolSize,
+                 connectTimeout: float = transport.DefaultConnectTimeout,
+                 readTimeout: float = transport.DefaultReadTimeout, maxBatchSize: int = DefaultMaxBatchSize,
+                 strategy: str = balancer.RoundRobin, maxFailures: int = balancer.DefaultMaxFailures,
+                 probeInterval: float = balancer.DefaultProbeInterval, hedging: bool = False,
+                 hedgePercentile: float = hedge.DefaultPercentile, hedgeMinDelay: float = hedge.DefaultMinDelay,
+                 lruCache: cache.LRUCache = None, diskCache: diskcache.DiskCache = None,
+                 jsonCodec: codec.JsonCodec = None):
+        """
+        :param url: 节点rpc地址，也可以是多个节点地址的列表，只读请求会按strategy分发到各个节点
+        :param poolSize: 每个节点保持的最大长连接数
+        :param connectTimeout: 建立连接超时时间(秒)
+        :param readTimeout: 读超时时间(秒)
+        :param maxBatchSize: CallMany单个批量请求包含的最大调用数
+        :param strategy: 多节点时读请求的节点选择策略: balancer.RoundRobin, LeastOutstanding, LatencyWeighted
+        :param maxFailures: 节点连续失败多少次后摘除
+        :param probeInterval: 后台通过IsSync探测节点状态的间隔(秒)，0表示不探测
+        :param hedging: 多节点时是否对幂等只读方法(hedge.HedgeMethods)启用对冲请求
+        :param hedgePercentile: 第一个节点超过该百分位的延迟仍未返回时向第二个节点发送相同请求
+        :param hedgeMinDelay: 对冲延迟的下限(秒)
+        :param lruCache: 不可变数据的内存缓存，GetBlockHash, GetHexTxByHash, QueryTransaction等方法会先查询缓存
+        :param diskCache: 持久化缓存，GetHexTxByHash和QueryStorage在内存缓存之后查询，可以多个进程共享
+        :param jsonCodec: 请求和响应的json编解码，默认安装了orjson时使用codec.OrjsonCodec，否则使用codec.JsonCodec
+        """
         self.url = url
-        self.headers = {'content-type': 'application/json'}
+        self.maxBatchSize = maxBatchSize
+        self.ids = itertools.count(1)
+        urls = url if isinstance(url, (list, tuple)) else [url]
+        self.balancer = balancer.Balancer(urls, strategy=strategy, poolSize=poolSize, connectTimeout=connectTimeout,
+                                          readTimeout=readTimeout, maxFailures=maxFailures,
+                                          probeInterval=probeInterval)
+        self.cache = lruCache
+        self.diskCache = diskCache
+        self.codec = jsonCodec if jsonCodec is not None else codec.Default()
+        self.instrument = None
+        self.hedger = None
+        if hedging and len(urls) > 1:
+            self.hedger = hedge.Hedger(percentile=hedgePercentile, minDelay=hedgeMinDelay,
+                                       workers=poolSize * len(urls))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Close()
+
+    def Warmup(self, connections: int = 0) -> int:
+        """
+        Warmup 预先建立长连接
+        :param connections: 每个节点预建立的连接数，0表示填满连接池
+        :return: 成功建立的连接数
+        """
+        return self.balancer.Warmup(connections)
+
+    def Close(self):
+        """
+        Close 停止节点探测并关闭连接池
+        """
+        if self.hedger is not None:
+            self.hedger.Close()
+        self.balancer.Close()
+
+    def HedgeStats(self) -> dict:
+        """
+        HedgeStats 对冲请求统计信息，未启用对冲时返回None
+        :return: requests: 可对冲的请求数, fired: 发出的对冲请求数, won: 对冲请求先返回的次数, delays: 各方法当前的对冲延迟
+        """
+        if self.hedger is None:
+            return None
+        return self.hedger.Stats()
+
+    def Instrument(self, stats: metrics.Metrics = None, before=None, after=None) -> metrics.Metrics:
+        """
+        Instrument 启用调用统计和钩子，每次rpc请求和每次封装方法(GetBlocks, QueryBalance等)的调用都会记录
+        :param stats: 统计，None表示新建一个metrics.Metrics
+        :param before: pre-call钩子，rpc请求发送之前和封装方法开始执行之前以metrics.CallInfo为参数调用
+        :param after: post-call钩子，rpc请求和封装方法结束后以metrics.CallInfo为参数调用，包含各阶段耗时
+        :return: metrics.Metrics，可以通过Dump或者Scrape导出
+        """
+        self.Uninstrument()
+        stats = stats if stats is not None else metrics.Metrics()
+        self.instrument = metrics.Instrumentation(stats, before, after)
+        for name, fn in inspect.getmembers(type(self), inspect.isfunction):
+            if name[0].isupper() and name not in uninstrumented and not inspect.isgeneratorfunction(fn):
+                setattr(self, name, self.instrument.Wrap(name, getattr(self, name)))
+        return stats
+
+    def Uninstrument(self):
+        """
+        Uninstrument 关闭调用统计和钩子
+        """
+        if self.instrument is None:
+            return
+        self.instrument = None
+        for name, fn in inspect.getmembers(type(self), inspect.isfunction):
+            self.__dict__.pop(name, None)
+
+    def timedPost(self, name: str, payload, read: bool, method: str = None):
+        # 启用统计时的Call和CallMany，记录各阶段的耗时
+        info = metrics.CallInfo(metrics.RpcCall, name)
+        start = time.perf_counter()
+        try:
+            data = self.codec.Dumps(payload)
+            info.requestBytes = len(data)
+            sent = time.perf_counter()
+            info.phases["encode"] = sent - start
+            self.instrument.Before(info)
+            response = self.post(data, read, method)
+            received = time.perf_counter()
+            info.phases["wait"] = min(response.elapsed.total_seconds(), received - sent)
+            info.phases["receive"] = received - sent - info.phases["wait"]
+            info.responseBytes = len(response.content)
+            resp = self.codec.Loads(response.content)
+            info.phases["decode"] = time.perf_counter() - received
+            errors = [r.get("error") for r in resp] if isinstance(resp, list) else [resp.get("error")]
+            info.error = next((e for e in errors if e != None), None)
+            return resp
+        except Exception as e:
+            info.error = type(e).__name__
+            raise
+        finally:
+            info.elapsed = time.perf_counter() - start
+            self.instrument.After(info)
+
+    def post(self, data: bytes, read: bool, method: str = None, stream: bool = False) -> requests.Response:
+        # 写请求只发给首选节点，读请求失败时换一个节点重试
+        if not read:
+            return self.balancer.Post(self.balancer.Primary(), data, stream)
+        if self.hedger is not None and method in hedge.HedgeMethods and not stream:
+            try:
+                return self.hedger.Post(self.balancer, method, data)
+            except requests.RequestException:
+                pass
+        tried = []
+        while True:
+            ep = self.balancer.Pick(tried)
+            try:
+                return self.balancer.Post(ep, data, stream)
+            except requests.RequestException:
+                tried.append(ep)
+                if len(tried) >= len(self.balancer.endpoints):
+                    raise
 
     def Call(self, method, params) -> json:
         """
@@ -29,14 +182,54 @@ class client:
             "method": method,
             "params": [params],
             "jsonrpc": "2.0",
-            "id": 1
+            "id": next(self.ids)
+        }
+        if self.instrument is not None:
+            return self.timedPost(method, payload, method in balancer.ReadMethods, method)
+        data = self.codec.Dumps(payload)
+        return self.codec.Loads(self.post(data, method in balancer.ReadMethods, method).content)
+
+    def CallStream(self, method, params, path: tuple, chunkSize: int = jsonstream.DefaultChunkSize):
+        """
+        CallStream rpc调用，边接收响应边解析，逐个返回path指向的数组中的元素，内存占用与单个元素的大小相关
+        :param method: 方法名称
+        :param params: 参数
+        :param path: result中数组的key路径，比如("items",)
+        :param chunkSize: 每次从连接读取的字节数
+        :return: 生成器，数组元素的json对象，节点返回错误时抛出异常
+        """
+        payload = {
+            "method": method,
+            "params": [params],
+            "jsonrpc": "2.0",
+            "id": next(self.ids)
         }
-        response = requests.post(
-            self.url,
-            data=json.dumps(payload),
-            headers=self.headers
-        ).json()
-        return response
+        response = self.post(self.codec.Dumps(payload), method in balancer.ReadMethods, method, stream=True)
+        try:
+            decoder = jsonstream.StreamDecoder(response.iter_content(chunkSize))
+            yield from decoder.Items(("result",) + tuple(path))
+            if decoder.fields.get("error") != None:
+                raise Exception(decoder.fields["error"])
+        finally:
+            response.close()
+
+    def CallMany(self, calls: list) -> list:
+        """
+        CallMany 以JSON-RPC 2.0批量请求的方式发送多个调用，超过maxBatchSize时分多次发送
+        :param calls: (方法名称, 参数)列表
+        :return: 与calls顺序一致的(result, error)列表
+        """
+        results = []
+        for i in range(0, len(calls), self.maxBatchSize):
+            chunk = calls[i:i + self.maxBatchSize]
+            payload = batchPayload(self.ids, chunk)
+            read = all(method in balancer.ReadMethods for method, _ in chunk)
+            if self.instrument is not None:
+                resp = self.timedPost("batch", payload, read)
+            else:
+                resp = self.codec.Loads(self.post(self.codec.Dumps(payload), read).content)
+            results.extend(matchBatch(payload, resp))
+        return results
 
     def SendTransaction(self, tx: tx_pb2.Transaction) -> (str, str):
         """
@@ -54,7 +247,14 @@ class client:
         :param txhash: 交易哈希
         :return:
         """
+        if self.cache is not None:
+            hit, result = self.cache.Get("Chain33.QueryTransaction", txhash)
+            if hit:
+                return result, None
         resp = self.Call("Chain33.QueryTransaction", {"hash": txhash})
+        # 只缓存已经打包的交易
+        if self.cache is not None and resp["error"] == None and resp['result'] != None:
+            self.cache.Put("Chain33.QueryTransaction", txhash, resp['result'], height=resp['result']['height'])
         return resp['result'], resp["error"]
 
     def GetHexTxByHash(self, hash: str) -> (str, str):
@@ -63,7 +263,23 @@ class client:
         :param hash:
         :return:
         """
+        if self.cache is not None:
+            hit, result = self.cache.Get("Chain33.GetHexTxByHash", hash)
+            if hit:
+                return result, None
+        if self.diskCache is not None:
+            data = self.diskCache.GetTx(hash)
+            if data is not None:
+                if self.cache is not None:
+                    self.cache.Put("Chain33.GetHexTxByHash", hash, data.hex())
+                return data.hex(), None
         resp = self.Call("Chain33.GetHexTxByHash", {"hash": hash})
+        if resp["error"] == None and resp['result']:
+            if self.cache is not None:
+                self.cache.Put("Chain33.GetHexTxByHash", hash, resp['result'])
+            if self.diskCache is not None:
+                hexTx = resp['result'][2:] if resp['result'].startswith("0x") else resp['result']
+                self.diskCache.PutTx(hash, bytes.fromhex(hexTx))
         return resp['result'], resp["error"]
 
     def GetTxByAddr(self, addr: str, flag: int, count: int, direction: int, height: int, index: int) -> (list, str):
@@ -80,19 +296,120 @@ class client:
         resp = self.Call("Chain33.GetTxByAddr",
                          {"addr": addr, "flag": flag, "count": count, "direction": direction, "height": height,
                           "index": index})
-        infos = resp['result']['txInfos']
+        if resp["error"] != None:
+            return [], resp["error"]
         txInfos = []
-        for i in range(0, len(infos), 1):
-            assets = []
-            for j in range(0, len(infos[i]['assets']), 1):
-                asset = types.Asset(infos[i]['assets'][j]['exec'], infos[i]['assets'][j]['symbol'],
-                                    infos[i]['assets'][j]['amount'])
-                assets.append(asset)
-            txInfo = types.TxInfo(hash=infos[i]['hash'], hegiht=infos[i]['height'], index=infos[i]['index'],
-                                  assets=assets)
-            txInfos.append(txInfo)
+        for info in resp['result']['txInfos']:
+            txInfos.append(types.jsonToTxInfo(info))
         return txInfos, resp["error"]
 
+    def StreamTxByAddr(self, addr: str, flag: int, count: int, direction: int, height: int, index: int):
+        """
+        StreamTxByAddr 与GetTxByAddr相同，边接收响应边解析，逐个返回交易信息
+        :return: 生成器，每一项是types.TxInfo
+        """
+        infos = self.CallStream("Chain33.GetTxByAddr", {"addr": addr, "flag": flag, "count": count,
+                                                        "direction": direction, "height": height, "index": index},
+                                ("txInfos",))
+        for info in infos:
+            yield types.jsonToTxInfo(info)
+
+    def IterTxByAddr(self, addr: str, flag: int = 0, direction: int = 0, pageSize: int = DefaultPageSize,
+                     height: int = -1, index: int = 0, prefetch: int = 1):
+        """
+        IterTxByAddr 自动翻页遍历地址的全部交易，翻页游标取上一页最后一笔交易的(height, index)，并去掉页边界上重复的交易
+        :param addr: 要查询的账户地址
+        :param flag: 交易类型: 0表示所有涉及到addr的交易， 1表示addr作为发送方  2表示addr作为接收方
+        :param direction: 查询方向： 0表示正向查询，区块高度从低到高；-1表示反向查询
+        :param pageSize: 单次查询返回得数据条数
+        :param height: 起始游标的区块高度，-1表示从最新的开始
+        :param index: 起始游标的交易索引
+        :param prefetch: 最多提前获取的页数
+        :return: 生成器，每一项是types.TxInfo
+        """
+
+        for page in pager.Prefetch(self.txInfoPages(addr, flag, direction, pageSize, height, index), prefetch):
+            for info in page:
+                yield types.jsonToTxInfo(info)
+
+    def txInfoPages(self, addr: str, flag: int, direction: int, pageSize: int, height: int, index: int):
+        # 逐页返回GetTxByAddr结果中的txInfos(json对象)
+        cursor = (height, index)
+        seen = set()
+        count = pageSize
+        while True:
+            resp = self.Call("Chain33.GetTxByAddr", {"addr": addr, "flag": flag, "count": count,
+                                                     "direction": direction, "height": cursor[0], "index": cursor[1]})
+            if resp["error"] == "ErrTxNotExist":
+                return
+            if resp["error"] != None:
+                raise Exception(resp["error"])
+            txInfos = resp['result']['txInfos'] or []
+            page = [info for info in txInfos if info['hash'] not in seen]
+            # 去重后没有新的交易时结束
+            if len(page) == 0:
+                return
+            yield page
+            if len(txInfos) < count:
+                return
+            seen = set(info['hash'] for info in txInfos)
+            cursor = (txInfos[-1]['height'], txInfos[-1]['index'])
+            # 游标上的交易会再次返回，多取一条，保证pageSize为1时也能前进
+            count = pageSize + 1
+
+    def TxColumnsByAddr(self, addr: str, flag: int = 0, direction: int = 0, pageSize: int = DefaultPageSize,
+                        height: int = -1, index: int = 0, prefetch: int = 1) -> columnar.TxTable:
+        """
+        TxColumnsByAddr 与IterTxByAddr相同，结果按列保存，不创建types.TxInfo对象
+        GetTxByAddr不返回执行器和手续费，每页再通过GetTxByHashes获取交易详情，详情边接收边解析后直接追加到列中
+        :return: columnar.TxTable
+        """
+        table = columnar.TxTable()
+        for page in pager.Prefetch(self.txInfoPages(addr, flag, direction, pageSize, height, index), prefetch):
+            details = self.CallStream("Chain33.GetTxByHashes",
+                                      {"hashes": [info['hash'] for info in page], "disableDetail": True}, ("txs",))
+            for detail in details:
+                table.AppendTxDetail(detail)
+        return table
+
+    def BlockTxColumns(self, start: int, end: int, pageSize: int = DefaultPageSize,
+                       prefetch: int = pager.DefaultPrefetch) -> columnar.TxTable:
+        """
+        BlockTxColumns 获取区间内全部区块的交易，结果按列保存，每页通过StreamBlocks边接收边解析，解析出的区块直接追加到列中
+        :param start:  开始区块高度
+        :param end:    结束区块高度(包含)
+        :param pageSize: 每次GetBlocks获取的区块数
+        :param prefetch: 最多提前获取的页数
+        :return: columnar.TxTable
+        """
+
+        def blocks():
+            for pageStart in range(start, end + 1, pageSize):
+                yield from self.StreamBlocks(pageStart, min(pageStart + pageSize - 1, end), False)
+
+        table = columnar.TxTable()
+        for item in pager.Prefetch(blocks(), prefetch * pageSize):
+            table.AppendBlock(item)
+        return table
+
+    def GetTxByAddrs(self, addrs: list, flag: int = 0, direction: int = 0, pageSize: int = DefaultPageSize,
+                     workers: int = 8) -> dict:
+        """
+        GetTxByAddrs 并发获取多个地址的全部交易
+        :param addrs: 账户地址列表
+        :param flag: 交易类型: 0表示所有涉及到addr的交易， 1表示addr作为发送方  2表示addr作为接收方
+        :param direction: 查询方向： 0表示正向查询，区块高度从低到高；-1表示反向查询
+        :param pageSize: 单次查询返回得数据条数
+        :param workers: 并发线程数
+        :return: 地址到types.TxInfo列表的映射
+        """
+
+        def history(addr):
+            return list(self.IterTxByAddr(addr, flag, direction, pageSize, prefetch=0))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(addrs, executor.map(history, addrs)))
+
     def CreateNoBalanceTxs(self, txHexs: list, payAddr: str, privkey: str, expire: str) -> (str, str):
         """
         CreateNoBalanceTxs 构造多笔不收手续费的交易组
@@ -112,15 +429,28 @@ class client:
         :return: types.BlockHeader和错误信息
         """
         resp = self.Call("Chain33.GetLastHeader", None)
-        result = resp['result']
-        return types.BlockHeader(result['version'], result['parentHash'], result['txHash'], result['stateHash'],
-                                 result['height'], result['blockTime'], result['txCount'], result['hash'],
-                                 result['difficulty']), resp["error"]
+        header = types.jsonToBlockHeader(resp['result'])
+        if self.cache is not None:
+            self.cache.ObserveHeight(header.height)
+        return header, resp["error"]
 
     def GetVersion(self) -> (types.Version, str):
-        resp = self.Call("Chain33.GetLastHeader", None)
+        """
+        GetVersion 获取版本信息
+        :return: types.Version和错误信息
+        """
+        if self.cache is not None:
+            hit, version = self.cache.Get("Chain33.Version", None)
+            if hit:
+                return version, None
+        resp = self.Call("Chain33.Version", None)
+        if resp["error"] != None:
+            return None, resp["error"]
         result = resp['result']
-        return types.Version(result['title'], result['app'], result['chain33'], result['localDb']), resp["error"]
+        version = types.Version(result['title'], result['app'], result['chain33'], result['localDb'])
+        if self.cache is not None:
+            self.cache.Put("Chain33.Version", None, version)
+        return version, resp["error"]
 
     def GetBlocks(self, start: int, end: int, isDetail: bool) -> (json, str):
         """
@@ -133,6 +463,38 @@ class client:
         resp = self.Call("Chain33.GetBlocks", {"start": start, "end": end, "isDetail": isDetail})
         return resp['result'], resp["error"]
 
+    def IterBlocks(self, start: int, end: int, pageSize: int = DefaultPageSize, isDetail: bool = False,
+                   prefetch: int = pager.DefaultPrefetch):
+        """
+        IterBlocks 按高度顺序逐个返回区间内的区块，后台线程提前获取后面的页，内存占用与区间长度无关
+        :param start:  开始区块高度
+        :param end:    结束区块高度(包含)
+        :param pageSize: 每次GetBlocks获取的区块数
+        :param isDetail: 是否获取区块详细信息
+        :param prefetch: 最多提前获取的页数
+        :return: 生成器，每一项是GetBlocks结果items中的一个区块
+        """
+
+        def pages():
+            for pageStart in range(start, end + 1, pageSize):
+                result, err = self.GetBlocks(pageStart, min(pageStart + pageSize - 1, end), isDetail)
+                if err != None:
+                    raise Exception(err)
+                yield result['items']
+
+        for page in pager.Prefetch(pages(), prefetch):
+            yield from page
+
+    def StreamBlocks(self, start: int, end: int, isDetail: bool):
+        """
+        StreamBlocks 与GetBlocks相同，边接收响应边解析，逐个返回区块，不需要等待整个响应解析完成
+        :param start:  开始区块高度
+        :param end:    结束区块高度
+        :param isDetail: 是否打印区块详细信息
+        :return: 生成器，每一项是GetBlocks结果items中的一个区块
+        """
+        return self.CallStream("Chain33.GetBlocks", {"start": start, "end": end, "isDetail": isDetail}, ("items",))
+
     def GetHeaders(self, start: int, end: int, isDetail: bool, pid: list) -> (json, str):
         """
         GetHeaders 获取区间区块头
@@ -151,7 +513,13 @@ class client:
         :param height: 区块高度
         :return: 区块哈希 和错误信息
         """
+        if self.cache is not None:
+            hit, hash = self.cache.Get("Chain33.GetBlockHash", height)
+            if hit:
+                return hash, None
         resp = self.Call("Chain33.GetBlockHash", {"height": height})
+        if self.cache is not None and resp["error"] == None:
+            self.cache.Put("Chain33.GetBlockHash", height, resp['result']['hash'], height=height)
         return resp['result']['hash'], resp["error"]
 
     def GetLastBlockSequence(self) -> (int, str):
@@ -162,6 +530,30 @@ class client:
         resp = self.Call("Chain33.GetLastBlockSequence", None)
         return resp['result'], resp["error"]
 
+    def GetBlockSequences(self, start: int, end: int) -> (list, str):
+        """
+        GetBlockSequences 获取区间序列号对应的区块哈希和类型
+        :param start: 开始序列号
+        :param end:   结束序列号
+        :return: 列表，每一项包含hash和type(1表示新增区块，2表示回滚区块) 和错误信息
+        """
+        resp = self.Call("Chain33.GetBlockSequences", {"start": start, "end": end, "isDetail": False})
+        if resp["error"] != None:
+            return [], resp["error"]
+        return resp['result']['blkseqInfos'], resp["error"]
+
+    def GetBlockByHashes(self, hashes: list, disableDetail: bool = False) -> (list, str):
+        """
+        GetBlockByHashes 根据区块哈希批量获取区块
+        :param hashes: 区块哈希列表
+        :param disableDetail: 是否不返回区块详细信息(交易回执)
+        :return: 区块列表，与hashes一一对应，每一项包含block和receipts 和错误信息
+        """
+        resp = self.Call("Chain33.GetBlockByHashes", {"hashes": hashes, "disableDetail": disableDetail})
+        if resp["error"] != None:
+            return [], resp["error"]
+        return resp['result']['items'], resp["error"]
+
     def AddPushSubscribe(self, name: str, url: str, encode: str, lastSequence: int, lastHeight: int, lastBlockHash: str,
                          type: int, contract: dict) -> (bool, str):
         """
@@ -213,7 +605,13 @@ class client:
         GetCoinSymbol 获取主代币信息
         :return: 代币Symbol和错误信息
         """
+        if self.cache is not None:
+            hit, symbol = self.cache.Get("Chain33.GetCoinSymbol", None)
+            if hit:
+                return symbol, None
         resp = self.Call("Chain33.GetCoinSymbol", None)
+        if self.cache is not None and resp["error"] == None:
+            self.cache.Put("Chain33.GetCoinSymbol", None, resp['result']['data'])
         return resp['result']['data'], resp["error"]
 
     # 钱包接口
@@ -260,10 +658,7 @@ class client:
         :return:  types.LabelAcc,错误信息
         """
         resp = self.Call("Chain33.SetLabl", {"addr": addr, "label": label})
-        result = resp['result']
-        acc = types.Account(result['acc']['currency'], result['acc']['balance'], result['acc']['frozen'],
-                            result['acc']['addr'])
-        return types.LabelAcc(result['label'], acc), resp['error']
+        return types.jsonToLabelAcc(resp['result']), resp['error']
 
     def NewAccount(self, label: str) -> (types.LabelAcc, str):
         """
@@ -272,10 +667,7 @@ class client:
         :return: types.LabelAcc,错误信息
         """
         resp = self.Call("Chain33.NewAccount", {"label": label})
-        result = resp['result']
-        acc = types.Account(result['acc']['currency'], result['acc']['balance'], result['acc']['frozen'],
-                            result['acc']['addr'])
-        return types.LabelAcc(result['label'], acc), resp['error']
+        return types.jsonToLabelAcc(resp['result']), resp['error']
 
     def GetAccounts(self, withoutBalance: bool) -> (list, str):
         """
@@ -286,11 +678,8 @@ class client:
         resp = self.Call("Chain33.GetAccounts", {"withoutBalance": withoutBalance})
         wallets = resp['result']['wallets']
         list = []
-        for i in range(0, len(wallets), 1):
-            result = wallets[i]
-            acc = types.Account(result['acc']['currency'], result['acc']['balance'], result['acc']['frozen'],
-                                result['acc']['addr'])
-            list.append(types.LabelAcc(result['label'], acc))
+        for wallet in wallets:
+            list.append(types.jsonToLabelAcc(wallet))
         return list, resp['error']
 
     def MergeBalance(self, to: str) -> (list, str):
@@ -310,10 +699,7 @@ class client:
         :return: types.LabelAcc，错误信息
         """
         resp = self.Call("Chain33.ImportPrivKey", {"privkey": privkey, "label": label})
-        result = resp['result']
-        acc = types.Account(result['acc']['currency'], result['acc']['balance'], result['acc']['frozen'],
-                            result['acc']['addr'])
-        return types.LabelAcc(result['label'], acc), resp['error']
+        return types.jsonToLabelAcc(resp['result']), resp['error']
 
     def DumpPrivkey(self, addr: str) -> (str, str):
         """
@@ -488,10 +874,53 @@ class client:
             "asset_symbol": asset_symbol
         }
         resp = self.Call("Chain33.GetBalance", params)
-        result = resp["result"]
-        account = result[0]
-        return types.Account(currency=account["currency"], balance=account["balance"], frozen=account["frozen"],
-                             addr=account["addr"]), resp["error"]
+        return types.jsonToClass(resp["result"][0]), resp["error"]
+
+    def QueryBalances(self, addrs: list, execer: str, asset_exec: str, asset_symbol: str,
+                      batchSize: int = DefaultBalanceBatchSize, workers: int = 4) -> dict:
+        """
+        QueryBalances 批量查询余额，地址按batchSize分组后并发查询
+        :param addrs:   账户地址列表
+        :param execer:  合约名称
+        :param asset_exec:  资产类型
+        :param asset_symbol:  资产符号
+        :param batchSize: 单次GetBalance包含的地址数
+        :param workers: 并发线程数
+        :return: 地址到types.Account的映射
+        """
+        balances = self.QueryBalancesMulti(addrs, [(execer, asset_exec, asset_symbol)], batchSize, workers)
+        return balances[(execer, asset_exec, asset_symbol)]
+
+    def QueryBalancesMulti(self, addrs: list, assets: list, batchSize: int = DefaultBalanceBatchSize,
+                           workers: int = 4) -> dict:
+        """
+        QueryBalancesMulti 一次遍历查询多种资产的余额，同一组地址的各资产查询合并在一个批量请求中
+        :param addrs:   账户地址列表
+        :param assets:  (合约名称, 资产类型, 资产符号)列表
+        :param batchSize: 单次GetBalance包含的地址数
+        :param workers: 并发线程数
+        :return: (合约名称, 资产类型, 资产符号)到{地址: types.Account}的映射
+        """
+
+        def query(chunk):
+            calls = []
+            for execer, asset_exec, asset_symbol in assets:
+                calls.append(("Chain33.GetBalance", {"addresses": chunk, "execer": execer, "asset_exec": asset_exec,
+                                                     "asset_symbol": asset_symbol}))
+            return self.CallMany(calls)
+
+        chunks = [addrs[i:i + batchSize] for i in range(0, len(addrs), batchSize)]
+        balances = {}
+        for asset in assets:
+            balances[tuple(asset)] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(query, chunks):
+                for asset, (result, err) in zip(assets, results):
+                    if err != None:
+                        raise Exception(err)
+                    for acc in result:
+                        balances[tuple(asset)][acc["addr"]] = types.jsonToClass(acc)
+        return balances
 
     def QueryStorage(self, title: str, txHash: str) -> (storage_pb2.Storage, str):
         """
@@ -507,16 +936,72 @@ class client:
                 "txHash": txHash
             }
         }
+        key = title + "storage:" + txHash
+        if self.diskCache is not None:
+            record = self.diskCache.GetStorage(key)
+            if record is not None:
+                return record, None
         resp = self.Call("Chain33.Query", params)
         # 添加解析函数
         result = resp["result"]
-        return storage.parseJsonToStorage(result), resp["error"]
+        record = storage.parseJsonToStorage(result)
+        # 明文存证可以追加内容，不缓存
+        if self.diskCache is not None and resp["error"] == None and isinstance(record, storage_pb2.Storage) \
+                and record.ty in (2, 3, 4):
+            self.diskCache.PutStorage(key, record)
+        return record, resp["error"]
+
+
+def batchPayload(ids, calls: list) -> list:
+    """
+    batchPayload 构造JSON-RPC 2.0批量请求
+    :param ids: id生成器
+    :param calls: (方法名称, 参数)列表
+    :return: 请求数组
+    """
+    payload = []
+    for method, params in calls:
+        payload.append({
+            "method": method,
+            "params": [params],
+            "jsonrpc": "2.0",
+            "id": next(ids)
+        })
+    return payload
+
+
+def matchBatch(payload: list, resp) -> list:
+    """
+    matchBatch 按id将批量响应与请求一一对应
+    :param payload: 请求数组
+    :param resp: 响应数组
+    :return: 与payload顺序一致的(result, error)列表
+    """
+    # 单个错误(比如节点不支持批量请求)时返回的不是数组
+    if not isinstance(resp, list):
+        error = resp.get("error") or "ErrInvalidBatchResponse"
+        return [(None, error) for _ in payload]
+    byId = {}
+    for r in resp:
+        byId[r.get("id")] = r
+    results = []
+    for req in payload:
+        r = byId.get(req["id"])
+        if r is None:
+            results.append((None, "ErrMissingBatchResponse"))
+        else:
+            results.append((r.get("result"), r.get("error")))
+    return results
 
 
 if __name__ == '__main__':
+    from chain33.rpc import tracker
+
     url = "http://localhost:8801"
     # 实例化一个jsonclient
     client = client(url)
+    # 跟踪交易打包结果
+    txTracker = tracker.TxTracker(client)
     print(client.Call("Chain33.GetPeerInfo", None))
     # 本地构造转账交易，并发送
     tx = coins.transfer("", 100000000, "1FNdYStvfKizgCy7DbJ2vAmt9U8Neys3No", "test")
@@ -563,25 +1048,25 @@ if __name__ == '__main__':
         raise ValueError(
             "Error:" + err
         )
-    time.sleep(5)
+    txTracker.Track(txhash).result(timeout=60)
     result, err = client.QueryTransaction(txhash)
     print(result)
 
     # 往合约地址打币
     tx = coins.transferToExec("", 200000000, "ticket", "test transferToExec")
     tx.Sign(acc)
-    client.SendTransaction(tx.Tx())
+    txhash, err = client.SendTransaction(tx.Tx())
     # 等待打包
-    time.sleep(3)
+    txTracker.Track(txhash).result(timeout=60)
     account1, err = client.QueryBalance(acc.address, "ticket", "", "")
     print(account1.balance)
 
     # 回提coins代币
     tx = coins.withdraw("", 200000000, "ticket", "test withdraw")
     tx.Sign(acc)
-    client.SendTransaction(tx.Tx())
+    txhash, err = client.SendTransaction(tx.Tx())
     # 等待打包
-    time.sleep(3)
+    txTracker.Track(txhash).result(timeout=60)
     account1, err = client.QueryBalance(acc.address, "ticket", "", "")
     print(account1.balance)
 
@@ -590,13 +1075,14 @@ if __name__ == '__main__':
     tx.Sign(acc)
     txhash, err = client.SendTransaction(tx.Tx())
     print(txhash)
-    time.sleep(4)
+    txTracker.Track(txhash).result(timeout=60)
     result, err = client.QueryStorage("", txhash)
     print('result:', result)
     # 追加存证
     tx = storage.contentStorage("", txhash, "", "value2", 1)
     tx.Sign(acc)
-    client.SendTransaction(tx.Tx())
-    time.sleep(4)
+    appendHash, err = client.SendTransaction(tx.Tx())
+    txTracker.Track(appendHash).result(timeout=60)
     result, err = client.QueryStorage("", txhash)
     print('result:', result)
+    txTracker.Close()
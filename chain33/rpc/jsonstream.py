@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+
+import codecs
+import json
+
+# 默认每次从连接读取的字节数
+DefaultChunkSize = 64 * 1024
+
+_whitespace = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+# StreamDecoder 从分块到达的响应体中增量解析json，只保留未解析的部分和当前元素
+# 每个值通过标准库的raw_decode整体解析，数据不完整时读取更多的块后重试
+class StreamDecoder(object):
+    def __init__(self, chunks):
+        """
+        :param chunks: bytes块的迭代器，比如requests.Response.iter_content()
+        """
+        self.chunks = iter(chunks)
+        self.utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        # 顶层对象中除了path指向的数组以外的字段，比如id和error
+        self.fields = {}
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self.utf8.decode(b"", final=True)
+        else:
+            text = self.utf8.decode(chunk)
+        # 丢弃已经解析过的部分
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return chunk is not None
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _whitespace:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise Exception("ErrUnexpectedEOF")
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise Exception("ErrInvalidJson: expect %r at %d" % (ch, self.pos))
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # 数字可能被截断，后面还有数据时才能确定已经完整
+                if end < len(self.buf) or self.eof or self.buf[self.pos] in '{["':
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # 每次至少读到当前未解析部分的两倍再重试，避免大元素被重复解析太多次
+            want = 2 * (len(self.buf) - self.pos)
+            while len(self.buf) - self.pos < want and self.fill():
+                pass
+
+    def array(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            ch = self.peek()
+            self.pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                raise Exception("ErrInvalidJson: expect ',' or ']' at %d" % (self.pos - 1))
+
+    def object(self, path: tuple, top: bool):
+        self.expect("{")
+        while True:
+            ch = self.peek()
+            if ch == "}":
+                self.pos += 1
+                return
+            if ch == ",":
+                self.pos += 1
+                continue
+            key = self.value()
+            self.expect(":")
+            if key != path[0] or self.peek() == "n":
+                value = self.value()
+                if top:
+                    self.fields[key] = value
+            elif len(path) == 1:
+                yield from self.array()
+            else:
+                yield from self.object(path[1:], False)
+
+    def Items(self, path: tuple):
+        """
+        Items 逐个返回path指向的数组中的元素，每个元素完整之后立即返回
+        :param path: 从顶层对象到数组的key路径，比如("result", "items")
+        :return: 生成器，数组元素解析后的json对象
+        """
+        yield from self.object(path, True)
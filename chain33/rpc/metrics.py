@@ -0,0 +1,184 @@
+#!/usr/bin/python3
+
+import bisect
+import collections
+import threading
+import time
+
+# 默认延迟直方图的桶上界(秒)
+DefaultBuckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# CallInfo的类型，RpcCall表示一次rpc请求，Wrapper表示一次client封装方法的调用
+RpcCall = "rpc"
+Wrapper = "wrapper"
+
+
+# CallInfo 一次调用的信息，传给pre-call和post-call钩子
+class CallInfo(object):
+    __slots__ = ("kind", "method", "requestBytes", "responseBytes", "phases", "error", "elapsed")
+
+    def __init__(self, kind: str, method: str):
+        self.kind = kind
+        # rpc请求为方法名，比如Chain33.GetBlocks，批量请求为batch；封装方法为client的方法名，比如GetBlocks
+        self.method = method
+        self.requestBytes = 0
+        self.responseBytes = 0
+        # 各阶段耗时(秒)
+        # rpc请求: encode编码请求, wait从发送请求到收到响应头(包括建立连接和服务端处理), receive读取响应体, decode解码响应
+        # 封装方法: rpc同一线程内rpc请求的耗时, convert其余的耗时(主要是转换成自定义类型)
+        self.phases = {}
+        # 节点返回的错误信息或者异常类型名，成功时为None
+        self.error = None
+        self.elapsed = 0.0
+
+
+# methodStats 单个方法的统计
+class methodStats(object):
+    def __init__(self, buckets: tuple):
+        self.count = 0
+        self.sum = 0.0
+        self.buckets = [0] * (len(buckets) + 1)
+        self.phases = collections.Counter()
+        self.errors = collections.Counter()
+        self.requestBytes = 0
+        self.responseBytes = 0
+
+
+# Metrics 按方法统计延迟直方图、各阶段耗时和错误数
+class Metrics(object):
+    def __init__(self, buckets: tuple = DefaultBuckets):
+        self.bucketBounds = tuple(buckets)
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def Observe(self, info: CallInfo):
+        """
+        Observe 记录一次调用，可以直接作为post-call钩子
+        """
+        with self.lock:
+            stats = self.stats.get(info.method)
+            if stats is None:
+                stats = self.stats[info.method] = methodStats(self.bucketBounds)
+            stats.count += 1
+            stats.sum += info.elapsed
+            stats.buckets[bisect.bisect_left(self.bucketBounds, info.elapsed)] += 1
+            stats.phases.update(info.phases)
+            stats.requestBytes += info.requestBytes
+            stats.responseBytes += info.responseBytes
+            if info.error is not None:
+                stats.errors[str(info.error)] += 1
+
+    def Dump(self) -> dict:
+        """
+        Dump 导出统计
+        :return: 方法名到统计的映射，count: 调用次数, sum: 总耗时, buckets: 桶上界到累计次数的映射(含inf),
+                 phases: 各阶段总耗时, errors: 错误信息到次数的映射, requestBytes/responseBytes: 总字节数
+        """
+        with self.lock:
+            result = {}
+            for method, stats in self.stats.items():
+                cumulative, total = {}, 0
+                for bound, count in zip(self.bucketBounds + (float("inf"),), stats.buckets):
+                    total += count
+                    cumulative[bound] = total
+                result[method] = {"count": stats.count, "sum": stats.sum, "buckets": cumulative,
+                                  "phases": dict(stats.phases), "errors": dict(stats.errors),
+                                  "requestBytes": stats.requestBytes, "responseBytes": stats.responseBytes}
+            return result
+
+    def Scrape(self) -> str:
+        """
+        Scrape 导出Prometheus文本格式的统计
+        """
+        lines = ["# TYPE chain33_client_latency_seconds histogram"]
+        dump = self.Dump()
+        for method, stats in sorted(dump.items()):
+            for bound, count in stats["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append('chain33_client_latency_seconds_bucket{method="%s",le="%s"} %d' % (method, le, count))
+            lines.append('chain33_client_latency_seconds_sum{method="%s"} %.6f' % (method, stats["sum"]))
+            lines.append('chain33_client_latency_seconds_count{method="%s"} %d' % (method, stats["count"]))
+        # counter按Prometheus的命名规范以_total结尾
+        lines.append("# TYPE chain33_client_phase_seconds_total counter")
+        for method, stats in sorted(dump.items()):
+            for phase, seconds in sorted(stats["phases"].items()):
+                lines.append('chain33_client_phase_seconds_total{method="%s",phase="%s"} %.6f' % (method, phase, seconds))
+        lines.append("# TYPE chain33_client_errors_total counter")
+        for method, stats in sorted(dump.items()):
+            for error, count in sorted(stats["errors"].items()):
+                error = error.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+                lines.append('chain33_client_errors_total{method="%s",error="%s"} %d' % (method, error, count))
+        return "\n".join(lines) + "\n"
+
+    def Reset(self):
+        with self.lock:
+            self.stats = {}
+
+
+# Instrumentation 调用钩子，client.Instrument启用后才会创建，未启用时不产生任何开销
+class Instrumentation(object):
+    def __init__(self, metrics: Metrics = None, before=None, after=None):
+        """
+        :param metrics: 统计，None表示不统计只调用钩子
+        :param before: pre-call钩子，rpc请求编码完成、发送之前以及封装方法开始执行之前以CallInfo为参数调用
+        :param after: post-call钩子，rpc请求和封装方法结束后以CallInfo为参数调用
+        """
+        self.metrics = metrics
+        self.before = before
+        self.after = after
+        # 当前线程中正在执行的封装方法已经花在rpc请求上的时间
+        self.local = threading.local()
+
+    def Before(self, info: CallInfo):
+        if self.before is not None:
+            try:
+                self.before(info)
+            except Exception:
+                pass
+
+    def After(self, info: CallInfo):
+        if info.kind == RpcCall:
+            rpc = getattr(self.local, "rpc", None)
+            if rpc is not None:
+                self.local.rpc = rpc + info.elapsed
+                if info.error is not None:
+                    self.local.error = info.error
+        if self.metrics is not None:
+            self.metrics.Observe(info)
+        if self.after is not None:
+            try:
+                self.after(info)
+            except Exception:
+                pass
+
+    def Wrap(self, name: str, fn):
+        """
+        Wrap 包装client的封装方法，统计总耗时并拆分成rpc和convert两个阶段
+        """
+        local = self.local
+
+        def wrapper(*args, **kwargs):
+            outer, outerError = getattr(local, "rpc", None), getattr(local, "error", None)
+            local.rpc, local.error = 0.0, None
+            info = CallInfo(Wrapper, name)
+            self.Before(info)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                info.error = type(e).__name__
+                raise
+            finally:
+                info.elapsed = time.perf_counter() - start
+                rpc = local.rpc
+                # 没有抛出异常时，以方法内rpc请求返回的错误作为该方法的错误
+                if info.error is None:
+                    info.error = local.error
+                local.rpc = outer + rpc if outer is not None else None
+                local.error = outerError if info.error is None else info.error
+                info.phases = {"rpc": rpc, "convert": max(0.0, info.elapsed - rpc)}
+                self.After(info)
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = fn.__doc__
+        return wrapper
@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+
+import queue
+import threading
+
+# 默认预取的页数
+DefaultPrefetch = 2
+
+_done = object()
+
+
+# _failure 后台线程中抛出的异常，转交给消费者重新抛出
+class _failure(object):
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def Prefetch(pages, depth: int = DefaultPrefetch):
+    """
+    Prefetch 在后台线程中提前迭代pages，最多缓存depth项，按原顺序逐项返回
+    :param pages: 迭代器，通常每一项是一页rpc查询结果
+    :param depth: 最多提前取多少项，0表示不使用后台线程
+    :return: 生成器
+    """
+    if depth <= 0:
+        yield from pages
+        return
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put(page):
+                    return
+            put(_done)
+        except Exception as e:
+            put(_failure(e))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _done:
+                return
+            if isinstance(item, _failure):
+                raise item.error
+            yield item
+    finally:
+        # 消费者提前退出时通知后台线程停止
+        stopped.set()
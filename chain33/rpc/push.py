@@ -0,0 +1,346 @@
+#!/usr/bin/python3
+
+import json
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from chain33.protobuf import blockchain_pb2
+from chain33.rpc import follower
+
+# 推送的数据类型，与AddPushSubscribe的type参数一致
+PushBlock = 0
+PushHeader = 1
+PushTxReceipt = 2
+
+# 默认队列长度
+DefaultQueueSize = 1024
+# 默认等待解码的请求数
+DefaultIntakeSize = 16
+
+_messages = {
+    PushBlock: blockchain_pb2.BlockSeqs,
+    PushHeader: blockchain_pb2.HeaderSeqs,
+    PushTxReceipt: blockchain_pb2.TxReceipts4Subscribe,
+}
+
+
+# PushEvent 一个推送序列号对应的数据
+class PushEvent(object):
+    def __init__(self, seq: int, pushType: int, data):
+        self.seq = seq
+        self.type = pushType
+        # json编码时为dict，proto编码时为blockchain_pb2中对应的消息(BlockSeq, HeaderSeq, TxReceipts4SubscribePerBlk)
+        self.data = data
+
+
+def decodePush(body: bytes, pushType: int, encode: str) -> list:
+    """
+    decodePush 将一次推送的请求体解析成PushEvent列表
+    :param body: 请求体
+    :param pushType: 推送的数据类型
+    :param encode: 编码方式：json或者proto
+    :return: PushEvent列表
+    """
+    if encode == "json":
+        # 默认值的字段不会出现在json中，int64字段编码为字符串
+        obj = json.loads(body)
+        if pushType == PushTxReceipt:
+            return [PushEvent(int(item.get("seqNum", 0)), pushType, item) for item in obj.get("txReceipts") or []]
+        return [PushEvent(int(item.get("num", 0)), pushType, item) for item in obj.get("seqs") or []]
+    msg = _messages[pushType]()
+    msg.ParseFromString(body)
+    if pushType == PushTxReceipt:
+        return [PushEvent(item.seqNum, pushType, item) for item in msg.txReceipts]
+    return [PushEvent(item.num, pushType, item) for item in msg.seqs]
+
+
+# PushReceiver 接收AddPushSubscribe注册的推送
+# 请求线程只把请求体放进有界的待解码队列，由一个解码线程按到达顺序解码，并把事件放进有界的事件队列供消费者读取，
+# 请求线程等待自己的请求体解码并全部入队后才返回ok，解码失败或者队列满时返回错误，节点会重推同一批数据
+# 消费者慢时只有解码线程等待事件队列，后续请求在待解码队列满时立即返回503，不会占住所有推送连接
+class PushReceiver(object):
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, pushType: int = PushBlock, encode: str = "json",
+                 queueSize: int = DefaultQueueSize, lastSeq: int = -1, timeout: float = 5.0,
+                 checkpoint: str = None, intakeSize: int = DefaultIntakeSize):
+        """
+        :param host: 监听地址
+        :param port: 监听端口，0表示随机端口
+        :param pushType: 推送的数据类型：PushBlock, PushHeader, PushTxReceipt
+        :param encode: 编码方式：json或者proto
+        :param queueSize: 事件队列的长度，队列满时解码线程会等待，超过timeout返回失败由节点重推
+        :param lastSeq: 已经消费过的最大序列号，小于等于该值的推送会被丢弃
+        :param timeout: 推送请求等待解码和入队的时间(秒)
+        :param checkpoint: 保存已消费序列号的文件路径，存在时从保存的序列号继续，覆盖lastSeq
+        :param intakeSize: 等待解码的请求体队列长度，队列满时推送请求立即返回失败
+        """
+        if encode not in ("json", "proto"):
+            raise ValueError("Error: encode is not correct.")
+        if pushType not in _messages:
+            raise ValueError("Error: pushType is not correct.")
+        self.pushType = pushType
+        self.encode = encode
+        self.timeout = timeout
+        self.events = queue.Queue(maxsize=queueSize)
+        # 元素为(请求体, Future)，Future的结果为返回给节点的http状态码
+        self.bodies = queue.Queue(maxsize=intakeSize)
+        self.lock = threading.Lock()
+        self.checkpoint = follower.Checkpoint(checkpoint) if checkpoint is not None else None
+        if self.checkpoint is not None:
+            seq, _ = self.checkpoint.Load()
+            if seq >= 0:
+                lastSeq = seq
+        # lastSeq为已入队的最大序列号，用于丢弃重推的数据，lastConsumedSeq为已被Get取走的最大序列号
+        self.lastSeq = lastSeq
+        self.lastConsumedSeq = lastSeq
+        # Resume获取的节点已推送的最新序列号
+        self.nodeSeq = None
+        self.received = 0
+        self.rejected = 0
+        self.decoded = 0
+        self.duplicates = 0
+        self.errors = 0
+        self.consumed = 0
+        self.stopped = threading.Event()
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                status = receiver.accept(body)
+                data = {200: b"ok", 400: b"invalid", 503: b"busy"}[status]
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/plain')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        # 只有一个解码线程，保证事件按序列号入队
+        self.decoder = threading.Thread(target=self.decodeLoop, daemon=True)
+        self.decoder.start()
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.url = "http://%s:%d" % (host, self.server.server_address[1])
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Close()
+
+    def accept(self, body: bytes) -> int:
+        """
+        accept 处理一次推送请求，把请求体交给解码线程并等待结果
+        :return: http状态码，200表示全部入队，400表示解码失败，503表示待解码队列满、事件队列满或者等待超时
+        """
+        with self.lock:
+            self.received += 1
+        future = Future()
+        try:
+            self.bodies.put_nowait((body, future))
+            # 超时后解码线程仍会处理这个请求体，已经入队的部分在重推时作为重复数据丢弃
+            status = future.result(timeout=self.timeout)
+        except (queue.Full, TimeoutError):
+            status = 503
+        if status == 503:
+            with self.lock:
+                self.rejected += 1
+        return status
+
+    def decodeLoop(self):
+        while True:
+            item = self.bodies.get()
+            if item is None:
+                return
+            body, future = item
+            future.set_result(self.enqueue(body))
+
+    # enqueue 在解码线程中解码请求体，并把事件按序列号放进事件队列
+    def enqueue(self, body: bytes) -> int:
+        try:
+            events = decodePush(body, self.pushType, self.encode)
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            return 400
+        for event in events:
+            # 节点重推或者续推时会收到已经入队的序列号
+            with self.lock:
+                if event.seq <= self.lastSeq:
+                    self.duplicates += 1
+                    continue
+            try:
+                self.events.put(event, timeout=self.timeout)
+            except queue.Full:
+                return 503
+            with self.lock:
+                self.lastSeq = event.seq
+                self.decoded += 1
+        return 200
+
+    def Get(self, timeout: float = None) -> PushEvent:
+        """
+        Get 按序列号顺序获取下一个推送事件
+        :param timeout: 等待时间(秒)，None表示一直等待
+        :return: PushEvent，超时返回None
+        """
+        try:
+            event = self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self.lock:
+            self.consumed += 1
+            self.lastConsumedSeq = event.seq
+        return event
+
+    def __iter__(self):
+        while not self.stopped.is_set():
+            event = self.Get(timeout=0.1)
+            if event is not None:
+                yield event
+
+    def Subscribe(self, jclient, name: str, lastSequence: int = None, lastHeight: int = 0, lastBlockHash: str = "",
+                  contract: dict = None) -> (bool, str):
+        """
+        Subscribe 通过AddPushSubscribe把本接收器注册为推送地址
+        :param jclient: jsonclient.client
+        :param name: 推送服务名
+        :param lastSequence: 推送开始序列号，None表示从已入队的最大序列号(包括checkpoint中保存的)的下一个开始
+        :param lastHeight: 推送开始高度
+        :param lastBlockHash: 推送开始哈希
+        :param contract: 订阅的合约名称，推送交易回执时生效
+        :return: 是否成功，错误信息
+        """
+        if lastSequence is None:
+            with self.lock:
+                lastSequence = self.lastSeq + 1
+        return jclient.AddPushSubscribe(name, self.url, self.encode, lastSequence, lastHeight, lastBlockHash,
+                                        self.pushType, contract or {})
+
+    def Resume(self, jclient, name: str, lastHeight: int = 0, lastBlockHash: str = "",
+               contract: dict = None) -> int:
+        """
+        Resume 重启后继续接收推送：通过GetPushSeqLastNum获取节点已推送的最新序列号，再从lastSeq + 1重新注册，
+        name和URL与之前相同时节点会重新开始推送
+        节点认为已经推送、但本进程没有收到的序列号(checkpoint或lastSeq之后到该序列号)不会再推送，
+        需要调用方通过follower等方式补齐，Metrics中的gap为缺口的大小
+        :param jclient: jsonclient.client
+        :param name: 推送服务名
+        :param lastHeight: lastSeq + 1对应的高度
+        :param lastBlockHash: lastSeq + 1对应的哈希
+        :param contract: 订阅的合约名称，推送交易回执时生效
+        :return: 节点已推送的最新序列号
+        """
+        seq, err = jclient.GetPushSeqLastNum(name)
+        if err != None:
+            raise Exception(err)
+        seq = int(seq)
+        with self.lock:
+            self.nodeSeq = seq
+        ok, err = self.Subscribe(jclient, name, None, lastHeight, lastBlockHash, contract)
+        if not ok:
+            raise Exception(err)
+        return seq
+
+    def Commit(self):
+        """
+        Commit 把已被Get取走的最大序列号写入checkpoint，处理完取走的事件后调用，重启后从该序列号之后继续
+        """
+        if self.checkpoint is None:
+            return
+        with self.lock:
+            seq = self.lastConsumedSeq
+        if seq >= 0:
+            self.checkpoint.Save(seq, None)
+
+    def Metrics(self) -> dict:
+        """
+        Metrics 接收和消费统计
+        :return: received: 收到的推送请求数, rejected: 队列满或者超时被拒绝的请求数, decoded: 入队的事件数,
+                 duplicates: 丢弃的重复事件数, errors: 解码失败的请求数, consumed: 已消费的事件数,
+                 lastSeq: 入队的最大序列号, lastConsumedSeq: 已消费的最大序列号, lag: 消费者落后的序列号数,
+                 pendingBodies: 等待解码的请求数, pendingEvents: 等待消费的事件数, nodeSeq: Resume获取的节点已推送的序列号,
+                 gap: 节点已推送但本进程没有收到的序列号数，没有调用Resume时为0
+        """
+        with self.lock:
+            gap = 0
+            if self.nodeSeq is not None:
+                gap = max(0, self.nodeSeq - self.lastSeq)
+            return {"received": self.received, "rejected": self.rejected, "decoded": self.decoded,
+                    "duplicates": self.duplicates, "errors": self.errors, "consumed": self.consumed,
+                    "lastSeq": self.lastSeq, "lastConsumedSeq": self.lastConsumedSeq,
+                    "lag": self.lastSeq - self.lastConsumedSeq, "pendingBodies": self.bodies.qsize(),
+                    "pendingEvents": self.events.qsize(),
+                    "nodeSeq": self.nodeSeq, "gap": gap}
+
+    def Close(self):
+        self.stopped.set()
+        self.server.shutdown()
+        self.server.server_close()
+        self.bodies.put(None)
+        self.decoder.join()
+        self.Commit()
+
+
+# LoopbackPusher 模拟节点向推送地址发送数据，用于测试
+class LoopbackPusher(object):
+    def __init__(self, url: str, pushType: int = PushBlock, encode: str = "json"):
+        self.url = url
+        self.pushType = pushType
+        self.encode = encode
+        self.session = requests.Session()
+
+    def Push(self, start: int, count: int, seqType: int = 1) -> bool:
+        """
+        Push 推送序列号从start开始的count个区块(或区块头，交易回执)
+        :param seqType: 1表示新增区块，2表示回滚区块
+        :return: 接收方是否返回ok
+        """
+        msg = _messages[self.pushType]()
+        for seq in range(start, start + count):
+            height = seq
+            blockHash = seq.to_bytes(32, "big")
+            parentHash = (seq - 1 if seq > 0 else 0).to_bytes(32, "big")
+            if self.pushType == PushTxReceipt:
+                item = msg.txReceipts.add()
+                item.seqNum = seq
+                item.height = height
+                item.blockHash = blockHash
+                item.parentHash = parentHash
+                item.addDelType = seqType
+                item.tx.add().execer = b"coins"
+                item.receiptData.add().ty = 2
+                continue
+            item = msg.seqs.add()
+            item.num = seq
+            item.seq.Hash = blockHash
+            item.seq.Type = seqType
+            if self.pushType == PushBlock:
+                item.detail.block.height = height
+                item.detail.block.parentHash = parentHash
+                item.detail.block.txs.add().execer = b"coins"
+                item.detail.receipts.add().ty = 2
+            else:
+                item.header.height = height
+                item.header.hash = blockHash
+                item.header.parentHash = parentHash
+        if self.encode == "json":
+            from google.protobuf import json_format
+            body = json.dumps(json_format.MessageToDict(msg, preserving_proto_field_name=True)).encode()
+        else:
+            body = msg.SerializeToString()
+        response = self.session.post(self.url, data=body)
+        return response.status_code == 200 and response.text == "ok"
+
+    def Close(self):
+        self.session.close()
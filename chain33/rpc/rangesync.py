@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 默认每页的区块数
+DefaultPageSize = 100
+# 默认并发线程数
+DefaultWorkers = 4
+# 默认每页的重试次数
+DefaultRetries = 3
+
+
+# Progress 同步进度
+class Progress(object):
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        self.total = end - start + 1
+        # 已经按顺序交付的区块数和页数
+        self.blocks = 0
+        self.pages = 0
+        self.retries = 0
+        self.begin = time.monotonic()
+        self.elapsed = 0.0
+
+    def Rate(self) -> float:
+        """
+        Rate 平均吞吐量(区块/秒)
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.blocks / self.elapsed
+
+    def __repr__(self):
+        return "%d/%d blocks, %d pages, %d retries, %.1f blocks/s" % (self.blocks, self.total, self.pages,
+                                                                       self.retries, self.Rate())
+
+
+# RangeFetcher 将[start, end]切分成多页，通过线程池并发获取，按高度严格有序地返回区块
+class RangeFetcher(object):
+    def __init__(self, jclient, pageSize: int = DefaultPageSize, workers: int = DefaultWorkers, window: int = 0,
+                 retries: int = DefaultRetries, retryDelay: float = 0.5, isDetail: bool = False, progress=None):
+        """
+        :param jclient: jsonclient.client，配置了多个节点时各页会分发到不同节点
+        :param pageSize: 每次GetBlocks获取的区块数
+        :param workers: 并发线程数
+        :param window: 最多同时在途(请求中或者等待交付)的页数，用于背压控制，0表示workers的两倍
+        :param retries: 每页失败后的重试次数
+        :param retryDelay: 首次重试前的等待时间(秒)，之后每次翻倍
+        :param isDetail: 是否获取区块详细信息
+        :param progress: 进度回调函数，每交付一页调用一次，参数为Progress
+        """
+        self.client = jclient
+        self.pageSize = pageSize
+        self.workers = workers
+        self.window = window if window > 0 else workers * 2
+        self.retries = retries
+        self.retryDelay = retryDelay
+        self.isDetail = isDetail
+        self.progress = progress
+        self.lock = threading.Lock()
+
+    def fetchPage(self, start: int, end: int, state: Progress) -> list:
+        delay = self.retryDelay
+        for attempt in range(self.retries + 1):
+            try:
+                result, err = self.client.GetBlocks(start, end, self.isDetail)
+                if err != None:
+                    raise Exception(err)
+                return result['items']
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                with self.lock:
+                    state.retries += 1
+                time.sleep(delay)
+                delay *= 2
+
+    def Fetch(self, start: int, end: int):
+        """
+        Fetch 并发获取区间内的区块
+        :param start: 开始区块高度
+        :param end: 结束区块高度(包含)
+        :return: 生成器，按高度顺序逐个返回GetBlocks结果items中的区块
+        """
+        state = Progress(start, end)
+        pages = iter(range(start, end + 1, self.pageSize))
+        inflight = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                while True:
+                    # 只有交付了前面的页才会提交新的页，消费者慢时自动限流
+                    while len(inflight) < self.window:
+                        pageStart = next(pages, None)
+                        if pageStart is None:
+                            break
+                        pageEnd = min(pageStart + self.pageSize - 1, end)
+                        inflight.append(executor.submit(self.fetchPage, pageStart, pageEnd, state))
+                    if len(inflight) == 0:
+                        return
+                    items = inflight.pop(0).result()
+                    state.blocks += len(items)
+                    state.pages += 1
+                    state.elapsed = time.monotonic() - state.begin
+                    if self.progress is not None:
+                        self.progress(state)
+                    yield from items
+            finally:
+                for future in inflight:
+                    future.cancel()
@@ -0,0 +1,226 @@
+#!/usr/bin/python3
+
+import threading
+import time
+from concurrent.futures import Future
+
+# 交易最终状态
+Confirmed = "confirmed"
+Failed = "failed"
+Expired = "expired"
+
+# 回执类型，ExecOk表示执行成功，ExecPack表示已打包但执行失败
+ExecPack = 1
+ExecOk = 2
+
+# 默认超过多少个区块仍未打包视为过期
+DefaultExpireBlocks = 100
+# 单次GetBlocks扫描的区块数
+scanPageSize = 50
+
+
+# TxStatus 交易的最终状态
+class TxStatus(object):
+    def __init__(self, hash_str: str, state: str, height: int, receipt):
+        self.hash = hash_str
+        self.state = state
+        self.height = height
+        # 回执json对象，过期时为None
+        self.receipt = receipt
+
+
+# TxTracker 批量跟踪已发送交易的打包结果
+# 每出一个新区块只扫描一次区块内的交易，轮询开销与区块数相关，与跟踪的交易数无关
+class TxTracker(object):
+    def __init__(self, jclient, expireBlocks: int = DefaultExpireBlocks, minInterval: float = 0.2,
+                 maxInterval: float = 5.0, callback=None, confirmations: int = 0):
+        """
+        :param jclient: jsonclient.client
+        :param expireBlocks: 注册后超过多少个区块仍未打包视为过期
+        :param confirmations: 打包后再经过多少个区块才确定最终状态，0表示打包后立即确定，
+                              此时交易所在的区块回滚后不会再检查，已经返回的状态不会改变
+        :param minInterval: 最小轮询间隔(秒)
+        :param maxInterval: 最大轮询间隔(秒)
+        :param callback: 默认回调函数，交易有最终状态时以TxStatus为参数调用
+        """
+        self.client = jclient
+        self.expireBlocks = expireBlocks
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.callback = callback
+        self.confirmations = confirmations
+        self.lock = threading.Lock()
+        # hash -> [Future, 回调函数, 注册时的高度]
+        self.pending = {}
+        # 新注册的交易，下一次轮询时先批量查询一次，防止注册前已经打包
+        self.fresh = []
+        # 已打包但还没有达到确认深度的交易，hash -> 打包高度
+        self.included = {}
+        self.height = None
+        self.blockInterval = None
+        self.lastBlockAt = None
+        self.stopped = threading.Event()
+        self.wakeup = threading.Event()
+        self.thread = threading.Thread(target=self.loop, daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Close()
+
+    def Track(self, txhash: str, callback=None) -> Future:
+        """
+        Track 注册需要跟踪的交易
+        :param txhash: 交易哈希
+        :param callback: 交易有最终状态时以TxStatus为参数调用
+        :return: concurrent.futures.Future，结果为TxStatus
+        """
+        future = Future()
+        with self.lock:
+            self.pending[txhash] = [future, callback, self.height]
+            self.fresh.append(txhash)
+            first = len(self.fresh) == 1
+        # 连续注册时只唤醒一次，新注册的交易合并成一个批量查询
+        if first:
+            self.wakeup.set()
+        return future
+
+    def Pending(self) -> int:
+        """
+        Pending 还未有最终状态的交易数
+        """
+        with self.lock:
+            return len(self.pending)
+
+    def resolve(self, status: TxStatus):
+        with self.lock:
+            entry = self.pending.pop(status.hash, None)
+            self.included.pop(status.hash, None)
+        if entry is None:
+            return
+        future, callback = entry[0], entry[1] or self.callback
+        future.set_result(status)
+        if callback is not None:
+            try:
+                callback(status)
+            except Exception:
+                pass
+
+    def resolveReceipt(self, txhash: str, height: int, receipt):
+        if self.confirmations > 0 and height is not None:
+            # 等到足够深之后再重新查询一次，期间发生回滚时重新等待打包
+            with self.lock:
+                if txhash in self.pending and (self.height is None or self.height - height < self.confirmations):
+                    self.included[txhash] = height
+                    return
+        state = Confirmed if receipt is not None and receipt.get("ty") == ExecOk else Failed
+        self.resolve(TxStatus(txhash, state, height, receipt))
+
+    def queryFresh(self):
+        with self.lock:
+            hashes = [h for h in self.fresh if h in self.pending]
+            self.fresh = []
+        self.query(hashes)
+
+    def query(self, hashes: list):
+        if len(hashes) == 0:
+            return
+        results = self.client.CallMany([("Chain33.QueryTransaction", {"hash": h}) for h in hashes])
+        for txhash, (result, err) in zip(hashes, results):
+            if err == None and result != None:
+                self.resolveReceipt(txhash, result.get("height"), result.get("receipt"))
+
+    def scan(self, start: int, end: int):
+        for pageStart in range(start, end + 1, scanPageSize):
+            result, err = self.client.GetBlocks(pageStart, min(pageStart + scanPageSize - 1, end), True)
+            if err != None:
+                raise Exception(err)
+            for item in result["items"]:
+                block = item["block"]
+                receipts = item.get("receipts") or []
+                for i, tx in enumerate(block.get("txs") or []):
+                    txhash = tx.get("hash")
+                    if txhash is None:
+                        # 节点没有返回交易哈希时退回到逐笔查询
+                        with self.lock:
+                            hashes = list(self.pending)
+                        self.query(hashes)
+                        return
+                    if txhash in self.pending:
+                        self.resolveReceipt(txhash, block["height"], receipts[i] if i < len(receipts) else None)
+
+    def settle(self):
+        with self.lock:
+            deep = [h for h, height in self.included.items() if self.height - height >= self.confirmations]
+            for txhash in deep:
+                del self.included[txhash]
+        # 重新查询，仍然在链上的交易确定最终状态，已经回滚的交易等待重新打包
+        self.query(deep)
+        # 回滚后可能被重新打包到已经扫描过的高度，之后每次轮询查询一次，直到再次打包或者过期
+        with self.lock:
+            self.fresh.extend(h for h in deep if h in self.pending and h not in self.included)
+
+    def expire(self):
+        with self.lock:
+            expired = [h for h, entry in self.pending.items() if h not in self.included and
+                       entry[2] is not None and self.height - entry[2] >= self.expireBlocks]
+        for txhash in expired:
+            self.resolve(TxStatus(txhash, Expired, None, None))
+
+    def poll(self):
+        self.queryFresh()
+        header, err = self.client.GetLastHeader()
+        if err != None:
+            raise Exception(err)
+        # self.height只在poll线程中修改，修改时持有锁，Track等在调用方线程中持锁读取
+        with self.lock:
+            height = self.height
+            pending = len(self.pending)
+        if height is not None and header.height > height:
+            if pending > 0:
+                self.scan(height + 1, header.height)
+            if self.lastBlockAt is not None:
+                interval = time.monotonic() - self.lastBlockAt
+                self.blockInterval = interval if self.blockInterval is None else \
+                    0.7 * self.blockInterval + 0.3 * interval
+            self.lastBlockAt = time.monotonic()
+        with self.lock:
+            # 第一次轮询、出了新区块或者回滚后都从节点的高度继续
+            self.height = header.height
+            for entry in self.pending.values():
+                if entry[2] is None:
+                    entry[2] = self.height
+        self.settle()
+        self.expire()
+
+    def nextInterval(self) -> float:
+        # 估计下一个区块的出块时间，出块前少轮询，临近出块时按最小间隔轮询
+        if self.blockInterval is None or self.lastBlockAt is None:
+            return self.minInterval
+        remain = self.lastBlockAt + self.blockInterval - time.monotonic()
+        return max(self.minInterval, min(self.maxInterval, remain))
+
+    def loop(self):
+        while not self.stopped.is_set():
+            try:
+                self.poll()
+                interval = self.nextInterval()
+            except Exception:
+                interval = self.maxInterval
+            self.wakeup.wait(interval)
+            self.wakeup.clear()
+
+    def Close(self):
+        """
+        Close 停止跟踪，未有最终状态的交易的Future会被取消
+        """
+        self.stopped.set()
+        self.wakeup.set()
+        self.thread.join()
+        with self.lock:
+            pending = list(self.pending.values())
+            self.pending.clear()
+        for entry in pending:
+            entry[0].cancel()
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 默认每个节点保持的长连接数
+DefaultPoolSize = 10
+# 默认建立连接超时时间(秒)
+DefaultConnectTimeout = 3.05
+# 默认读超时时间(秒)
+DefaultReadTimeout = 30
+
+
+# HttpTransport 基于requests.Session的长连接传输层，多个线程可以共享同一个实例
+class HttpTransport(object):
+    def __init__(self, url: str, poolSize: int = DefaultPoolSize, connectTimeout: float = DefaultConnectTimeout,
+                 readTimeout: float = DefaultReadTimeout):
+        """
+        :param url: 节点rpc地址
+        :param poolSize: 每个节点保持的最大长连接数，并发请求超过该值时会等待空闲连接
+        :param connectTimeout: 建立连接超时时间(秒)
+        :param readTimeout: 读超时时间(秒)
+        """
+        self.url = url
+        self.poolSize = poolSize
+        self.timeout = (connectTimeout, readTimeout)
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=poolSize, pool_block=True)
+        self.session = requests.Session()
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        self.session.headers.update({'content-type': 'application/json'})
+
+    def Post(self, data: bytes, stream: bool = False) -> requests.Response:
+        """
+        Post 发送请求，连接在响应读取完成后归还连接池复用
+        :param data: 请求体
+        :param stream: 是否只读取响应头，响应体由调用方通过iter_content读取，读取完成或者close后释放连接
+        :return: requests.Response
+        """
+        response = self.session.post(self.url, data=data, timeout=self.timeout, stream=stream)
+        response.raise_for_status()
+        return response
+
+    def Warmup(self, connections: int = 0) -> int:
+        """
+        Warmup 并发发送轻量的Chain33.Version请求预先建立长连接，避免首批请求承担TCP/TLS握手的开销
+        :param connections: 预建立的连接数，0表示填满连接池
+        :return: 成功建立的连接数
+        """
+        if connections <= 0 or connections > self.poolSize:
+            connections = self.poolSize
+        data = b'{"jsonrpc":"2.0","id":0,"method":"Chain33.Version","params":[null]}'
+
+        def warm(_):
+            try:
+                return self.session.post(self.url, data=data, timeout=self.timeout, stream=True)
+            except Exception:
+                return None
+
+        # stream=True时响应体读取之前连接不会归还连接池，全部请求返回之后再读取，保证每个请求使用不同的连接
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            responses = list(executor.map(warm, range(connections)))
+        warmed = 0
+        for response in responses:
+            if response is None:
+                continue
+            try:
+                # 读完响应体后连接归还连接池
+                response.content
+                warmed += response.ok
+            except Exception:
+                pass
+        return warmed
+
+    def Close(self):
+        """
+        Close 关闭所有连接
+        """
+        self.session.close()
@@ -1,8 +1,48 @@
 import json
 
 
+# Record 结果类型的基类，通过__slots__保存字段，不为每个实例创建__dict__
+# 字段名与rpc返回的json字段名一致，按字段值比较
+class Record(object):
+    __slots__ = ()
+
+    def values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.values() == other.values()
+
+    def __ne__(self, other):
+        return not self == other
+
+    # 按字段值计算哈希，可以作为dict的key或者set的元素用于去重，list字段(TxInfo.assets)按元素计算
+    # 字段仍然可以修改，放入dict或者set之后不要再修改字段，否则哈希会变化
+    def __hash__(self):
+        return hash((type(self),) + tuple(tuple(v) if isinstance(v, list) else v for v in self.values()))
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__, ", ".join("%s=%r" % (name, getattr(self, name))
+                                                         for name in self.__slots__))
+
+    def to_dict(self) -> dict:
+        """
+        to_dict 转换成与rpc返回格式一致的json对象
+        """
+        obj = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [v.to_dict() if isinstance(v, Record) else v for v in value]
+            obj[name] = value
+        return obj
+
+
 # 账户信息
-class Account(object):
+class Account(Record):
+    __slots__ = ("currency", "balance", "frozen", "addr")
+
     def __init__(self, currency: int, balance: int, frozen: int, addr: str):
         self.currency = currency
         self.balance = balance
@@ -18,21 +58,34 @@ class Account(object):
             "addr": obj.addr
         }
 
+    @classmethod
+    def from_json(cls, obj: json):
+        return cls(obj['currency'], obj['balance'], obj['frozen'], obj['addr'])
+
 
 # 自定义反序函数
 def jsonToClass(obj: json) -> Account:
-    return Account(obj['currency'], obj['balance'], obj['frozen'], obj['addr'])
+    return Account.from_json(obj)
 
 
 # 账户标签
-class LabelAcc(object):
+class LabelAcc(Record):
+    __slots__ = ("label", "acc")
+
     def __init__(self, label: str, acc: Account):
         self.label = label
         self.acc = acc
 
+    @classmethod
+    def from_json(cls, obj: json):
+        return cls(obj['label'], Account.from_json(obj['acc']))
+
 
 # 区块头信息
-class BlockHeader(object):
+class BlockHeader(Record):
+    __slots__ = ("version", "parentHash", "txHash", "stateHash", "height", "blockTime", "txCount", "hash",
+                 "difficulty")
+
     def __init__(self, version: int, parent_hash: str, tx_hash: str, state_hash: str, height: int, block_time: int,
                  tx_count: int, hash_str: str, difficulty: int):
         self.version = version
@@ -45,23 +98,41 @@ class BlockHeader(object):
         self.hash = hash_str
         self.difficulty = difficulty
 
+    @classmethod
+    def from_json(cls, obj: json):
+        return cls(obj['version'], obj['parentHash'], obj['txHash'], obj['stateHash'], obj['height'],
+                   obj['blockTime'], obj['txCount'], obj['hash'], obj['difficulty'])
+
 
 # 资产信息
-class Asset(object):
+class Asset(Record):
+    __slots__ = ("exec", "symbol", "amount")
+
     def __init__(self, exec: str, symbol: str, amount: int):
         self.exec = exec
         self.symbol = symbol
         self.amount = amount
 
+    @classmethod
+    def from_json(cls, obj: json):
+        return cls(obj['exec'], obj['symbol'], obj['amount'])
+
 
 # 交易信息
-class TxInfo(object):
+class TxInfo(Record):
+    __slots__ = ("hash", "height", "index", "assets")
+
     def __init__(self, hash_str: str, height: int, index: int, assets: list):
         self.hash = hash_str
         self.height = height
         self.index = index
         self.assets = assets
 
+    @classmethod
+    def from_json(cls, obj: json):
+        assets = [Asset(asset['exec'], asset['symbol'], asset['amount']) for asset in obj['assets'] or []]
+        return cls(obj['hash'], obj['height'], obj['index'], assets)
+
 
 # 版本信息
 class Version(object):
@@ -85,6 +156,19 @@ class Block(object):
         self.txs = txs
 
 
+# 以下是rpc返回的json对象到自定义类的转换函数
+def jsonToLabelAcc(obj: json) -> LabelAcc:
+    return LabelAcc.from_json(obj)
+
+
+def jsonToBlockHeader(obj: json) -> BlockHeader:
+    return BlockHeader.from_json(obj)
+
+
+def jsonToTxInfo(obj: json) -> TxInfo:
+    return TxInfo.from_json(obj)
+
+
 # 回执日志
 class ReceiptDataResult(object):
     def __init__(self, ty: int, ty_name: str, logs: list):
@@ -106,8 +190,8 @@ if __name__ == '__main__':
     account = Account(currency=0, balance=1, frozen=2, addr="")
     json_str = json.dumps(account, default=account.obj_json)
     print(json_str)
-    # 通过__dict__属性实现序列化
-    json_str = json.dumps(account, default=lambda account: account.__dict__)
+    # 通过to_dict实现序列化
+    json_str = json.dumps(account.to_dict())
     print(json_str)
     # 将json对象实例化成一个类对象
     acc = json.loads(json_str, object_hook=jsonToClass)
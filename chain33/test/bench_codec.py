@@ -0,0 +1,60 @@
+import os
+import time
+
+from chain33.rpc import codec
+
+
+# 模拟GetBlocks(isDetail=True)的响应，每个区块包含多笔交易和回执
+def blocksResponse(blocks: int, txs: int) -> dict:
+    items = []
+    for h in range(blocks):
+        block = {"version": 0, "parentHash": "0x" + os.urandom(32).hex(), "txHash": "0x" + os.urandom(32).hex(),
+                 "stateHash": "0x" + os.urandom(32).hex(), "height": h, "blockTime": 1600000000 + h,
+                 "difficulty": 520159231, "mainHash": "0x" + os.urandom(32).hex(), "mainHeight": h,
+                 "signature": {"ty": 1, "pubkey": "0x" + os.urandom(33).hex(), "signature": "0x" + os.urandom(71).hex()},
+                 "txs": []}
+        receipts = []
+        for i in range(txs):
+            block["txs"].append({
+                "execer": "coins", "payload": {"transfer": {"cointoken": "", "amount": "100000000", "note": "",
+                                                            "to": "1CbEVT9RnM5oZhWMj4fxUrJX94VtRotzvs"}, "ty": 1},
+                "rawPayload": "0x" + os.urandom(48).hex(), "signature": {
+                    "ty": 1, "pubkey": "0x" + os.urandom(33).hex(), "signature": "0x" + os.urandom(71).hex()},
+                "fee": 100000, "feefmt": "0.0010", "expire": 0, "nonce": 1234567890123 + i,
+                "from": "12qyocayNF7Lv6C9qW4avxs2E7U41fKSfv", "to": "1CbEVT9RnM5oZhWMj4fxUrJX94VtRotzvs",
+                "hash": "0x" + os.urandom(32).hex()})
+            receipts.append({"ty": 2, "tyName": "ExecOk", "logs": [
+                {"ty": 2, "tyName": "LogFee", "log": {"prev": {"currency": 0, "balance": "999900000", "frozen": "0",
+                                                               "addr": "12qyocayNF7Lv6C9qW4avxs2E7U41fKSfv"},
+                                                      "current": {"currency": 0, "balance": "999800000",
+                                                                  "frozen": "0",
+                                                                  "addr": "12qyocayNF7Lv6C9qW4avxs2E7U41fKSfv"}},
+                 "rawLog": "0x" + os.urandom(80).hex()}]})
+        items.append({"block": block, "receipts": receipts})
+    return {"id": 1, "result": {"items": items}, "error": None}
+
+
+def bench(c: codec.JsonCodec, obj: dict, data: bytes, rounds: int) -> (float, float):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        c.Dumps(obj)
+    encode = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        c.Loads(data)
+    decode = (time.perf_counter() - start) / rounds
+    return encode, decode
+
+
+if __name__ == '__main__':
+    obj = blocksResponse(100, 50)
+    codecs = [codec.JsonCodec()]
+    if codec.orjson is not None:
+        codecs.append(codec.OrjsonCodec())
+    data = codecs[0].Dumps(obj)
+    print("payload: %.1f MB" % (len(data) / 1e6))
+    for c in codecs:
+        # 不同的编解码结果必须一致
+        assert c.Dumps(obj) == data and c.Loads(data) == obj
+        encode, decode = bench(c, obj, data, 5)
+        print("%-8s encode %7.1f ms  decode %7.1f ms" % (c.name, encode * 1000, decode * 1000))
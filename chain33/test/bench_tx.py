@@ -0,0 +1,145 @@
+import copy
+import hashlib
+import time
+
+from chain33.crypto import account, signer
+from chain33.dapp import transaction
+from chain33.protobuf import tx_pb2
+
+payload = b"x" * 200
+
+
+# 改为TxView之前的实现：每次签名、验签和计算哈希都复制并序列化一次交易，
+# 密钥缓存等其他优化与当前实现相同，只比较序列化的次数
+def legacyHash(tx) -> bytes:
+    copytx = tx_pb2.Transaction()
+    copytx.execer = tx.execer
+    copytx.payload = tx.payload
+    copytx.expire = tx.expire
+    copytx.to = tx.to
+    copytx.fee = tx.fee
+    copytx.nonce = tx.nonce
+    copytx.groupCount = tx.groupCount
+    copytx.next = tx.next
+    return hashlib.sha256(copytx.SerializeToString()).digest()
+
+
+def legacySign(tx, acc):
+    data = transaction.CopyTx(tx).SerializePartialToString()
+    signature = acc.Sign(data)
+    tx.signature.pubkey = bytes.fromhex(acc.publicKey)
+    tx.signature.ty = transaction.SignTypes[acc.signType]
+    tx.signature.signature = signature
+    return tx
+
+
+def legacyCheckSign(tx) -> bool:
+    data = transaction.CopyTx(tx).SerializeToString()
+    return transaction.verifyData(tx.signature.ty, data, tx.signature.signature, tx.signature.pubkey)
+
+
+def legacyRealFee(tx, minFee: int) -> int:
+    return (tx.ByteSize() // 1000 + 1) * minFee
+
+
+def legacyGroup(txs: list, acc) -> list:
+    totalfee = 0
+    minfee = 0
+    header = legacyHash(txs[0])
+    for i in range(len(txs) - 1, -1, -1):
+        txs[i].groupCount = len(txs)
+        totalfee += txs[i].fee
+        txs[i].header = header
+        minfee += legacyRealFee(txs[i], transaction.MinFee)
+        txs[i].fee = 0
+        if i == 0:
+            txs[0].fee = max(totalfee, minfee)
+            header = legacyHash(txs[0])
+        else:
+            txs[i - 1].next = legacyHash(txs[i])
+    for tx in txs:
+        tx.header = header
+    for tx in txs:
+        legacySign(tx, acc)
+    assert all(legacyCheckSign(tx) for tx in txs)
+    return [legacyHash(tx) for tx in txs]
+
+
+def currentGroup(txs: list, acc) -> list:
+    group = transaction.TxGroup(txs, transaction.MinFee)
+    group.Sign(acc)
+    assert group.CheckSign()
+    return [view.Hash() for view in group.views]
+
+
+def currentSign(tx, acc):
+    view = transaction.TxView(tx)
+    view.Sign(acc)
+    return view
+
+
+legacy = (legacyHash, legacySign, legacyCheckSign, legacyGroup)
+current = (transaction.Hash, currentSign, transaction.CheckSign, currentGroup)
+
+
+def newTx():
+    return transaction.createTx(b"coins", payload, 0, "19MJmA7GcE1NfMwdGqgLJioBjVbzQnVYvR")
+
+
+# 构造、签名、计算哈希并验签，对应发送交易前的常见流程
+def buildAndSign(count: int, acc, funcs):
+    hashFn, signFn, checkFn, _ = funcs
+    for i in range(count):
+        tx = signFn(newTx(), acc)
+        hashFn(tx)
+        assert checkFn(tx)
+
+
+# 构造三笔交易的交易组，签名、验签并计算各笔交易的哈希，count为交易数
+def buildGroup(count: int, acc, funcs):
+    for i in range(count // 3):
+        funcs[3]([newTx() for _ in range(3)], acc)
+
+
+# 只做签名、验签、计算哈希和手续费所需的序列化，不做签名运算，count为交易数
+def serializeOnly(count: int, acc, funcs):
+    pubkey = bytes.fromhex(acc.publicKey)
+    for i in range(count):
+        tx = newTx()
+        if funcs is legacy:
+            data = transaction.CopyTx(tx).SerializePartialToString()
+            tx.signature.pubkey = pubkey
+            legacyHash(tx)
+            legacyRealFee(tx, transaction.MinFee)
+            data = transaction.CopyTx(tx).SerializeToString()
+        else:
+            view = transaction.TxView(tx)
+            data = view.SigningData()
+            view.SetSignature(1, pubkey, b"")
+            view.Hash()
+            transaction.GetRealFee(view, transaction.MinFee)
+            data = view.SigningData()
+
+
+def bench(fn, count: int, acc, funcs) -> float:
+    start = time.perf_counter()
+    fn(count, acc, funcs)
+    return count / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    tx = newTx()
+    assert legacyHash(tx) == transaction.Hash(tx)
+    acc = account.newAccount(signer.ED25519)
+    txs = [newTx() for _ in range(3)]
+    assert legacyGroup(copy.deepcopy(txs), acc) == currentGroup(txs, acc)
+    before = bench(serializeOnly, 20000, acc, legacy)
+    after = bench(serializeOnly, 20000, acc, current)
+    print("%-21s before %9.0f tx/s  after %9.0f tx/s  %.2fx" % ("serialize", before, after, after / before))
+    for signType, count in ((signer.SECP256K1, 900), (signer.ED25519, 1800), (signer.SM2, 60)):
+        acc = account.newAccount(signType)
+        for name, fn in (("build+sign", buildAndSign), ("group", buildGroup)):
+            before = bench(fn, count, acc, legacy)
+            after = bench(fn, count, acc, current)
+            print("%-10s %-10s before %9.0f tx/s  after %9.0f tx/s  %.2fx" % (signType, name, before, after,
+                                                                              after / before))
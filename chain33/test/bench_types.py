@@ -0,0 +1,53 @@
+import time
+import tracemalloc
+
+from chain33.rpc import types
+
+
+# 改用__slots__之前的TxInfo和Asset，作为对比
+class DictAsset(object):
+    def __init__(self, exec: str, symbol: str, amount: int):
+        self.exec = exec
+        self.symbol = symbol
+        self.amount = amount
+
+
+class DictTxInfo(object):
+    def __init__(self, hash_str: str, height: int, index: int, assets: list):
+        self.hash = hash_str
+        self.height = height
+        self.index = index
+        self.assets = assets
+
+
+def dictTxInfo(obj: dict) -> DictTxInfo:
+    assets = []
+    for asset in obj['assets'] or []:
+        assets.append(DictAsset(asset['exec'], asset['symbol'], asset['amount']))
+    return DictTxInfo(obj['hash'], obj['height'], obj['index'], assets)
+
+
+def txInfos(count: int) -> list:
+    return [{"hash": "0x%064x" % i, "height": i // 10, "index": i % 10,
+             "assets": [{"exec": "coins", "symbol": "BTY", "amount": 100000000 + i}]} for i in range(count)]
+
+
+def bench(convert, objs: list) -> (float, float):
+    start = time.perf_counter()
+    convert(objs)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = convert(objs)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return len(objs) / elapsed, size / len(objs)
+
+
+if __name__ == '__main__':
+    objs = txInfos(200000)
+    assert types.jsonToTxInfo(objs[0]).to_dict() == objs[0]
+    for name, convert in (("dict", lambda objs: [dictTxInfo(obj) for obj in objs]),
+                          ("slots", lambda objs: [types.jsonToTxInfo(obj) for obj in objs])):
+        rate, size = bench(convert, objs)
+        print("%-6s %9.0f TxInfo/s  %5.0f bytes/TxInfo" % (name, rate, size))
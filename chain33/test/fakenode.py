@@ -0,0 +1,99 @@
+import collections
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# FakeNode 本地模拟的chain33节点，仅用于测试jsonclient
+class FakeNode(object):
+    def __init__(self):
+        self.handlers = {}
+        self.requests = 0
+        self.calls = collections.Counter()
+        self.connections = set()
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                node.requests += 1
+                node.connections.add(self.client_address)
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                req = json.loads(body)
+                if isinstance(req, list):
+                    resp = [node.handle(r) for r in req]
+                else:
+                    resp = node.handle(req)
+                data = json.dumps(resp).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = "http://127.0.0.1:%d" % self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def On(self, method: str, handler):
+        """
+        On 注册方法处理函数，handler(params)返回result，抛出异常时返回error
+        """
+        self.handlers[method] = handler
+
+    def handle(self, req: dict) -> dict:
+        self.calls[req['method']] += 1
+        try:
+            handler = self.handlers[req['method']]
+            return {"id": req['id'], "result": handler(req['params'][0]), "error": None}
+        except Exception as e:
+            return {"id": req['id'], "result": None, "error": str(e)}
+
+    def Chain(self, height: int):
+        """
+        Chain 注册GetBlocks/GetHeaders等区块查询方法，模拟高度为0到height的链
+        """
+        def header(h):
+            return {"version": 0, "parentHash": "0x%064x" % (h - 1 if h > 0 else 0), "txHash": "", "stateHash": "",
+                    "height": h, "blockTime": 1600000000 + h, "txCount": 1, "hash": "0x%064x" % h,
+                    "difficulty": 0}
+
+        def block(h):
+            b = dict(header(h))
+            b["txs"] = [{"execer": "coins", "hash": "0x%062x%02x" % (h, 0), "fee": 100000, "amount": h,
+                         "payload": {"transfer": {"cointoken": "", "amount": str(h)}, "ty": 1}}]
+            return {"block": b, "receipts": [{"ty": 2, "tyName": "ExecOk", "logs": []}]}
+
+        def check(params):
+            if params["start"] > params["end"] or params["end"] > self.height:
+                raise Exception("ErrStartBigThanEnd")
+
+        def getBlocks(params):
+            check(params)
+            return {"items": [block(h) for h in range(params["start"], params["end"] + 1)]}
+
+        def getHeaders(params):
+            check(params)
+            return {"items": [header(h) for h in range(params["start"], params["end"] + 1)]}
+
+        def queryTransaction(params):
+            h = int(params["hash"][2:64], 16)
+            if not params["hash"].endswith("00") or h > self.height:
+                raise Exception("ErrTxNotExist")
+            return {"height": h, "index": 0, "receipt": {"ty": 2, "tyName": "ExecOk", "logs": []}}
+
+        self.height = height
+        self.On("Chain33.QueryTransaction", queryTransaction)
+        self.On("Chain33.GetBlocks", getBlocks)
+        self.On("Chain33.GetHeaders", getHeaders)
+        self.On("Chain33.GetLastHeader", lambda params: header(self.height))
+        self.On("Chain33.GetBlockHash", lambda params: {"hash": "0x%064x" % params["height"]})
+
+    def Close(self):
+        self.server.shutdown()
+        self.server.server_close()
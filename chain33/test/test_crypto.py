@@ -1,4 +1,6 @@
-from chain33.crypto import signer, address, account
+import sys
+
+from chain33.crypto import signer, address, account, sigcache
 from chain33.crypto.ed25519 import ed25519Signer
 from chain33.crypto.gm import sm2, sm4, sm3
 
@@ -62,3 +64,54 @@ if __name__ == '__main__':
                              "97ac0e086e363315a8f30633b6d740b763533ed0439d9c696cd147b9a24437190221cf1192e7c3de734893d112ff7696e4d35bf265736e08ac708110d0b7ae97")
     ret = ed25519Signer.verify(data, sig, "0221cf1192e7c3de734893d112ff7696e4d35bf265736e08ac708110d0b7ae97")
     assert ret == True
+
+    # 账户复用密钥对象，签名与逐次解析私钥的结果一致
+    for acc in (account.newAccount(signer.SECP256K1), account.newAccount(signer.SM2),
+                account.newAccount(signer.ED25519)):
+        sig = acc.Sign(data)
+        assert acc.SigningKey() is acc.SigningKey()
+        assert acc.Verify(data, sig)
+        if acc.signType == signer.SECP256K1:
+            assert sig == signer.sign(data, acc.privateKey)
+            assert signer.verify(data, sig, acc.publicKey)
+        elif acc.signType == signer.ED25519:
+            assert sig == ed25519Signer.sign(data, acc.privateKey)
+            assert ed25519Signer.verify(data, sig, acc.publicKey)
+        else:
+            assert sm2Util.verify(data, acc.publicKey, sig.hex(), "0")
+    # 同一公钥只解析一次
+    pub = bytes.fromhex(accountA.publicKey)
+    assert signer.verifyingKey(pub) is signer.verifyingKey(pub)
+    # 同一公钥多次验签后启用预计算，结果不变
+    sig = accountA.Sign(data)
+    for _ in range(signer.PrecomputeAfter + 2):
+        assert signer.verify(data, sig, accountA.publicKey)
+    assert len(signer.keyCache) <= signer.DefaultKeyCacheSize
+    # 多个线程同时验签，预计算的对象在锁内替换条目，淘汰和替换交错时结果不变
+    from concurrent.futures import ThreadPoolExecutor
+
+    accounts = [account.newAccount(signer.SECP256K1) for _ in range(4)]
+    signatures = [(acc.Sign(data), acc.publicKey) for acc in accounts]
+    signer.keyCache.clear()
+    with ThreadPoolExecutor(4) as pool:
+        jobs = [signatures[i % 4] for i in range(4 * (signer.PrecomputeAfter + 4))]
+        assert all(pool.map(lambda job: signer.verify(data, job[0], job[1]), jobs))
+    assert all(signer.keyCache[bytes.fromhex(pub)][1] == signer.PrecomputeAfter + 4 for _, pub in signatures)
+
+    # 验签结果缓存可以使用任何提供GetSig和PutSig的持久化存储，不依赖rpc包
+    class MemStore(object):
+        def __init__(self):
+            self.sigs = {}
+
+        def GetSig(self, key: bytes):
+            return self.sigs.get(key)
+
+        def PutSig(self, key: bytes, valid: bool):
+            self.sigs[key] = valid
+
+    store = MemStore()
+    key = sigcache.Key(data, 1, pub, sig)
+    sigcache.SigCache(disk=store).Put(key, True)
+    sigs = sigcache.SigCache(disk=store)
+    assert sigs.Get(key) is True and sigs.Stats()["diskHits"] == 1
+    assert not any(name.startswith("chain33.rpc") for name in sys.modules)
@@ -0,0 +1,561 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from chain33.rpc import balancer, cache, codec, columnar, diskcache, follower, headerstore, jsonstream, metrics, \
+    push, rangesync, tracker, types
+from chain33.rpc.asyncclient import AsyncClient
+from chain33.rpc.jsonclient import client
+from chain33.test.fakenode import FakeNode
+
+if __name__ == '__main__':
+    node = FakeNode()
+    node.On("Chain33.IsSync", lambda params: True)
+    node.On("Chain33.GetBlockHash", lambda params: {"hash": "0x%064x" % params["height"]})
+
+    # 长连接复用
+    jclient = client(node.url, poolSize=4)
+    assert jclient.Warmup() == 4 and len(node.connections) == 4
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda h: jclient.GetBlockHash(h), range(200)))
+    for h in range(200):
+        assert results[h] == ("0x%064x" % h, None)
+    assert len(node.connections) <= 4
+    jclient.Close()
+
+    # 批量请求
+    jclient = client(node.url, maxBatchSize=64)
+    node.requests = 0
+    calls = [("Chain33.GetBlockHash", {"height": h}) for h in range(500)]
+    calls.append(("Chain33.NotExist", None))
+    results = jclient.CallMany(calls)
+    assert node.requests == 8
+    for h in range(500):
+        assert results[h] == ({"hash": "0x%064x" % h}, None)
+    assert results[500][0] is None and results[500][1] is not None
+    jclient.Close()
+
+    # 内存缓存
+    node.On("Chain33.GetLastHeader", lambda params: {"version": 0, "parentHash": "", "txHash": "", "stateHash": "",
+                                                     "height": 100, "blockTime": 0, "txCount": 0, "hash": "",
+                                                     "difficulty": 0})
+    lru = cache.LRUCache(maxSize=50, finalityDepth=10)
+    jclient = client(node.url, lruCache=lru)
+    jclient.GetLastHeader()
+    node.calls.clear()
+    for _ in range(3):
+        for h in range(40):
+            assert jclient.GetBlockHash(h) == ("0x%064x" % h, None)
+    for h in range(40, 60):
+        jclient.GetBlockHash(h)
+    stats = lru.Stats()
+    assert stats["size"] == 50 and stats["hits"] == 80 and stats["misses"] == 60
+    assert node.calls["Chain33.GetBlockHash"] == 60
+    # 最终确认深度以内的区块短时间后过期，回滚时失效
+    lru = cache.LRUCache(policies={"Chain33.GetBlockHash": cache.Policy(ttl=None, unconfirmedTtl=0)})
+    jclient = client(node.url, lruCache=lru)
+    jclient.GetLastHeader()
+    node.calls.clear()
+    jclient.GetBlockHash(95), jclient.GetBlockHash(95), jclient.GetBlockHash(50), jclient.GetBlockHash(50)
+    assert node.calls["Chain33.GetBlockHash"] == 3
+    assert lru.InvalidateAbove(40) == 1 and lru.Stats()["size"] == 0
+    jclient.Close()
+
+    # 持久化缓存
+    node.On("Chain33.GetHexTxByHash", lambda params: "0a05636f696e73")
+    node.On("Chain33.Query", lambda params: {"ty": 2, "hashStorage": {"key": "", "value": "v", "hash": None}})
+    path = os.path.join(tempfile.mkdtemp(), "cache.db")
+    disk = diskcache.DiskCache(path)
+    jclient = client(node.url, diskCache=disk)
+    node.calls.clear()
+    assert jclient.GetHexTxByHash("0xabc") == ("0a05636f696e73", None)
+    record, err = jclient.QueryStorage("", "0xabc")
+    assert err is None and record.hashStorage.value == "v"
+    jclient.Close()
+    # 重启后不再请求节点
+    jclient = client(node.url, diskCache=diskcache.DiskCache(path))
+    assert jclient.GetHexTxByHash("0xABC") == ("0a05636f696e73", None)
+    record, err = jclient.QueryStorage("", "0xabc")
+    assert err is None and record.ty == 2 and record.hashStorage.value == "v"
+    assert node.calls["Chain33.GetHexTxByHash"] == 1 and node.calls["Chain33.Query"] == 1
+    jclient.Close()
+    disk = diskcache.DiskCache(path, maxEntries=10)
+    for i in range(30):
+        disk.PutTx("0x%d" % i, b"tx")
+    assert disk.Evict() == 21
+    assert disk.GetTx("0x29") == b"tx"
+
+    # 分页预取区块
+    node.Chain(1000)
+    jclient = client(node.url)
+    heights = [item["block"]["height"] for item in jclient.IterBlocks(3, 777, pageSize=50, prefetch=3)]
+    assert heights == list(range(3, 778))
+    blocks = jclient.IterBlocks(0, 1000, pageSize=10)
+    assert next(blocks)["block"]["height"] == 0
+    blocks.close()
+    try:
+        list(jclient.IterBlocks(990, 1010, pageSize=10))
+        assert False
+    except Exception as e:
+        assert str(e) == "ErrStartBigThanEnd"
+    jclient.Close()
+
+    # 并发分页同步，跨多个节点
+    nodeC = FakeNode()
+    nodeC.Chain(1000)
+    failures = {"left": 3}
+    getBlocks = nodeC.handlers["Chain33.GetBlocks"]
+
+    def flakyGetBlocks(params):
+        if failures["left"] > 0:
+            failures["left"] -= 1
+            raise Exception("ErrTimeout")
+        return getBlocks(params)
+
+
+    nodeC.On("Chain33.GetBlocks", flakyGetBlocks)
+    jclient = client([node.url, nodeC.url], probeInterval=0)
+    reports = []
+    fetcher = rangesync.RangeFetcher(jclient, pageSize=37, workers=6, retryDelay=0.01, progress=reports.append)
+    heights = [item["block"]["height"] for item in fetcher.Fetch(5, 999)]
+    assert heights == list(range(5, 1000))
+    assert reports[-1].blocks == 995 and reports[-1].retries == 3
+    assert nodeC.calls["Chain33.GetBlocks"] > 3 and node.calls["Chain33.GetBlocks"] > 0
+    jclient.Close()
+    nodeC.Close()
+
+    # 批量查询余额
+    node.On("Chain33.GetBalance", lambda params: [{"currency": 0, "balance": len(addr) + len(params["execer"]),
+                                                   "frozen": 0, "addr": addr} for addr in params["addresses"]])
+    jclient = client(node.url)
+    addrs = ["a" * (i % 7 + 1) + str(i) for i in range(1000)]
+    node.requests = 0
+    balances = jclient.QueryBalances(addrs, "coins", "", "", batchSize=128)
+    assert len(balances) == 1000 and balances[addrs[5]].balance == len(addrs[5]) + 5
+    assert node.requests == 8
+    multi = jclient.QueryBalancesMulti(addrs, [("coins", "", ""), ("ticket", "", "")], batchSize=128)
+    assert multi[("ticket", "", "")][addrs[9]].balance == len(addrs[9]) + 6
+    assert node.requests == 16
+    jclient.Close()
+
+    # 地址交易历史自动翻页
+    def getTxByAddr(params):
+        n = int(params["addr"][4:])
+        txs = [{"hash": "%s-%d" % (params["addr"], i), "height": i // 3, "index": i % 3,
+                "assets": [{"exec": "coins", "symbol": "BTY", "amount": i}]} for i in range(n)]
+        if params["height"] != -1:
+            # 游标包含在结果中，需要客户端去重
+            txs = [tx for tx in txs if (tx["height"], tx["index"]) >= (params["height"], params["index"])]
+        if len(txs) == 0:
+            raise Exception("ErrTxNotExist")
+        return {"txInfos": txs[:params["count"]]}
+
+    def getTxByHashes(params):
+        details = []
+        for h in params["hashes"]:
+            i = int(h.split("-")[1])
+            details.append({"tx": {"execer": "token" if i % 2 else "coins", "fee": 100000 + i, "hash": h},
+                            "height": i // 3, "index": i % 3, "amount": i,
+                            "assets": [{"exec": "coins", "symbol": "BTY", "amount": i}] if i % 5 else None})
+        return {"txs": details}
+
+    node.On("Chain33.GetTxByAddr", getTxByAddr)
+    node.On("Chain33.GetTxByHashes", getTxByHashes)
+    jclient = client(node.url)
+    infos = list(jclient.IterTxByAddr("addr250", pageSize=20))
+    assert [info.hash for info in infos] == ["addr250-%d" % i for i in range(250)]
+    assert infos[10].height == 3 and infos[10].index == 1 and infos[10].assets[0].amount == 10
+    # 每页一条时，游标上的重复交易不会导致停止或者原地不动
+    assert [info.hash for info in jclient.IterTxByAddr("addr7", pageSize=1)] == ["addr7-%d" % i for i in range(7)]
+    assert [info.hash for info in jclient.IterTxByAddr("addr7", pageSize=2)] == ["addr7-%d" % i for i in range(7)]
+    histories = jclient.GetTxByAddrs(["addr0", "addr7", "addr40", "addr99"], pageSize=10)
+    assert [len(histories[addr]) for addr in ["addr0", "addr7", "addr40", "addr99"]] == [0, 7, 40, 99]
+    jclient.Close()
+
+    # 批量跟踪交易
+    node.Chain(10)
+    jclient = client(node.url)
+    statuses = []
+    with tracker.TxTracker(jclient, expireBlocks=5, minInterval=0.05, callback=statuses.append) as txTracker:
+        included = txTracker.Track("0x%062x00" % 5)
+        later = [txTracker.Track("0x%062x00" % h) for h in range(11, 14)]
+        lost = txTracker.Track("0x%062x01" % 12)
+        assert included.result(timeout=5).state == tracker.Confirmed
+        time.sleep(0.2)
+        node.calls.clear()
+        node.height = 20
+        for h, future in zip(range(11, 14), later):
+            status = future.result(timeout=5)
+            assert status.state == tracker.Confirmed and status.height == h
+        assert lost.result(timeout=5).state == tracker.Expired
+        assert node.calls["Chain33.QueryTransaction"] == 0
+        assert len(statuses) == 5 and txTracker.Pending() == 0
+    # 达到确认深度之前回滚的交易重新等待打包
+    node.height = 20
+    with tracker.TxTracker(jclient, minInterval=0.05, confirmations=3) as txTracker:
+        deep = txTracker.Track("0x%062x00" % 10)
+        reorged = txTracker.Track("0x%062x00" % 20)
+        assert deep.result(timeout=5).height == 10
+        time.sleep(0.2)
+        assert not reorged.done()
+        node.height = 19
+        time.sleep(0.2)
+        node.height = 22
+        time.sleep(0.2)
+        assert not reorged.done()
+        node.height = 23
+        assert reorged.result(timeout=5).state == tracker.Confirmed
+    jclient.Close()
+
+    # 异步客户端
+    node.On("Chain33.GetBalance", lambda params: [{"currency": 0, "balance": 100, "frozen": 0, "addr": addr}
+                                                  for addr in params["addresses"]])
+
+
+    async def asyncTest():
+        async with AsyncClient(node.url, concurrency=8) as aclient:
+            hashes = await asyncio.gather(*[aclient.GetBlockHash(h) for h in range(100)])
+            for h in range(100):
+                assert hashes[h] == ("0x%064x" % h, None)
+            acc, err = await aclient.QueryBalance("addr1", "coins", "", "")
+            assert err is None and acc.addr == "addr1" and acc.balance == 100
+            results = await aclient.CallMany([("Chain33.IsSync", None)] * 250)
+            assert results == [(True, None)] * 250
+
+
+    asyncio.run(asyncTest())
+
+    # 多节点负载均衡和故障转移
+    nodeB = FakeNode()
+    synced = {"value": True}
+    nodeB.On("Chain33.IsSync", lambda params: synced["value"])
+    nodeB.On("Chain33.GetBlockHash", lambda params: {"hash": "0x%064x" % params["height"]})
+    for strategy in (balancer.RoundRobin, balancer.LeastOutstanding, balancer.LatencyWeighted):
+        jclient = client([node.url, nodeB.url], strategy=strategy, probeInterval=0.1)
+        node.calls.clear(), nodeB.calls.clear()
+        for h in range(50):
+            assert jclient.GetBlockHash(h) == ("0x%064x" % h, None)
+        assert node.calls["Chain33.GetBlockHash"] > 0 and nodeB.calls["Chain33.GetBlockHash"] > 0
+        # 不同步的节点被摘除，恢复后重新加入
+        synced["value"] = False
+        time.sleep(0.3)
+        nodeB.calls.clear()
+        for h in range(20):
+            jclient.GetBlockHash(h)
+        assert nodeB.calls["Chain33.GetBlockHash"] == 0
+        synced["value"] = True
+        time.sleep(0.3)
+        assert all(ep.healthy for ep in jclient.balancer.endpoints)
+        jclient.Close()
+    # 对冲请求
+    slow = FakeNode()
+    slow.On("Chain33.GetBlockHash", lambda params: time.sleep(0.5) or {"hash": "slow"})
+    slow.On("Chain33.SendTransaction", lambda params: time.sleep(0.5) or "0x01")
+    jclient = client([slow.url, node.url], probeInterval=0, hedging=True)
+    start = time.time()
+    for h in range(4):
+        assert jclient.GetBlockHash(h) == ("0x%064x" % h, None)
+    assert time.time() - start < 1.0
+    stats = jclient.HedgeStats()
+    assert stats["fired"] >= 2 and stats["won"] >= 2
+    # 输给对冲请求的慢请求完成后同样记录延迟
+    time.sleep(0.6)
+    assert max(jclient.hedger.samples["Chain33.GetBlockHash"]) >= 0.5
+    slow.calls.clear(), node.calls.clear()
+    jclient.Call("Chain33.SendTransaction", {"data": ""})
+    assert slow.calls["Chain33.SendTransaction"] == 1 and node.calls["Chain33.SendTransaction"] == 0
+    jclient.Close()
+    slow.Close()
+
+    # 节点宕机时读请求转到其他节点
+    jclient = client([nodeB.url, node.url], probeInterval=0)
+    nodeB.Close()
+    for h in range(10):
+        assert jclient.GetBlockHash(h) == ("0x%064x" % h, None)
+    assert not jclient.balancer.endpoints[0].healthy
+    jclient.Close()
+
+    # 推送接收，json和proto编码
+    for encode in ("json", "proto"):
+        for pushType in (push.PushBlock, push.PushHeader, push.PushTxReceipt):
+            with push.PushReceiver(pushType=pushType, encode=encode) as receiver:
+                pusher = push.LoopbackPusher(receiver.url, pushType, encode)
+                assert pusher.Push(0, 5)
+                assert pusher.Push(3, 5)
+                seqs = [receiver.Get(timeout=2).seq for _ in range(8)]
+                assert seqs == list(range(8))
+                assert receiver.Get(timeout=0.1) is None
+                pushStats = receiver.Metrics()
+                assert pushStats["duplicates"] == 2 and pushStats["lag"] == 0 and pushStats["lastSeq"] == 7
+                pusher.Close()
+    # 解码失败时返回错误，节点会重推
+    with push.PushReceiver() as receiver:
+        response = requests.post(receiver.url, data=b"{not json")
+        assert response.status_code == 400 and receiver.Metrics()["errors"] == 1
+        assert receiver.Get(timeout=0.1) is None
+    # 消费者慢时解码线程等待事件队列，待解码队列满后新的推送立即返回503
+    with push.PushReceiver(queueSize=1, intakeSize=1, timeout=0.5) as receiver:
+        pushers = [push.LoopbackPusher(receiver.url) for _ in range(4)]
+        started = time.time()
+        with ThreadPoolExecutor(4) as pool:
+            first = pool.submit(pushers[0].Push, 0, 2)
+            time.sleep(0.1)
+            results = [first] + [pool.submit(pushers[i].Push, i * 2, 2) for i in range(1, 4)]
+            results = [future.result() for future in results]
+        assert results == [False] * 4 and time.time() - started < 1.5
+        pushStats = receiver.Metrics()
+        assert pushStats["rejected"] == 4 and pushStats["decoded"] >= 1 and receiver.Get(timeout=1).seq in (0, 2, 4, 6)
+        for pusher in pushers:
+            pusher.Close()
+    # 重启后从保存的已消费序列号继续，节点记录的序列号只用于发现缺口
+    pushCheckpoint = os.path.join(tempfile.mkdtemp(), "push.json")
+    follower.Checkpoint(pushCheckpoint).Save(5, None)
+    node.On("Chain33.GetPushSeqLastNum", lambda params: {"data": 9})
+    subscribed = []
+    node.On("Chain33.AddPushSubscribe",
+            lambda params: subscribed.append(params["lastSequence"]) or {"isOk": params["URL"] != "", "msg": ""})
+    with push.PushReceiver(encode="proto", checkpoint=pushCheckpoint) as receiver:
+        jclient = client(node.url)
+        assert receiver.Subscribe(jclient, "test") == (True, "")
+        assert receiver.Resume(jclient, "test") == 9 and subscribed == [6, 6]
+        assert receiver.Metrics()["gap"] == 4 and receiver.Metrics()["lag"] == 0
+        pusher = push.LoopbackPusher(receiver.url, push.PushBlock, "proto")
+        assert pusher.Push(4, 8)
+        assert receiver.Metrics()["gap"] == 0 and receiver.Metrics()["lag"] == 6
+        assert receiver.Get(timeout=2).seq == 6
+        assert receiver.Get(timeout=2).data.detail.block.height == 7
+        pusher.Close()
+        jclient.Close()
+    assert follower.Checkpoint(pushCheckpoint).Load() == (7, None)
+
+    # 按序列号跟随链，包括回滚
+    chain, seqs, blocks = [], [], {}
+
+    def grow(count: int, branch: int = 0):
+        for _ in range(count):
+            h = len(chain)
+            chain.append("0x%032x%032x" % (branch, h))
+            blocks[chain[-1]] = {"block": {"height": h, "hash": chain[-1]}, "receipts": []}
+            seqs.append((chain[-1], follower.AddBlock))
+
+    def reorg(depth: int, branch: int):
+        for _ in range(depth):
+            seqs.append((chain.pop(), follower.DelBlock))
+        grow(depth + 1, branch)
+
+    node.On("Chain33.GetLastBlockSequence", lambda params: len(seqs) - 1)
+    node.On("Chain33.GetBlockSequences", lambda params: {"blkseqInfos": [
+        {"hash": hash, "type": ty} for hash, ty in seqs[params["start"]:params["end"] + 1]]})
+    node.On("Chain33.GetBlockByHashes", lambda params: {"items": [blocks[h] for h in params["hashes"]]})
+    grow(250)
+    jclient = client(node.url)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "follower.json")
+        events = []
+        with follower.Follower(jclient, checkpoint=path, minInterval=0.02) as f:
+            for event in f.Events():
+                events.append(event)
+                if len(events) == 250:
+                    f.Close()
+        assert [e.height for e in events] == list(range(250))
+        assert follower.Checkpoint(path).Load() == (249, chain[249])
+        # 重启后从保存的位置继续，回滚事件按高度从高到低返回
+        with follower.Follower(jclient, checkpoint=path, minInterval=0.02) as f:
+            events = f.Events()
+            reorg(2, 1)
+            got = [next(events) for _ in range(5)]
+            assert [(e.rollback, e.height) for e in got] == [(True, 249), (True, 248), (False, 248),
+                                                              (False, 249), (False, 250)]
+            assert got[-1].hash == chain[250]
+            start = time.time()
+            grow(1)
+            assert next(events).height == 251
+            assert time.time() - start < 0.5
+            events.close()
+        # 最后一个事件还没有被确认处理
+        assert follower.Checkpoint(path).Load() == (len(seqs) - 2, chain[-2])
+        # 节点的序列号与保存的位置不一致
+        seqs[-2] = ("0x00", follower.AddBlock)
+        try:
+            follower.Follower(jclient, checkpoint=path)
+            assert False
+        except Exception as e:
+            assert str(e) == "ErrCheckpointMismatch"
+    # 连续失败超过maxErrors次后异常抛给调用方
+    def missing(params):
+        raise Exception("ErrHashNotExist")
+
+    node.On("Chain33.GetBlockByHashes", missing)
+    f = follower.Follower(jclient, maxInterval=0.01, maxErrors=3)
+    try:
+        next(f.Events())
+        assert False
+    except Exception as e:
+        assert str(e) == "ErrHashNotExist"
+    stats = f.Stats()
+    assert stats["consecutiveErrors"] == 3 and str(stats["lastError"]) == "ErrHashNotExist"
+    jclient.Close()
+
+    # 本地区块头存储，增量同步和分叉回退
+    chainNode = FakeNode()
+    chainNode.Chain(1000)
+    jclient = client(chainNode.url)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "headers.dat")
+        with headerstore.HeaderStore(path) as store:
+            assert store.Sync(jclient, pageSize=300) == 1001
+            assert store.Height() == 1000 and store.Hash(500) == "0x%064x" % 500
+            assert store.HeightOf("0x%064x" % 777) == 777 and store.HeightOf("0x01") is None
+            assert store.Time(10) == 1600000010 and store.Header(10).parentHash == "0x%064x" % 9
+            assert store.AtOrBefore(1600000500) == 500 and store.AtOrBefore(1500000000) == -1
+            try:
+                store.Append(jclient.GetLastHeader()[0])
+                assert False
+            except Exception as e:
+                assert str(e) == "ErrHeightMismatch"
+        with headerstore.HeaderStore(path) as store:
+            assert store.Height() == 1000 and store.HeightOf("0x%064x" % 1000) == 1000
+            # 高度995以上切换到另一条分叉
+            forked = lambda h: "0x%064x" % (h + (10 ** 6 if h > 995 else 0))
+            chainNode.height = 1010
+
+            def forkHeader(h):
+                return {"version": 0, "parentHash": forked(h - 1), "txHash": "", "stateHash": "", "height": h,
+                        "blockTime": 1600000000 + h, "txCount": 1, "hash": forked(h), "difficulty": 0}
+
+            chainNode.On("Chain33.GetLastHeader", lambda params: forkHeader(chainNode.height))
+            chainNode.On("Chain33.GetHeaders", lambda params: {"items": [
+                forkHeader(h) for h in range(params["start"], params["end"] + 1)]})
+            chainNode.On("Chain33.GetBlockHash", lambda params: {"hash": forked(params["height"])})
+            assert store.Sync(jclient) == 15
+            assert store.Height() == 1010 and store.Hash(1000) == forked(1000)
+            assert store.HeightOf("0x%064x" % 1000) is None and store.HeightOf(forked(996)) == 996
+        with headerstore.HeaderStore(path) as store:
+            assert store.Height() == 1010 and store.Hash(996) == forked(996) and store.Hash(995) == forked(995)
+            # 高度1002以上再次分叉，节点高度与本地相同或者更低时也要回退
+            for height in (1010, 1006):
+                chainNode.height = height
+                forked = lambda h, n=height: "0x%064x" % (h + (10 ** 6 if h > 995 else 0) + (n if h > 1002 else 0))
+                assert store.Sync(jclient) == height - 1002
+                assert store.Height() == height and store.Hash(height) == forked(height)
+                assert store.Hash(1002) == "0x%064x" % (1002 + 10 ** 6) and store.HeightOf(forked(1003)) == 1003
+    jclient.Close()
+    chainNode.Close()
+
+    # json编解码，orjson与标准库结果一致
+    codecs = [codec.JsonCodec()] + ([codec.OrjsonCodec()] if codec.orjson is not None else [])
+    for obj in ({"id": 1, "result": {"amount": 2 ** 70, "note": "存证", "ok": True}, "error": None},
+                {1: [1.5, None, "a\"b"]}):
+        assert len({c.Dumps(obj) for c in codecs}) == 1
+        assert all(c.Loads(codecs[0].Dumps(obj)) == codecs[0].Loads(codecs[0].Dumps(obj)) for c in codecs)
+    for c in codecs:
+        jclient = client(node.url, jsonCodec=c)
+        assert jclient.GetBlockHash(7) == ("0x%064x" % 7, None)
+        assert [r for r, _ in jclient.CallMany([("Chain33.GetBlockHash", {"height": h}) for h in range(3)])] == \
+            [{"hash": "0x%064x" % h} for h in range(3)]
+        jclient.Close()
+
+    # 流式解析result中的数组
+    items = [{"height": h, "note": "存证\"]}[,", "values": [h, -1.5e3, None, True], "nested": {"a": [[]]}}
+             for h in range(50)] + [12345, "x"]
+    for error in (None, "ErrTest"):
+        body = json.dumps({"id": 3, "result": {"total": 52, "items": items, "tail": {}}, "error": error},
+                          ensure_ascii=False).encode()
+        for size in (1, 7, 4096):
+            decoder = jsonstream.StreamDecoder(body[i:i + size] for i in range(0, len(body), size))
+            maxBuf = 0
+            got = []
+            for item in decoder.Items(("result", "items")):
+                got.append(item)
+                maxBuf = max(maxBuf, len(decoder.buf))
+            assert got == items and decoder.fields == {"id": 3, "error": error}
+            assert maxBuf < 2 * len(json.dumps(items[0], ensure_ascii=False)) + size
+    decoder = jsonstream.StreamDecoder([b'{"result":null,"error":"ErrNotFound"}'])
+    assert list(decoder.Items(("result", "items"))) == [] and decoder.fields["error"] == "ErrNotFound"
+    jclient = client(node.url)
+    assert list(jclient.StreamBlocks(0, node.height, True)) == jclient.GetBlocks(0, node.height, True)[0]["items"]
+    try:
+        list(jclient.StreamBlocks(node.height, 0, True))
+        assert False
+    except Exception as e:
+        assert str(e) == "ErrStartBigThanEnd"
+    jclient.Close()
+
+    # 结果类型按字段比较，可以作为集合元素，to_dict与rpc返回格式一致
+    info = {"hash": "0x01", "height": 3, "index": 1, "assets": [{"exec": "coins", "symbol": "BTY", "amount": 5}]}
+    assert types.jsonToTxInfo(info) == types.jsonToTxInfo(dict(info)) and types.jsonToTxInfo(info).to_dict() == info
+    infos = [types.jsonToTxInfo(info), types.jsonToTxInfo(dict(info, index=2)), types.jsonToTxInfo(dict(info))]
+    assert len(set(infos)) == 2 and {infos[0]: 1}[infos[2]] == 1
+    assert len({types.Asset("coins", "BTY", 1), types.Asset("coins", "BTY", 1), types.Asset("coins", "BTY", 2)}) == 2
+    label = {"label": "a", "acc": {"currency": 0, "balance": 1, "frozen": 0, "addr": "1abc"}}
+    assert types.jsonToLabelAcc(label).to_dict() == label and types.jsonToLabelAcc(label).acc != types.Asset("", "", 0)
+    try:
+        types.Asset("coins", "BTY", 1).extra = 1
+        assert False
+    except AttributeError:
+        pass
+
+    # 按列导出交易
+    jclient = client(node.url)
+    table = jclient.TxColumnsByAddr("addr250", pageSize=20)
+    assert len(table) == 250 and table.hash[10] == "addr250-10" and table.height[10] == 3 and table.amount[249] == 249
+    # 执行器和手续费取自交易详情，没有资产的交易金额取自详情
+    assert table.execer[:2] == ["coins", "token"] and list(table.fee[:3]) == [100000, 100001, 100002]
+    assert table.symbol[:2] == ["", "BTY"] and table.amount[5] == 5
+    table = jclient.BlockTxColumns(0, node.height, pageSize=7)
+    assert list(table.height) == list(range(node.height + 1)) and set(table.execer) == {"coins"}
+    assert set(table.symbol) == {""}
+    tokenTx = {"execer": "token", "hash": "0x01", "fee": 1, "payload": {"transfer": {"cointoken": "TEST"}, "ty": 4}}
+    tokenTable = columnar.TxTable()
+    tokenTable.AppendBlock({"block": {"height": 99, "txs": [tokenTx]}})
+    assert tokenTable.symbol == ["TEST"] and tokenTable.execer == ["token"]
+    columns = table.Columns()
+    assert list(columns["amount"]) == list(range(node.height + 1)) and columns["hash"][3] == "0x%062x%02x" % (3, 0)
+    # 返回的是复制的列，修改不会影响表
+    columns["amount"][0] = -1
+    assert table.amount[0] == 0
+    with tempfile.TemporaryDirectory() as tmp:
+        if columnar.numpy is not None:
+            table.WriteNpz(os.path.join(tmp, "txs.npz"))
+            assert list(columnar.numpy.load(os.path.join(tmp, "txs.npz"))["fee"]) == [100000] * (node.height + 1)
+        if columnar.pyarrow is not None:
+            table.WriteParquet(os.path.join(tmp, "txs.parquet"))
+            assert columnar.pyarrow.parquet.read_table(os.path.join(tmp, "txs.parquet")).column("height").to_pylist() \
+                == list(range(node.height + 1))
+            table.WriteArrow(os.path.join(tmp, "txs.arrow"))
+            assert columnar.pyarrow.feather.read_table(os.path.join(tmp, "txs.arrow")).num_rows == node.height + 1
+    jclient.Close()
+
+    # 调用统计和钩子
+    jclient = client(node.url)
+    before, after = [], []
+    stats = jclient.Instrument(before=before.append, after=after.append)
+    assert jclient.GetBlockHash(3) == ("0x%064x" % 3, None)
+    assert jclient.GetBlocks(node.height + 1, node.height + 2, False) == (None, "ErrStartBigThanEnd")
+    jclient.CallMany([("Chain33.GetBlockHash", {"height": h}) for h in range(3)])
+    assert [(info.kind, info.method) for info in before] == [
+        (metrics.Wrapper, "GetBlockHash"), (metrics.RpcCall, "Chain33.GetBlockHash"),
+        (metrics.Wrapper, "GetBlocks"), (metrics.RpcCall, "Chain33.GetBlocks"), (metrics.RpcCall, "batch")]
+    assert [(info.kind, info.method) for info in after][:2] == [(metrics.RpcCall, "Chain33.GetBlockHash"),
+                                                                (metrics.Wrapper, "GetBlockHash")]
+    assert set(after[0].phases) == {"encode", "wait", "receive", "decode"} and after[0].responseBytes > 0
+    assert set(after[1].phases) == {"rpc", "convert"} and after[1].phases["rpc"] == after[0].elapsed
+    dump = stats.Dump()
+    assert dump["Chain33.GetBlockHash"]["count"] == 1 and dump["Chain33.GetBlockHash"]["buckets"][float("inf")] == 1
+    assert dump["GetBlocks"]["errors"] == {"ErrStartBigThanEnd": 1} and dump["batch"]["count"] == 1
+    scrape = stats.Scrape()
+    assert 'chain33_client_latency_seconds_count{method="GetBlockHash"} 1' in scrape
+    assert 'chain33_client_errors_total{method="GetBlocks",error="ErrStartBigThanEnd"} 1' in scrape
+    assert "# TYPE chain33_client_phase_seconds_total counter" in scrape
+    jclient.Uninstrument()
+    jclient.GetBlockHash(3)
+    assert stats.Dump()["GetBlockHash"]["count"] == 1 and len(after) == 5
+    jclient.Close()
+
+    node.Close()
+    print('test sucessfully!')
@@ -1,14 +1,16 @@
 import copy
-import time
 
 from chain33.crypto import account, signer
 from chain33.dapp import coins, storage, transaction
+from chain33.rpc import tracker
 from chain33.rpc.jsonclient import client
 
 if __name__ == '__main__':
     url = "http://localhost:8801"
     # 实例化一个jsonclient
     client = client(url)
+    # 跟踪交易打包结果
+    txTracker = tracker.TxTracker(client)
     print(client.Call("Chain33.GetPeerInfo", None))
     # 本地构造转账交易，并发送
     tx = coins.transfer("", 100000000, "1FNdYStvfKizgCy7DbJ2vAmt9U8Neys3No", "test")
@@ -55,25 +57,25 @@ if __name__ == '__main__':
         raise ValueError(
             "Error:" + err
         )
-    time.sleep(5)
+    txTracker.Track(txhash).result(timeout=60)
     result, err = client.QueryTransaction(txhash)
     print(result)
 
     # 往合约地址打币
     tx = coins.transferToExec("", 200000000, "ticket", "test transferToExec")
     tx.Sign(acc)
-    client.SendTransaction(tx.Tx())
+    txhash, err = client.SendTransaction(tx.Tx())
     # 等待打包
-    time.sleep(3)
+    txTracker.Track(txhash).result(timeout=60)
     account1, err = client.QueryBalance(acc.address, "ticket", "", "")
     print(account1.balance)
 
     # 回提coins代币
     tx = coins.withdraw("", 200000000, "ticket", "test withdraw")
     tx.Sign(acc)
-    client.SendTransaction(tx.Tx())
+    txhash, err = client.SendTransaction(tx.Tx())
     # 等待打包
-    time.sleep(3)
+    txTracker.Track(txhash).result(timeout=60)
     account1, err = client.QueryBalance(acc.address, "ticket", "", "")
     print(account1.balance)
 
@@ -82,13 +84,14 @@ if __name__ == '__main__':
     tx.Sign(acc)
     txhash, err = client.SendTransaction(tx.Tx())
     print(txhash)
-    time.sleep(4)
+    txTracker.Track(txhash).result(timeout=60)
     result, err = client.QueryStorage("", txhash)
     print('result:', result)
     # 追加存证
     tx = storage.contentStorage("", txhash, "", "value2", 1)
     tx.Sign(acc)
-    client.SendTransaction(tx.Tx())
-    time.sleep(4)
+    appendHash, err = client.SendTransaction(tx.Tx())
+    txTracker.Track(appendHash).result(timeout=60)
     result, err = client.QueryStorage("", txhash)
     print('result:', result)
+    txTracker.Close()
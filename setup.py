@@ -9,6 +9,12 @@ requires = [
     "ed25519 == 1.5",
 ]
 
+extras = {
+    "async": ["aiohttp"],
+    "fast": ["orjson"],
+    "columnar": ["numpy", "pyarrow"],
+}
+
 setup(
     name='chain33',
     version='0.1',
@@ -19,5 +25,6 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=requires,
+    extras_require=extras,
     keywords='blockchain,chain33,sdk'
 )